@@ -12,6 +12,20 @@ from tests.case_5_ import case_5_
 from tests.case_6_ import case_6_
 from tests.case_7_ import case_7_
 from tests.case_8_ import case_8_
+from tests.case_9_ import case_9_
+from tests.case_10_ import case_10_
+from tests.case_11_ import case_11_
+from tests.case_12_ import case_12_
+from tests.case_13_ import case_13_
+from tests.case_14_ import case_14_
+from tests.case_15_ import case_15_
+from tests.case_16_ import case_16_
+from tests.case_17_ import case_17_
+from tests.case_18_ import case_18_
+from tests.case_19_ import case_19_
+from tests.case_20_ import case_20_
+from tests.case_21_ import case_21_
+from tests.case_22_ import case_22_
 
 
 def example(IDnumber=0):
@@ -53,8 +67,50 @@ def example(IDnumber=0):
     elif (IDnumber == +8):
         case_8_(src_path, dst_path)
 
+    elif (IDnumber == +9):
+        case_9_(src_path, dst_path)
+
+    elif (IDnumber == 10):
+        case_10_(src_path, dst_path)
+
+    elif (IDnumber == 11):
+        case_11_(src_path, dst_path)
+
+    elif (IDnumber == 12):
+        case_12_(src_path, dst_path)
+
+    elif (IDnumber == 13):
+        case_13_(src_path, dst_path)
+
+    elif (IDnumber == 14):
+        case_14_(src_path, dst_path)
+
+    elif (IDnumber == 15):
+        case_15_(src_path, dst_path)
+
+    elif (IDnumber == 16):
+        case_16_(src_path, dst_path)
+
+    elif (IDnumber == 17):
+        case_17_(src_path, dst_path)
+
+    elif (IDnumber == 18):
+        case_18_(src_path, dst_path)
+
+    elif (IDnumber == 19):
+        case_19_(src_path, dst_path)
+
+    elif (IDnumber == 20):
+        case_20_(src_path, dst_path)
+
+    elif (IDnumber == 21):
+        case_21_(src_path, dst_path)
+
+    elif (IDnumber == 22):
+        case_22_(src_path, dst_path)
+
     elif (IDnumber == -1):
-        for i in range(9): example(i)
+        for i in range(23): example(i)
 
     return
 
@@ -64,7 +120,7 @@ if __name__ == "__main__":
         description=__doc__, formatter_class=argparse.RawTextHelpFormatter)
 
     parser.add_argument("--IDnumber", dest="IDnumber", type=int,
-                        required=True, help="Run example with ID = (0-8).")
+                        required=True, help="Run example with ID = (0-22).")
 
     args = parser.parse_args()
 
@@ -59,10 +59,13 @@ from jigsawpy.jig_t import jigsaw_jig_t
 from jigsawpy.def_t import jigsaw_def_t
 from jigsawpy.prj_t import jigsaw_prj_t
 
-from jigsawpy import jigsaw, libsaw
+from jigsawpy import jigsaw, libsaw, aio, batch, cache, \
+    telemetry, checkpoint
 
-from jigsawpy.loadmsh import loadmsh
-from jigsawpy.savemsh import savemsh
+from jigsawpy.loadmsh import loadmsh, msh_info, iter_section, \
+    loadmsh_many
+from jigsawpy.savemsh import savemsh, savemsh_async, msh_writer, \
+    updatemsh
 from jigsawpy.loadjig import loadjig
 from jigsawpy.savejig import savejig
 
@@ -90,6 +93,12 @@ from jigsawpy.tools.meshutils import attach, jumble
 from jigsawpy.parse.saveoff import saveoff
 from jigsawpy.parse.savewav import savewav
 from jigsawpy.parse.savevtk import savevtk
+from jigsawpy.parse.savepvd import pvd_writer
+
+from jigsawpy.parse.loadoff import loadoff
+from jigsawpy.parse.loadwav import loadwav
+from jigsawpy.parse.loadply import loadply
+from jigsawpy.parse.loadstl import loadstl
 
 
 class cmd:
@@ -100,22 +109,26 @@ class cmd:
         return jigsaw.jigsaw(opts, mesh)
 
     @staticmethod
-    def tetris(opts, nlev, mesh=None):
+    def tetris(opts, nlev, mesh=None, series=None,
+               resume=None):
 
         return jigsaw.tetris(opts, nlev,
-                             mesh)
+                             mesh, series,
+                             resume=resume)
 
     @staticmethod
-    def icosahedron(opts, nlev, mesh=None):
+    def icosahedron(opts, nlev, mesh=None, series=None,
+                    resume=None):
 
         return jigsaw.icosahedron(
-            opts, nlev, mesh)
+            opts, nlev, mesh, series, resume=resume)
 
     @staticmethod
-    def cubedsphere(opts, nlev, mesh=None):
+    def cubedsphere(opts, nlev, mesh=None, series=None,
+                    resume=None):
 
         return jigsaw.cubedsphere(
-            opts, nlev, mesh)
+            opts, nlev, mesh, series, resume=resume)
 
     @staticmethod
     def tripod(opts, tria=None):
@@ -132,17 +145,46 @@ class lib:
 #--------------------------------- expose api-lib. interface
     @staticmethod
     def jigsaw(opts, geom, mesh, init=None,
-               hfun=None):
+               hfun=None, copy=True):
 
         return libsaw.jigsaw(opts, geom,
                              mesh,
-                             init, hfun)
+                             init, hfun, copy)
+
+    @staticmethod
+    def tetris(opts, nlev, geom, mesh=None, init=None,
+               hfun=None, series=None, resume=None):
+
+        return jigsaw.tetris(opts, nlev, mesh, series,
+                             geom, init, hfun,
+                             resume=resume)
+
+    @staticmethod
+    def refine(opts, nlev, geom, mesh=None, init=None,
+               hfun=None, series=None, resume=None):
+
+        return jigsaw.refine(opts, nlev, mesh, series,
+                             geom, init, hfun, resume)
+
+    @staticmethod
+    def icosahedron(opts, nlev, geom, mesh=None,
+                    hfun=None, series=None, resume=None):
+
+        return jigsaw.icosahedron(
+            opts, nlev, mesh, series, geom, hfun, resume)
+
+    @staticmethod
+    def cubedsphere(opts, nlev, geom, mesh=None,
+                    hfun=None, series=None, resume=None):
+
+        return jigsaw.cubedsphere(
+            opts, nlev, mesh, series, geom, hfun, resume)
 
     @staticmethod
-    def tripod(opts, init, tria, geom=None):
+    def tripod(opts, init, tria, geom=None, copy=True):
 
         return libsaw.tripod(opts, init,
-                             tria, geom)
+                             tria, geom, copy)
 
     @staticmethod
     def marche(opts, ffun):
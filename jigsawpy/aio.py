@@ -0,0 +1,226 @@
+
+import asyncio
+import subprocess
+
+from pathlib import Path
+
+from jigsawpy.jig_t import jigsaw_jig_t
+from jigsawpy.msh_t import jigsaw_msh_t
+
+from jigsawpy.loadmsh import loadmsh
+from jigsawpy.savejig import savejig
+from jigsawpy import resolve
+
+
+async def readlines(fptr, text, output):
+    """
+    READLINES: read lines from the stream FPTR until EOF,
+    appending them to TEXT, and passing each to OUTPUT, if
+    given.
+
+    """
+    while (True):
+        line = await fptr.readline()
+
+        if (len(line) == +0): break
+
+        line = line.decode("utf-8", "replace")
+        text.append(line)
+
+        if (output is not None): output(line)
+
+    return
+
+
+async def runexe(args, timeout=None, output=None):
+    """
+    RUNEXE: run the cmd. ARGS as a subprocess, capturing its
+    (merged) stdout and stderr.
+
+    TEXT = await RUNEXE(ARGS, TIMEOUT=None, OUTPUT=None)
+
+    Raises SUBPROCESS.CALLEDPROCESSERROR on a non-zero exit,
+    and SUBPROCESS.TIMEOUTEXPIRED after TIMEOUT seconds. The
+    process is killed on timeout or cancellation.
+
+    """
+    proc = await asyncio.create_subprocess_exec(
+        *args,
+        stdout=asyncio.subprocess.PIPE,
+        stderr=asyncio.subprocess.STDOUT)
+
+    text = []
+    try:
+        await asyncio.wait_for(asyncio.gather(
+            readlines(proc.stdout, text, output),
+            proc.wait()), timeout)
+
+    except asyncio.TimeoutError:
+    #------------------------ kill job, then report as per CLI
+        await stopexe(proc)
+
+        raise subprocess.TimeoutExpired(
+            args, timeout, output="".join(text))
+
+    except BaseException:
+    #------------------------ i.e. CancelledError: kill job too
+        await stopexe(proc)
+
+        raise
+
+    text = "".join(text)
+
+    if (proc.returncode != +0):
+        raise subprocess.CalledProcessError(
+            proc.returncode, args, output=text)
+
+    return text
+
+
+async def stopexe(proc):
+    """
+    STOPEXE: kill the subprocess PROC, if still running, and
+    wait for it to exit.
+
+    """
+    if (proc.returncode is None):
+        try:
+            proc.kill()
+
+        except ProcessLookupError:
+            pass
+
+        await proc.wait()
+
+    return
+
+
+async def loadout(name, mesh):
+    """
+    LOADOUT: load MESH from file NAME in a worker thread, so
+    as not to block the event loop.
+
+    """
+    if (mesh is None): return
+
+    await asyncio.get_event_loop().run_in_executor(
+        None, loadmsh, name, mesh)
+
+    return
+
+
+def findexe(name):
+    """
+    FINDEXE: return the path to executable NAME, or raise
+    ValueError if not found, see RESOLVE.
+
+    """
+    path = resolve.findexe(name)
+
+    if (path == Path()):
+        raise ValueError(
+            name.upper() + " executable not found")
+
+    return path
+
+
+async def jigsaw(opts, mesh=None, timeout=None, output=None):
+    """
+    JIGSAW async. cmd-line interface to JIGSAW.
+
+    TEXT = await JIGSAW(OPTS, MESH=None, TIMEOUT=None,
+                        OUTPUT=None)
+
+    Call the JIGSAW mesh generator using the config. options
+    specified in the OPTS structure, as per JIGSAW.JIGSAW,
+    without blocking the event loop.
+
+    The output of JIGSAW is captured and returned as TEXT.
+    OUTPUT is an optional callable, passed each line of TEXT
+    as it is written. TIMEOUT is an optional limit in secs.,
+    raising SUBPROCESS.TIMEOUTEXPIRED. JIGSAW is killed on
+    timeout, or if the task is cancelled.
+
+    Concurrent jobs must use distinct JCFG_FILE, MESH_FILE,
+    etc in OPTS.
+
+    """
+
+    if (not isinstance(opts, jigsaw_jig_t)):
+        raise TypeError("Incorrect type: OPTS.")
+
+    if (mesh is not None and not
+            isinstance(mesh, jigsaw_msh_t)):
+        raise TypeError("Incorrect type: MESH.")
+
+    savejig(opts.jcfg_file, opts)
+
+    text = await runexe([
+        str(findexe("jigsaw")), opts.jcfg_file],
+        timeout, output)
+
+    await loadout(opts.mesh_file, mesh)
+
+    return text
+
+
+async def tripod(opts, tria=None, timeout=None, output=None):
+    """
+    TRIPOD async. cmd-line interface to TRIPOD.
+
+    TEXT = await TRIPOD(OPTS, TRIA=None, TIMEOUT=None,
+                        OUTPUT=None)
+
+    Call the TRIPOD tessellation util. as per JIGSAW.TRIPOD,
+    without blocking the event loop. See AIO.JIGSAW for the
+    TIMEOUT and OUTPUT options.
+
+    """
+
+    if (not isinstance(opts, jigsaw_jig_t)):
+        raise TypeError("Incorrect type: OPTS.")
+
+    if (tria is not None and not
+            isinstance(tria, jigsaw_msh_t)):
+        raise TypeError("Incorrect type: TRIA.")
+
+    savejig(opts.jcfg_file, opts)
+
+    text = await runexe([
+        str(findexe("tripod")), opts.jcfg_file],
+        timeout, output)
+
+    await loadout(opts.mesh_file, tria)
+
+    return text
+
+
+async def marche(opts, ffun=None, timeout=None, output=None):
+    """
+    MARCHE async. cmd-line interface to MARCHE.
+
+    TEXT = await MARCHE(OPTS, FFUN=None, TIMEOUT=None,
+                        OUTPUT=None)
+
+    Call the "fast-marching" solver MARCHE as per JIGSAW.-
+    MARCHE, without blocking the event loop. See AIO.JIGSAW
+    for the TIMEOUT and OUTPUT options.
+
+    """
+
+    if (not isinstance(opts, jigsaw_jig_t)):
+        raise TypeError("Incorrect type: OPTS.")
+
+    if (ffun is not None and not
+            isinstance(ffun, jigsaw_msh_t)):
+        raise TypeError("Incorrect type: FFUN.")
+
+    savejig(opts.jcfg_file, opts)
+
+    text = await runexe([
+        str(findexe("marche")), opts.jcfg_file],
+        timeout, output)
+
+    await loadout(opts.hfun_file, ffun)
+
+    return text
@@ -0,0 +1,229 @@
+
+import os
+import copy
+import time
+import shutil
+import tempfile
+
+from pathlib import Path
+from concurrent.futures import ProcessPoolExecutor, \
+    as_completed
+
+from jigsawpy.jig_t import jigsaw_jig_t
+from jigsawpy.msh_t import jigsaw_msh_t
+
+from jigsawpy.loadmsh import loadmsh
+from jigsawpy.savejig import savejig
+from jigsawpy import resolve, telemetry
+
+
+class job_t(object):
+#------------------------------------------ batch job results
+    def __init__(self, index, opts, path):
+        self.index = index              # pos. in JOBS list
+        self.opts = opts                # OPTS, as run here
+        self.path = path                # scratch directory
+
+        self.mesh = None                # MSH_t on success
+        self.text = ""                  # JIGSAW's output
+        self.info = None                # RUN_t telemetry
+        self.time = 0.                  # wall-clock (secs)
+        self.error = None               # exception on fail
+
+
+def runjob(opts, load):
+    """
+    RUNJOB: run JIGSAW on OPTS in a worker process, loading
+    the output mesh if LOAD.
+
+    MESH, INFO, TIME = RUNJOB(OPTS, LOAD)
+
+    """
+    tbeg = time.perf_counter()
+
+    jexename = resolve.findexe("jigsaw")
+
+    if (jexename == Path()):
+        raise ValueError("JIGSAW executable not found")
+
+    savejig(opts.jcfg_file, opts)
+
+    info = telemetry.runexe([
+        str(jexename), opts.jcfg_file],
+        "jigsaw", echo=False)
+
+    mesh = None
+    if (load):
+        mesh = jigsaw_msh_t()
+        loadmsh(opts.mesh_file, mesh)
+
+        telemetry.countmsh(info, mesh)
+
+    return mesh, info, time.perf_counter() - tbeg
+
+
+def runpool(jobs, root, max_workers, threads_per_job,
+            keep, load):
+    """
+    RUNPOOL: submit JOBS to a process pool, each in its own
+    scratch dir. within ROOT, yielding JOB_t's as each job
+    is done, see RUN.
+
+    """
+    with ProcessPoolExecutor(
+            min(max_workers, len(jobs))) as pool:
+
+        work = {}
+        try:
+            for inum, opts in enumerate(jobs):
+    #------------------------------ set up each job's scratch
+                path = os.path.join(root, "job-%05u" % inum)
+                os.makedirs(path)
+
+                opts = copy.copy(opts)
+                opts.jcfg_file = os.path.join(path, "opts.jig")
+                opts.mesh_file = os.path.join(path, "mesh.msh")
+                opts.numthread = threads_per_job
+
+                work[pool.submit(runjob, opts, load)] = \
+                    job_t(inum, opts, path)
+
+            for item in as_completed(list(work)):
+    #------------------------------ yield as each job is done
+                job = work.pop(item)
+                try:
+                    job.mesh, job.info, job.time = \
+                        item.result()
+
+                    job.text = job.info.text
+
+                except Exception as err:
+                    job.error = err
+                    job.text = getattr(err, "output", None)
+
+                    if (isinstance(job.text, bytes)):
+                        job.text = job.text.decode(
+                            "utf-8", "replace")
+
+                    if (not isinstance(job.text, str)):
+                        job.text = ""
+
+                if (not keep):
+                    shutil.rmtree(job.path, ignore_errors=True)
+                    job.path = None
+
+                yield job
+
+        finally:
+    #------------------------------ drop any pending jobs too
+            for item in work:
+                item.cancel()
+
+    return
+
+
+def runjobs(jobs, max_workers, threads_per_job, scratch,
+            keep, load):
+    """
+    RUNJOBS: make the scratch root within SCRATCH, yielding
+    JOB_t's from RUNPOOL, and remove the root once done, see
+    RUN.
+
+    """
+    root = tempfile.mkdtemp(prefix="jigsaw-", dir=scratch)
+
+    try:
+        yield from runpool(
+            jobs, root, max_workers, threads_per_job,
+            keep, load)
+
+    finally:
+    #------------------------------ i.e. if caller stops early
+        if (not keep):
+            shutil.rmtree(root, ignore_errors=True)
+
+    return
+
+
+def run(jobs, max_workers=None, threads_per_job=None,
+        scratch=None, keep=False, load=True):
+    """
+    RUN: call JIGSAW for a batch of jobs, concurrently.
+
+    for JOB in RUN(JOBS, MAX_WORKERS=None,
+                   THREADS_PER_JOB=None,
+                   SCRATCH=None, KEEP=False, LOAD=True):
+        ...
+
+    JOBS is a list of JIG_t objects, i.e. a parameter sweep
+    over HFUN_HMAX, MESH_RAD2, OPTM_ITER, etc, that read the
+    same GEOM_FILE, HFUN_FILE, etc.
+
+    Each job is run in its own scratch dir., with its own
+    JCFG_FILE and MESH_FILE, via a pool of MAX_WORKERS
+    processes. The machine's cores are split across jobs,
+    with NUMTHREAD = THREADS_PER_JOB for each -- any
+    NUMTHREAD set in JOBS is always overwritten. By default:
+
+    THREADS_PER_JOB = OS.CPU_COUNT() // MAX_WORKERS (min. 1)
+        if MAX_WORKERS is given, else 1.
+    MAX_WORKERS = OS.CPU_COUNT() // THREADS_PER_JOB (min. 1)
+        if not given.
+
+    Results are yielded as jobs complete, as JOB_t objects:
+
+    JOB.INDEX - the position of the job in JOBS.
+    JOB.OPTS  - a copy of JOBS[INDEX], as run.
+    JOB.MESH  - the output MSH_t, if LOAD, else None.
+    JOB.TEXT  - the (captured) output of JIGSAW.
+    JOB.INFO  - a RUN_t of telemetry parsed from TEXT, see
+        TELEMETRY.RUNEXE.
+    JOB.TIME  - the wall-clock time of the job in secs.
+    JOB.ERROR - the exception raised, if the job failed, or
+        None.
+    JOB.PATH  - the scratch dir., if KEEP, else None.
+
+    Scratch dir.'s are made within SCRATCH (default: the
+    system's temp. dir.), and are removed once the job is
+    done, unless KEEP.
+
+    Arguments are checked on the call to RUN, before any
+    job is started.
+
+    """
+
+    jobs = list(jobs)
+
+    for opts in jobs:
+        if (not isinstance(opts, jigsaw_jig_t)):
+            raise TypeError("Incorrect type: JOBS.")
+
+    if (max_workers is not None and
+            not isinstance(max_workers, int)):
+        raise TypeError("Incorrect type: MAX_WORKERS.")
+
+    if (threads_per_job is not None and
+            not isinstance(threads_per_job, int)):
+        raise TypeError("Incorrect type: THREADS_PER_JOB.")
+
+    if (max_workers is not None and max_workers < +1):
+        raise ValueError(
+            "Invalid MAX_WORKERS: " + str(max_workers))
+
+    if (threads_per_job is not None and threads_per_job < +1):
+        raise ValueError(
+            "Invalid THREADS_PER_JOB: " + str(threads_per_job))
+
+    ncpu = os.cpu_count() or +1
+
+    if (threads_per_job is None):
+        threads_per_job = max(
+            +1, ncpu // max_workers) if max_workers else +1
+
+    if (max_workers is None):
+        max_workers = max(+1, ncpu // threads_per_job)
+
+    if (len(jobs) == +0): return iter([])
+
+    return runjobs(jobs, max_workers, threads_per_job,
+                   scratch, keep, load)
@@ -0,0 +1,406 @@
+
+import os
+import shutil
+import hashlib
+import tempfile
+import numpy as np
+
+from jigsawpy.msh_t import jigsaw_msh_t
+
+from jigsawpy.loadmsh import loadmsh
+from jigsawpy.savemsh import savemsh
+
+from jigsawpy import msh_b, resolve
+
+#------------------------ opts. that do not change the output
+SKIPS = ["verbosity"]
+
+#------------------------ cache settings, NONE when disabled
+STATE = {"path": None, "size": +0}
+
+STATS = {
+    "hits": +0, "misses": +0,
+    "stores": +0, "evictions": +0
+}
+
+
+def enable(path=None, max_size=2 ** 32):
+    """
+    ENABLE: turn on the result cache for JIGSAW calls.
+
+    ENABLE(PATH=None, MAX_SIZE=2**32)
+
+    Output meshes from JIGSAW.JIGSAW and LIBSAW.JIGSAW are
+    stored in the dir. PATH (default: $XDG_CACHE_HOME/
+    jigsawpy, or ~/.cache/jigsawpy), keyed on a hash of the
+    options and input data, see CMDKEY and LIBKEY. Repeated
+    calls are then served from the cache -- a file copy for
+    JIGSAW.JIGSAW, and a memory-map for LIBSAW.JIGSAW.
+
+    The least recently used entries are evicted once the
+    cache exceeds MAX_SIZE bytes.
+
+    """
+    if (path is None):
+        path = os.path.join(os.environ.get(
+            "XDG_CACHE_HOME", os.path.join(
+                os.path.expanduser("~"), ".cache")),
+            "jigsawpy")
+
+    if (not isinstance(path, str)):
+        raise TypeError("Incorrect type: PATH.")
+
+    if (not isinstance(max_size, int)):
+        raise TypeError("Incorrect type: MAX_SIZE.")
+
+    if (max_size < +0):
+        raise ValueError(
+            "Invalid MAX_SIZE: " + str(max_size))
+
+    os.makedirs(path, exist_ok=True)
+
+    STATE["path"] = path
+    STATE["size"] = max_size
+
+    return
+
+
+def disable():
+    """
+    DISABLE: turn off the result cache. Files are kept.
+
+    """
+    STATE["path"] = None
+
+    return
+
+
+def enabled():
+    """
+    ENABLED: return TRUE if the result cache is on.
+
+    """
+    return STATE["path"] is not None
+
+
+def entries():
+    """
+    ENTRIES: return a list of (TIME, SIZE, PATH) for each
+    file in the cache. Temp. ".*.msh" files are skipped.
+
+    """
+    if (not enabled()): return []
+
+    item = []
+    for fptr in os.scandir(STATE["path"]):
+        if (fptr.is_file() and
+                fptr.name.endswith(".msh") and
+                not fptr.name.startswith(".")):  # temp.
+            stat = fptr.stat()
+
+            item.append((stat.st_mtime,
+                         stat.st_size, fptr.path))
+
+    return item
+
+
+def stats():
+    """
+    STATS: return the cache hit / miss statistics.
+
+    INFO = STATS()
+
+    INFO is a dict. with the HITS, MISSES, STORES and
+    EVICTIONS counts for this process, and the no. of
+    ENTRIES and total SIZE (bytes) of the cache on disk.
+
+    """
+    info = dict(STATS)
+
+    item = entries()
+    info["entries"] = len(item)
+    info["size"] = sum(size for _, size, _ in item)
+
+    return info
+
+
+def clear():
+    """
+    CLEAR: remove all entries from the cache, and reset its
+    statistics.
+
+    """
+    for _, _, path in entries():
+        try:
+            os.remove(path)
+
+        except OSError:
+            pass
+
+    for stag in STATS: STATS[stag] = +0
+
+    return
+
+
+def hashjig(hash, opts):
+    """
+    HASHJIG: add the options in OPTS to HASH, skipping file
+    names and any options in SKIPS.
+
+    """
+    for name in sorted(vars(opts)):
+        if (name.endswith("_file") or name in SKIPS):
+            continue
+
+        data = getattr(opts, name)
+        data = getattr(data, "tolist", lambda: data)()
+
+        hash.update(
+            (name + "=" + repr(data) + ";").encode())
+
+    return
+
+
+def hashmsh(hash, mesh):
+    """
+    HASHMSH: add the contents of MESH to HASH.
+
+    """
+    if (mesh is None):
+        hash.update(b"None;"); return
+
+    hash.update((
+        str(mesh.mshID).lower() + ";" +
+        str(mesh.ndims) + ";").encode())
+
+    for field in msh_b.FIELD:
+        data = getattr(mesh, field, None)
+
+        if (data is None or data.size == +0): continue
+
+        data = np.ascontiguousarray(data)
+
+        hash.update((
+            field + ";" + data.dtype.str + ";" +
+            str(data.shape) + ";").encode())
+
+        hash.update(
+            data.reshape(-1).view(np.uint8).data)
+
+    return
+
+
+def hashfile(hash, name):
+    """
+    HASHFILE: add the contents of file NAME to HASH.
+
+    """
+    if (name is None or not os.path.isfile(name)):
+        hash.update(b"None;"); return
+
+    with open(name, "rb") as fptr:
+        while (True):
+            data = fptr.read(2 ** 22)
+
+            if (len(data) == +0): break
+
+            hash.update(data)
+
+    hash.update(b";")
+
+    return
+
+
+def cmdkey(opts):
+    """
+    CMDKEY: return the cache key for JIGSAW.JIGSAW(OPTS), or
+    None if the cache is disabled.
+
+    Keys are a SHA256 hash of OPTS (excl. file names) and the
+    contents of the GEOM_FILE, INIT_FILE and HFUN_FILE.
+
+    """
+    if (not enabled()): return None
+
+    hash = hashlib.sha256(b"cmd;")
+    hash.update(str(resolve.version()).encode())
+
+    hashjig(hash, opts)
+
+    hashfile(hash, opts.geom_file)
+    hashfile(hash, opts.init_file)
+    hashfile(hash, opts.hfun_file)
+
+    return hash.hexdigest()
+
+
+def libkey(opts, geom, init=None, hfun=None):
+    """
+    LIBKEY: return the cache key for LIBSAW.JIGSAW(OPTS, GEOM,
+    MESH, INIT, HFUN), or None if the cache is disabled.
+
+    Keys are a SHA256 hash of OPTS (excl. file names) and the
+    contents of GEOM, INIT and HFUN, and are specific to the
+    JIGSAW lib. loaded, see RESOLVE.LIBSTAMP.
+
+    """
+    if (not enabled()): return None
+
+    hash = hashlib.sha256(b"lib;")
+    hash.update(resolve.libstamp().encode())
+
+    hashjig(hash, opts)
+
+    hashmsh(hash, geom)
+    hashmsh(hash, init)
+    hashmsh(hash, hfun)
+
+    return hash.hexdigest()
+
+
+def lookup(ckey):
+    """
+    LOOKUP: return the path to cache entry CKEY, or None on
+    a miss, updating its time-of-use if found.
+
+    """
+    if (ckey is None or not enabled()): return None
+
+    path = os.path.join(STATE["path"], ckey + ".msh")
+
+    try:
+        os.utime(path)              # mark as recently used
+
+    except OSError:
+        STATS["misses"] += 1; return None
+
+    STATS["hits"] += 1
+
+    return path
+
+
+def fetch(ckey, name):
+    """
+    FETCH: copy cache entry CKEY to file NAME, returning
+    TRUE on a hit.
+
+    """
+    path = lookup(ckey)
+
+    if (path is None): return False
+
+    try:
+        shutil.copyfile(path, name)
+
+    except OSError:
+        return False                # evicted by a peer
+
+    return True
+
+
+def fetchmsh(ckey, mesh):
+    """
+    FETCHMSH: load cache entry CKEY into MESH, via memory-
+    map, returning TRUE on a hit.
+
+    """
+    path = lookup(ckey)
+
+    if (path is None): return False
+
+    try:
+        loadmsh(path, mesh)
+
+    except OSError:
+        return False                # evicted by a peer
+
+    return True
+
+
+def commit(ckey, part):
+    """
+    COMMIT: move the temp. file PART into the cache as entry
+    CKEY, then evict as needed.
+
+    """
+    os.replace(part, os.path.join(
+        STATE["path"], ckey + ".msh"))
+
+    STATS["stores"] += 1
+
+    evict()
+
+    return
+
+
+def store(ckey, name):
+    """
+    STORE: copy the file NAME into the cache as entry CKEY.
+
+    """
+    if (ckey is None or not enabled()): return
+
+    fptr, part = tempfile.mkstemp(
+        prefix=".", suffix=".msh", dir=STATE["path"])
+    os.close(fptr)
+
+    try:
+        shutil.copyfile(name, part)
+        commit(ckey, part)
+
+    except BaseException:
+        if (os.path.isfile(part)): os.remove(part)
+        raise
+
+    return
+
+
+def storemsh(ckey, mesh):
+    """
+    STOREMSH: save MESH into the cache as entry CKEY, as a
+    binary MSH_B file.
+
+    """
+    if (ckey is None or not enabled()): return
+
+    if (not isinstance(mesh, jigsaw_msh_t)):
+        raise TypeError("Incorrect type: MESH.")
+
+    fptr, part = tempfile.mkstemp(
+        prefix=".", suffix=".msh", dir=STATE["path"])
+    os.close(fptr)
+
+    try:
+        savemsh(part, mesh, kind="binary")
+        commit(ckey, part)
+
+    except BaseException:
+        if (os.path.isfile(part)): os.remove(part)
+        raise
+
+    return
+
+
+def evict():
+    """
+    EVICT: remove the least recently used entries, until the
+    cache is within its MAX_SIZE.
+
+    """
+    item = sorted(entries())
+
+    size = sum(size for _, size, _ in item)
+
+    for _, fsiz, path in item:
+        if (size <= STATE["size"]): break
+
+        try:
+            os.remove(path)
+            STATS["evictions"] += 1
+
+        except OSError:
+            pass
+
+        size = size - fsiz
+
+    return
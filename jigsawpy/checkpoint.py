@@ -0,0 +1,112 @@
+
+import os
+import json
+
+from jigsawpy.jig_t import jigsaw_jig_t
+from jigsawpy.msh_t import jigsaw_msh_t
+
+from jigsawpy.loadmsh import loadmsh
+from jigsawpy.savemsh import savemsh
+from jigsawpy.loadjig import loadjig
+from jigsawpy.savejig import savejig
+
+#------------------------ index of the last completed level
+LEVEL = "level.json"
+
+
+def names(ilev):
+    """
+    NAMES: return the MESH and OPTS file names for level
+    ILEV of a checkpoint.
+
+    """
+    return "mesh-%02u.msh" % ilev, "opts-%02u.jig" % ilev
+
+
+def save(path, name, nlev, ilev, opts, mesh):
+    """
+    SAVE: write a checkpoint for level ILEV of an NLEV-level
+    build via the driver NAME, i.e. "tetris", to dir. PATH.
+
+    SAVE(PATH, NAME, NLEV, ILEV, OPTS, MESH)
+
+    MESH is saved as a binary MSH_B file, and the (scaled)
+    OPTS used at this level as a *.jig file. The level index
+    is then committed via atomic rename, such that a build
+    killed mid-save resumes from the previous checkpoint.
+    Files for earlier levels are removed.
+
+    """
+    if (not isinstance(opts, jigsaw_jig_t)):
+        raise TypeError("Incorrect type: OPTS.")
+
+    if (not isinstance(mesh, jigsaw_msh_t)):
+        raise TypeError("Incorrect type: MESH.")
+
+    os.makedirs(path, exist_ok=True)
+
+    mnam, onam = names(ilev)
+
+    savemsh(os.path.join(path, mnam), mesh, kind="binary")
+    savejig(os.path.join(path, onam), opts)
+
+#------------------------ commit level, then drop old files
+    info = {
+        "name": name, "nlev": nlev, "ilev": ilev,
+        "mesh": mnam, "opts": onam}
+
+    part = os.path.join(path, "." + LEVEL)
+
+    with open(part, "w") as fptr:
+        json.dump(info, fptr, indent=4)
+
+    os.replace(part, os.path.join(path, LEVEL))
+
+    for item in os.listdir(path):
+        if (item.startswith(("mesh-", "opts-")) and
+                item not in (mnam, onam)):
+            os.remove(os.path.join(path, item))
+
+    return
+
+
+def load(path, name, nlev, mesh, opts):
+    """
+    LOAD: load the last checkpoint in dir. PATH, returning
+    its level index ILEV, or None if there is none.
+
+    ILEV = LOAD(PATH, NAME, NLEV, MESH, OPTS)
+
+    MESH is restored as at the end of level ILEV, as are the
+    OPTS saved in its *.jig file, i.e. the scaled HFUN_HMAX,
+    OPTM_QLIM, file names, etc. Raises ValueError if the
+    checkpoint is not for an NLEV-level build via NAME.
+
+    """
+    if (not isinstance(mesh, jigsaw_msh_t)):
+        raise TypeError("Incorrect type: MESH.")
+
+    if (not isinstance(opts, jigsaw_jig_t)):
+        raise TypeError("Incorrect type: OPTS.")
+
+    if (not os.path.isfile(os.path.join(path, LEVEL))):
+        return None
+
+    with open(os.path.join(path, LEVEL), "r") as fptr:
+        info = json.load(fptr)
+
+    if (info["name"] != name or info["nlev"] != nlev):
+        raise ValueError(
+            "Invalid RESUME: checkpoint is for " +
+            str(info["name"]) + " with NLEV=" +
+            str(info["nlev"]))
+
+    loadmsh(os.path.join(path, info["mesh"]), mesh)
+
+    jcfg = jigsaw_jig_t()
+    loadjig(os.path.join(path, info["opts"]), jcfg)
+
+    for item, data in vars(jcfg).items():
+        if (data is not None): setattr(opts, item, data)
+
+    return int(info["ilev"])
@@ -1,10 +1,10 @@
 
-import subprocess
 import os
-import inspect
-import shutil
 import copy
 import math
+import time
+import shutil
+import tempfile
 import numpy as np
 
 from pathlib import Path
@@ -16,20 +16,24 @@ from jigsawpy.tools.scorecard import trideg2, trideg3
 from jigsawpy.tools.predicate import trivol2, trivol3
 
 from jigsawpy.bisect import bisect
+from jigsawpy import resolve, cache, telemetry, libsaw, \
+    checkpoint
 
 from jigsawpy.jig_t import jigsaw_jig_t
 from jigsawpy.msh_t import jigsaw_msh_t
 
 from jigsawpy.loadmsh import loadmsh
-from jigsawpy.savemsh import savemsh
+from jigsawpy.savemsh import savemsh, savemsh_async, \
+    updatemsh
 from jigsawpy.savejig import savejig
+from jigsawpy.parse.savepvd import pvd_writer
 
 
 def jigsaw(opts, mesh=None):
     """
     JIGSAW cmd-line interface to JIGSAW.
 
-    JIGSAW(OPTS, MESH=None)
+    INFO = JIGSAW(OPTS, MESH=None)
 
     Call the JIGSAW mesh generator using the config. options
     specified in the OPTS structure.
@@ -37,9 +41,15 @@ def jigsaw(opts, mesh=None):
     OPTS is a user-defined set of meshing options. See JIG_t
     for details.
 
-    """
-    jexename = Path()
+    INFO is a RUN_t of timings, iteration counts, etc parsed
+    from JIGSAW's output, see TELEMETRY.RUNEXE. INFO.CELLS
+    is counted from MESH, if given.
 
+    If enabled, outputs are re-used from the result cache,
+    see CACHE.ENABLE. INFO is then an empty RUN_t, with
+    INFO.CACHED set, and a RETURNCODE of 0.
+
+    """
     if (not isinstance(opts, jigsaw_jig_t)):
         raise TypeError("Incorrect type: OPTS.")
 
@@ -47,56 +57,54 @@ def jigsaw(opts, mesh=None):
             isinstance(mesh, jigsaw_msh_t)):
         raise TypeError("Incorrect type: MESH.")
 
-    savejig(opts.jcfg_file, opts)
-
-    if (jexename == Path()):
-#---------------------------- set-up path for "local" binary
-
-    #   stackoverflow.com/questions/2632199/
-    #       how-do-i-get-the-
-    #       path-of-the-current-executed-file-in-python
-        filename = \
-            inspect.getsourcefile(lambda:0) # noqa
+#---------------------------- re-use output, if cache is on
+    ckey = cache.cmdkey(opts)
 
-        filepath = \
-            Path(filename).resolve().parent
+    if (cache.fetch(ckey, opts.mesh_file)):
+        if (mesh is not None):
+            loadmsh(opts.mesh_file, mesh)
 
-        if   (os.name == "nt"):
-            jexename = filepath / "_bin" / "jigsaw.exe"
+        info = telemetry.run_t("jigsaw", [opts.jcfg_file])
+        info.returncode = +0
+        info.cached = True
 
-        elif (os.name == "posix"):
-            jexename = filepath / "_bin" / "jigsaw"
+        if (mesh is not None):
+            telemetry.countmsh(info, mesh)
 
-        if (not jexename.is_file()):
-            jexename = Path()
+        return info
 
-    if (jexename == Path()):
-#---------------------------- search machine path for binary
-        jexescan = shutil.which("jigsaw")
+    savejig(opts.jcfg_file, opts)
 
-        if (jexescan is not None):
-            jexename = Path(jexescan)
+#---------------------------- find binary (cached) to call
+    jexename = resolve.findexe("jigsaw")
 
     if (jexename != Path()):
 #---------------------------- call JIGSAW and capture output
-        subprocess.run([
-            str(jexename), opts.jcfg_file], check=True)
+        info = telemetry.runexe([
+            str(jexename), opts.jcfg_file],
+            "jigsaw", hooks=False)
+
+        cache.store(ckey, opts.mesh_file)
 
         if (mesh is not None):
             loadmsh(opts.mesh_file, mesh)
 
+            telemetry.countmsh(info, mesh)
+
+        telemetry.notify(info)
+
     else:
 
         raise ValueError("JIGSAW executable not found")
 
-    return
+    return info
 
 
 def tripod(opts, tria=None):
     """
     TRIPOD cmd-line interface to TRIPOD.
 
-    TRIPOD(OPTS, TRIA=None)
+    INFO = TRIPOD(OPTS, TRIA=None)
 
     Call the TRIPOD tessellation util. using the config. opt
     specified in the OPTS structure.
@@ -104,9 +112,11 @@ def tripod(opts, tria=None):
     OPTS is a user-defined set of meshing options. See JIG_t
     for details.
 
-    """
-    jexename = Path()
+    INFO is a RUN_t of telemetry parsed from TRIPOD's
+    output, see TELEMETRY.RUNEXE. INFO.CELLS is counted
+    from TRIA, if given.
 
+    """
     if (not isinstance(opts, jigsaw_jig_t)):
         raise TypeError("Incorrect type: OPTS.")
 
@@ -116,54 +126,34 @@ def tripod(opts, tria=None):
 
     savejig(opts.jcfg_file, opts)
 
-    if (jexename == Path()):
-#---------------------------- set-up path for "local" binary
-
-    #   stackoverflow.com/questions/2632199/
-    #       how-do-i-get-the-
-    #       path-of-the-current-executed-file-in-python
-        filename = \
-            inspect.getsourcefile(lambda:0) # noqa
-
-        filepath = \
-            Path(filename).resolve().parent
-
-        if   (os.name == "nt"):
-            jexename = filepath / "_bin" / "tripod.exe"
-
-        elif (os.name == "posix"):
-            jexename = filepath / "_bin" / "tripod"
-
-        if (not jexename.is_file()):
-            jexename = Path()
-
-    if (jexename == Path()):
-#---------------------------- search machine path for binary
-        jexescan = shutil.which("tripod")
-
-        if (jexescan is not None):
-            jexename = Path(jexescan)
+#---------------------------- find binary (cached) to call
+    jexename = resolve.findexe("tripod")
 
     if (jexename != Path()):
 #---------------------------- call JIGSAW and capture output
-        subprocess.run([
-            str(jexename), opts.jcfg_file], check=True)
+        info = telemetry.runexe([
+            str(jexename), opts.jcfg_file],
+            "tripod", hooks=False)
 
         if (tria is not None):
             loadmsh(opts.mesh_file, tria)
 
+            telemetry.countmsh(info, tria)
+
+        telemetry.notify(info)
+
     else:
 
         raise ValueError("TRIPOD executable not found")
 
-    return
+    return info
 
 
 def marche(opts, ffun=None):
     """
     MARCHE cmd-line interface to MARCHE.
 
-    MARCHE(OPTS, FFUN=None)
+    INFO = MARCHE(OPTS, FFUN=None)
 
     Call the "fast-marching" solver MARCHE using the config.
     options specified in the OPTS structure. MARCHE solves
@@ -178,9 +168,11 @@ def marche(opts, ffun=None):
     OPTS is a user-defined set of meshing options. See JIG_t
     for details.
 
-    """
-    jexename = Path()
+    INFO is a RUN_t of telemetry parsed from MARCHE's
+    output, see TELEMETRY.RUNEXE. INFO.CELLS is counted
+    from FFUN, if given.
 
+    """
     if (not isinstance(opts, jigsaw_jig_t)):
         raise TypeError("Incorrect type: OPTS.")
 
@@ -190,53 +182,94 @@ def marche(opts, ffun=None):
 
     savejig(opts.jcfg_file, opts)
 
-    if (jexename == Path()):
-#---------------------------- set-up path for "local" binary
+#---------------------------- find binary (cached) to call
+    jexename = resolve.findexe("marche")
 
-    #   stackoverflow.com/questions/2632199/
-    #       how-do-i-get-the-
-    #       path-of-the-current-executed-file-in-python
-        filename = \
-            inspect.getsourcefile(lambda:0) # noqa
+    if (jexename != Path()):
+#---------------------------- call JIGSAW and capture output
+        info = telemetry.runexe([
+            str(jexename), opts.jcfg_file],
+            "marche", hooks=False)
 
-        filepath = \
-            Path(filename).resolve().parent
+        if (ffun is not None):
+            loadmsh(opts.hfun_file, ffun)
 
-        if   (os.name == "nt"):
-            jexename = filepath / "_bin" / "marche.exe"
+            telemetry.countmsh(info, ffun)
 
-        elif (os.name == "posix"):
-            jexename = filepath / "_bin" / "marche"
+        telemetry.notify(info)
 
-        if (not jexename.is_file()):
-            jexename = Path()
+    else:
 
-    if (jexename == Path()):
-#---------------------------- search machine path for binary
-        jexescan = shutil.which("marche")
+        raise ValueError("MARCHE executable not found")
 
-        if (jexescan is not None):
-            jexename = Path(jexescan)
+    return info
 
-    if (jexename != Path()):
-#---------------------------- call JIGSAW and capture output
-        subprocess.run([
-            str(jexename), opts.jcfg_file], check=True)
 
-        if (ffun is not None):
-            loadmsh(opts.hfun_file, ffun)
+def inmemory(opts, init=None, hfun=None):
+    """
+    INMEMORY: return the INIT and HFUN MSH_t objects for the
+    API-lib. backend, loading OPTS.INIT_FILE and OPTS.HFUN_-
+    FILE once, if not given.
 
-    else:
+    """
+    if (init is None and opts.init_file is not None):
+        init = jigsaw_msh_t()
+        loadmsh(opts.init_file, init)
 
-        raise ValueError("MARCHE executable not found")
+    if (hfun is None and opts.hfun_file is not None):
+        hfun = jigsaw_msh_t()
+        loadmsh(opts.hfun_file, hfun)
 
-    return
+    return init, hfun
 
 
-def jitter(opts, imax, ibad, mesh=None):
+def jitstat(mesh):
+    """
+    JITSTAT return the no. of irregular nodes and the METRIC
+    score of MESH, see JITTER.
+
+    """
+    nbad = +0
+
+    if (mesh.tria3 is not None and
+            mesh.tria3.size != +0):
+    #------------------------------ nodes with degree != 6
+        vdeg = trideg2(
+            mesh.point["coord"],
+            mesh.tria3["index"])
+
+        nbad = int(np.count_nonzero(
+            vdeg[vdeg > +0] != 6))
+
+    return nbad, float(metric(mesh))
+
+
+def jitter(opts, imax, ibad, mesh=None, series=None,
+           geom=None, init=None, hfun=None,
+           rtol=None, span=4):
     """
     JITTER call JIGSAW iteratively; try to improve topology.
 
+    STAT = JITTER(OPTS, IMAX, IBAD, MESH=None, SERIES=None,
+                  GEOM=None, INIT=None, HFUN=None,
+                  RTOL=None, SPAN=4)
+
+    SERIES is an optional PVD_WRITER, saving the mesh after
+    each iteration.
+
+    If GEOM is given, JIGSAW is called via its API-lib., see
+    LIBSAW.JIGSAW, with GEOM, INIT and HFUN passed as MSH_t
+    objects, and no files written.
+
+    If RTOL is given, iterations stop early once neither the
+    no. of irregular nodes nor the METRIC score has improved
+    by more than a fraction RTOL over SPAN iterations, else
+    all IMAX iterations are run.
+
+    STAT is a list of dict.'s, one per iteration, with the
+    wall-clock TIME (secs), and, if RTOL is given, the no.
+    of irregular nodes NBAD and the METRIC score COST.
+
     """
 
     if (not isinstance(opts, jigsaw_jig_t)):
@@ -246,13 +279,28 @@ def jitter(opts, imax, ibad, mesh=None):
             isinstance(mesh, jigsaw_msh_t)):
         raise TypeError("Incorrect type: MESH.")
 
+    if (series is not None and not
+            isinstance(series, pvd_writer)):
+        raise TypeError("Incorrect type: SERIES.")
+
     if (mesh is None): mesh = jigsaw_msh_t()
 
+    if (rtol is not None and rtol < +0.):
+        raise ValueError("Invalid RTOL: " + str(rtol))
+
+    if (span < +1):
+        raise ValueError("Invalid SPAN: " + str(span))
+
 #--------- call JIGSAW iteratively; try to improve topology.
     OPTS = copy.deepcopy(opts)
 
+    stat = []
+    best = None                         # last improvement
+
     for iter in range(imax):
 
+        tbeg = time.perf_counter()
+
         if (mesh.point is not None and
                 mesh.point.size != +0):
 
@@ -261,16 +309,17 @@ def jitter(opts, imax, ibad, mesh=None):
             keep = np.full(
                 (nvrt), True, dtype=bool)
 
+            if (geom is None):
     #------------------------------ setup initial conditions
-            path = Path(opts.mesh_file).parent
-            name = Path(opts.mesh_file).stem
-            fext = Path(opts.mesh_file).suffix
+                path = Path(opts.mesh_file).parent
+                name = Path(opts.mesh_file).stem
+                fext = Path(opts.mesh_file).suffix
 
-            name = str(name)
-            fext = str(fext)
-            name = name + "-INIT" + fext
+                name = str(name)
+                fext = str(fext)
+                name = name + "-INIT" + fext
 
-            OPTS.init_file = str(path / name)
+                OPTS.init_file = str(path / name)
 
             if (mesh.tria3 is not None and
                     mesh.tria3.size != +0):
@@ -303,18 +352,66 @@ def jitter(opts, imax, ibad, mesh=None):
             init = jigsaw_msh_t()
             init.point = mesh.point[keep]
 
-            savemsh(OPTS.init_file, init)
+            if (geom is None):
+                savemsh(OPTS.init_file, init)
 
     #------------------------------ call JIGSAW with new ICs
-        jigsaw (OPTS, mesh)       # noqa
+        if (geom is None):
+            jigsaw (OPTS, mesh)       # noqa
+        else:
+            libsaw.jigsaw(OPTS, geom, mesh, init, hfun)
 
-    return
+        if (series is not None): series.write(mesh)
+
+        stat.append({"time": time.perf_counter() - tbeg})
+
+        if (rtol is None): continue
+
+    #------------------------------ stop once converged
+        nbad, cost = jitstat(mesh)
+
+        stat[-1]["nbad"] = nbad
+        stat[-1]["cost"] = cost
+
+        if (best is None or
+                nbad < best[1] * (1. - rtol) or
+                cost > best[2] * (1. + rtol)):
+            best = (iter, nbad, cost)
 
+        elif (iter - best[0] >= span): break
 
-def tetris(opts, nlev, mesh=None):
+    return stat
+
+
+def tetris(opts, nlev, mesh=None, series=None,
+           geom=None, init=None, hfun=None, rtol=None,
+           resume=None):
     """
     TETRIS generate a mesh using an inc. bisection strategy.
 
+    SERIES is an optional PVD_WRITER, saving the mesh after
+    each level.
+
+    If GEOM is given, JIGSAW is called via its API-lib., see
+    LIBSAW.JIGSAW, with meshes passed between levels as MSH_t
+    objects, and no files written. INIT and HFUN default to
+    OPTS.INIT_FILE and OPTS.HFUN_FILE, loaded once.
+
+    In either case, HFUN is loaded just once, and rescaled
+    in-place for each level. Otherwise, INIT and HFUN, if
+    given, are written next to OPTS.MESH_FILE, as "-ITER"
+    and "-HFUN" files.
+
+    RTOL is an optional tolerance for early stopping at each
+    level, see JITTER, i.e. RTOL=0.01. By default, all the
+    iterations are run.
+
+    RESUME is an optional dir. for checkpoints. The MESH,
+    scaled OPTS and level index are saved to it after each
+    level, see CHECKPOINT.SAVE. If RESUME already holds a
+    checkpoint, MESH and OPTS are restored from it, and the
+    build restarts after the last completed level.
+
     """
 
     if (not isinstance(opts, jigsaw_jig_t)):
@@ -324,14 +421,91 @@ def tetris(opts, nlev, mesh=None):
             isinstance(mesh, jigsaw_msh_t)):
         raise TypeError("Incorrect type: MESH.")
 
+    if (series is not None and not
+            isinstance(series, pvd_writer)):
+        raise TypeError("Incorrect type: SERIES.")
+
     if (mesh is None): mesh = jigsaw_msh_t()
 
 #---------------------------- call JIGSAW via inc. bisection
     SCAL = +2. ** nlev
     OPTS = copy.deepcopy(opts)
+
+    wait = []                           # async. file writes
+    hnew = True                         # HFUN-ITER to write
+
+    HFUN = None
+    INIT = None
+
+    if (geom is not None):
+        INIT, hfun = inmemory(opts, init, hfun)
+
+    elif (opts.hfun_file is not None):
+    #---------------------------- HFUN-ITER file, for all lev
+        path = Path(opts.hfun_file).parent
+        name = Path(opts.hfun_file).stem
+        fext = Path(opts.hfun_file).suffix
+
+        name = str(name)
+        fext = str(fext)
+        name = name + "-ITER" + fext
+
+        OPTS.hfun_file = str(path / name)
+
+        if (hfun is None):
+            hfun = jigsaw_msh_t()
+            loadmsh(opts.hfun_file, hfun)
+
+    elif (hfun is not None):
+    #---------------------------- HFUN-ITER file, via MESH
+        path = Path(opts.mesh_file).parent
+        name = Path(opts.mesh_file).stem
+        fext = Path(opts.mesh_file).suffix
+
+        name = str(name)
+        fext = str(fext)
+        name = name + "-HFUN" + fext
+
+        OPTS.hfun_file = str(path / name)
+
+    if (geom is None and init is not None):
+    #---------------------------- INIT-ITER file, for 1st lev
+        path = Path(opts.mesh_file).parent
+        name = Path(opts.mesh_file).stem
+        fext = Path(opts.mesh_file).suffix
+
+        name = str(name)
+        fext = str(fext)
+        name = name + "-ITER" + fext
+
+        OPTS.init_file = str(path / name)
+
+        wait.append(
+            savemsh_async(OPTS.init_file, init))
+
+    if (hfun is not None):
+    #---------------------------- load base HFUN just once;
+    #---------------------------- each lev. is VALUE * SCAL
+        HFUN = copy.copy(hfun)
+        HFUN.value = np.empty_like(
+            hfun.value, np.result_type(hfun.value, SCAL))
+
+    NLEV = nlev
+    done = None                         # lev. to resume at
+
+    if (resume is not None):
+        done = checkpoint.load(
+            resume, "tetris", NLEV, mesh, OPTS)
     
     while (nlev >= +0):
 
+        if (done is not None and nlev > done):
+    #------------------------ skip lev. done before RESUME
+            nlev = nlev - 1
+            SCAL = SCAL / 2.
+
+            continue
+
         if (opts.optm_qlim is not None):
     #------------------------ create/write current QLIM data
             scal = min(
@@ -363,35 +537,52 @@ def tetris(opts, nlev, mesh=None):
             OPTS.hfun_hmin = \
                 opts.hfun_hmin * SCAL
 
-        if (opts.hfun_file is not None):
+        if (HFUN is not None):
+    #------------------------ scale base HFUN at this lev
+            np.multiply(hfun.value, SCAL, out=HFUN.value)
+
+        if (geom is None and HFUN is not None):
     #------------------------ create/write current HFUN data
-            path = Path(opts.hfun_file).parent
-            name = Path(opts.hfun_file).stem
-            fext = Path(opts.hfun_file).suffix
+            if (hnew):
+    #------------------------ 1st level: write HFUN in full
+                wait.append(
+                    savemsh_async(OPTS.hfun_file, HFUN))
 
-            name = str(name)
-            fext = str(fext)
-            name = name + "-ITER" + fext
+                hnew = False
 
-            OPTS.hfun_file = str(path / name)
+            else:
+    #------------------------ only VALUE changes: update it
+                updatemsh(OPTS.hfun_file, HFUN, "VALUE")
 
-            HFUN = jigsaw_msh_t()
+    #------------------------ finish INIT/HFUN writes first
+        for item in wait: item.result()
 
-            loadmsh(opts.hfun_file, HFUN)
+        wait = []
 
-            HFUN.value = HFUN.value * SCAL
+        if (done is None or nlev < done):
+    #------------------------ call JIGSAW kernel at this lev
+            jitter(OPTS, 4 + (nlev > 0) * 44, 3, mesh,
+                   None, geom, INIT, HFUN, rtol)
 
-            savemsh(OPTS.hfun_file, HFUN)
+            if (series is not None): series.write(mesh)
 
-    #------------------------ call JIGSAW kernel at this lev
-        jitter(OPTS, 4 + (nlev > 0) * 44, 3, mesh)
+            if (resume is not None):
+                checkpoint.save(
+                    resume, "tetris", NLEV, nlev, OPTS, mesh)
 
         nlev = nlev - 1
         SCAL = SCAL / 2.
 
         if (nlev < +0): break
 
-        if (opts.init_file is not None):
+        if (geom is not None):
+    #------------------------ next INIT is kept in-memory
+            bisect(mesh)
+            attach(mesh)
+
+            INIT = None
+
+        elif (opts.init_file is not None):
     #------------------------ create/write current INIT data
             path = Path(opts.init_file).parent
             name = Path(opts.init_file).stem
@@ -406,7 +597,9 @@ def tetris(opts, nlev, mesh=None):
             bisect(mesh)
             attach(mesh)
 
-            savemsh(OPTS.init_file, mesh)
+    #------------------------ overlap with next HFUN update
+            wait.append(
+                savemsh_async(OPTS.init_file, mesh))
 
         else:
     #------------------------ create/write current INIT data
@@ -423,15 +616,28 @@ def tetris(opts, nlev, mesh=None):
             bisect(mesh)
             attach(mesh)
 
-            savemsh(OPTS.init_file, mesh)
+    #------------------------ overlap with next HFUN update
+            wait.append(
+                savemsh_async(OPTS.init_file, mesh))
 
     return
 
 
-def refine(opts, nlev, mesh=None):
+def refine(opts, nlev, mesh=None, series=None,
+           geom=None, init=None, hfun=None, resume=None,
+           name="refine"):
     """
     REFINE generate a mesh using an inc. bisection strategy.
 
+    SERIES is an optional PVD_WRITER, saving the mesh after
+    each level.
+
+    If GEOM is given, JIGSAW is called via its API-lib., as
+    per TETRIS. RESUME is an optional checkpoint dir., also
+    as per TETRIS. NAME is the driver the checkpoints are
+    saved for, i.e. "icosahedron", such that a checkpoint
+    from another driver is not resumed.
+
     """
 
     if (not isinstance(opts, jigsaw_jig_t)):
@@ -441,6 +647,10 @@ def refine(opts, nlev, mesh=None):
             isinstance(mesh, jigsaw_msh_t)):
         raise TypeError("Incorrect type: MESH.")
 
+    if (series is not None and not
+            isinstance(series, pvd_writer)):
+        raise TypeError("Incorrect type: SERIES.")
+
     if (mesh is None): mesh = jigsaw_msh_t()
 
 #---------------------------- call JIGSAW via inc. bisection
@@ -448,18 +658,51 @@ def refine(opts, nlev, mesh=None):
     opts.optm_div_ = False
     opts.optm_zip_ = False
 
+    if (geom is not None):
+        init, hfun = inmemory(opts, init, hfun)
+
+    done = None                         # lev. to resume at
+
+    if (resume is not None):
+        done = checkpoint.load(
+            resume, name, nlev, mesh, opts)
+
     for ilev in reversed(range(nlev + 1)):
 
+        if (done is not None and ilev > done):
+            continue                    # done before RESUME
+
         if (opts.optm_dual is not None):
     #------------------------ create/write current DUAL data
             opts.optm_dual = ilev == 0
 
+        if (done is None or ilev < done):
     #------------------------ call JIGSAW kernel at this lev
-        jigsaw(opts, mesh)
+            if (geom is None):
+                jigsaw(opts, mesh)
+            else:
+                libsaw.jigsaw(opts, geom, mesh, init, hfun)
+
+            if (series is not None): series.write(mesh)
+
+            if (resume is not None):
+                checkpoint.save(
+                    resume, name, nlev, ilev, opts, mesh)
 
         if (ilev <= +0): break
 
-        if (opts.mesh_file is not None):
+        if (geom is not None):
+    #------------------------ next INIT is kept in-memory
+            bisect(mesh)
+            attach(mesh)
+
+            init = copy.copy(mesh)
+
+            if (init.power is not None and
+                    init.power.shape[0] != init.point.size):
+                init.power = None       # stale after BISECT
+
+        elif (opts.mesh_file is not None):
     #------------------------ create/write current INIT data
             path = Path(opts.mesh_file).parent
             name = Path(opts.mesh_file).stem
@@ -479,10 +722,15 @@ def refine(opts, nlev, mesh=None):
     return
 
 
-def icosahedron(opts, nlev, mesh=None):
+def icosahedron(opts, nlev, mesh=None, series=None,
+                geom=None, hfun=None, resume=None):
     """
     ICOSAHEDRON Nth-level icosahedral mesh of the ellipsoid.
 
+    If GEOM is given, JIGSAW is called via its API-lib., as
+    per TETRIS, else GEOM is loaded from OPTS.GEOM_FILE.
+    RESUME is an optional checkpoint dir., see REFINE.
+
     """
 
     if (not isinstance(opts, jigsaw_jig_t)):
@@ -492,9 +740,16 @@ def icosahedron(opts, nlev, mesh=None):
             isinstance(mesh, jigsaw_msh_t)):
         raise TypeError("Incorrect type: MESH.")
 
-    geom = jigsaw_msh_t()
+    if (geom is not None and not
+            isinstance(geom, jigsaw_msh_t)):
+        raise TypeError("Incorrect type: GEOM.")
+
+    inmem = geom is not None            # via API-lib.?
 
-    loadmsh(opts.geom_file, geom)
+    if (geom is None):
+        geom = jigsaw_msh_t()
+
+        loadmsh(opts.geom_file, geom)
 
     if (mesh is None): mesh = jigsaw_msh_t()
 
@@ -551,19 +806,37 @@ def icosahedron(opts, nlev, mesh=None):
 
     if (nlev <= +0): return
 
+    if (inmem):
+    #-------------------------------- refine mesh in-memory
+        refine(opts, nlev, mesh, series,
+               geom, copy.copy(mesh), hfun, resume,
+               "icosahedron")
+
+        return
+
     opts.init_file = opts.mesh_file
 
     savemsh(opts.init_file, mesh)
 
-    refine(opts, nlev, mesh)
+    refine(opts, nlev, mesh, series, resume=resume,
+           name="icosahedron")
 
     return
 
 
-def cubedsphere(opts, nlev, mesh=None):
+def cubedsphere(opts, nlev, mesh=None, series=None,
+                geom=None, hfun=None, resume=None):
     """
     CUBEDSPHERE Nth-level cubedsphere mesh of the ellipsoid.
 
+    If GEOM is given, JIGSAW is called via its API-lib., as
+    per TETRIS, else GEOM is loaded from OPTS.GEOM_FILE.
+    RESUME is an optional checkpoint dir., see REFINE.
+
+    If the API-lib. does not return QUAD4 cells intact, see
+    LIBSAW.QUAD4OK, GEOM is meshed via the cmd-line instead,
+    with files written to RESUME, or a temp. dir.
+
     """
 
     if (not isinstance(opts, jigsaw_jig_t)):
@@ -573,9 +846,16 @@ def cubedsphere(opts, nlev, mesh=None):
             isinstance(mesh, jigsaw_msh_t)):
         raise TypeError("Incorrect type: MESH.")
 
-    geom = jigsaw_msh_t()
+    if (geom is not None and not
+            isinstance(geom, jigsaw_msh_t)):
+        raise TypeError("Incorrect type: GEOM.")
+
+    inmem = geom is not None            # via API-lib.?
+
+    if (geom is None):
+        geom = jigsaw_msh_t()
 
-    loadmsh(opts.geom_file, geom)
+        loadmsh(opts.geom_file, geom)
 
     if (mesh is None): mesh = jigsaw_msh_t()
 
@@ -612,10 +892,56 @@ def cubedsphere(opts, nlev, mesh=None):
 
     if (nlev <= +0): return
 
+    if (inmem and libsaw.quad4ok()):
+    #-------------------------------- refine mesh in-memory
+        refine(opts, nlev, mesh, series,
+               geom, copy.copy(mesh), hfun, resume,
+               "cubedsphere")
+
+        return
+
+    if (inmem):
+    #-------------------------------- old lib.: via cmd-line
+        path = resume
+        if (path is None): path = tempfile.mkdtemp()
+
+        try:
+            os.makedirs(path, exist_ok=True)
+
+            OPTS = copy.copy(opts)
+            OPTS.geom_file = os.path.join(
+                path, "cubedsphere-geom.msh")
+            OPTS.jcfg_file = os.path.join(
+                path, "cubedsphere-opts.jig")
+            OPTS.mesh_file = os.path.join(
+                path, "cubedsphere-mesh.msh")
+
+            savemsh(OPTS.geom_file, geom)
+
+            if (hfun is not None):
+                OPTS.hfun_file = os.path.join(
+                    path, "cubedsphere-hfun.msh")
+
+                savemsh(OPTS.hfun_file, hfun)
+
+            OPTS.init_file = OPTS.mesh_file
+
+            savemsh(OPTS.init_file, mesh)
+
+            refine(OPTS, nlev, mesh, series,
+                   resume=resume, name="cubedsphere")
+
+        finally:
+            if (resume is None):
+                shutil.rmtree(path, ignore_errors=True)
+
+        return
+
     opts.init_file = opts.mesh_file
 
     savemsh(opts.init_file, mesh)
 
-    refine(opts, nlev, mesh)
+    refine(opts, nlev, mesh, series, resume=resume,
+           name="cubedsphere")
 
     return
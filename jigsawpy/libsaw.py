@@ -1,11 +1,7 @@
 
+import weakref
 import ctypes as ct
-import ctypes.util
 import numpy as np
-import inspect
-import platform
-
-from pathlib import Path
 
 from jigsawpy.def_t import indx_t, real_t, fp32_t
 
@@ -19,64 +15,32 @@ from jigsawpy.msh_l import libsaw_msh_t
 from jigsawpy.jig_l import libsaw_jig_t
 
 from jigsawpy.certify import certify
+from jigsawpy import resolve, cache
+
+from jigsawpy.tools.mathutils import S2toR3
 
 from jigsawpy.def_t import jigsaw_def_t as defs
 from jigsawpy.jig_t import jigsaw_jig_t
 from jigsawpy.msh_t import jigsaw_msh_t
 
-#---------------------------- Try to find/load JIGSAW's API.
-
-JLIBNAME = Path()
-
-if (JLIBNAME == Path()):
-#---------------------------- set-up path for "local" binary
-
-    WIN = "Windows"
-    LNX = "Linux"
-    MAC = "Darwin"
+#---------------------------- Load JIGSAW's API on 1st use.
 
-#   stackoverflow.com/questions/2632199/
-#       how-do-i-get-the-
-#           path-of-the-current-executed-file-in-python
-    FILENAME = \
-        inspect.getsourcefile(lambda: +0)
 
-    FILEPATH = \
-        (Path(FILENAME).resolve()).parent
+class jlib_t(object):
+#---------------------------- defer lib. loading to a call!
+    def __getattr__(self, name):
+        return getattr(resolve.loadlib(), name)
 
-    if   (platform.system() == WIN):
-        JLIBNAME = \
-            FILEPATH / "_lib" / "jigsaw.dll"
 
-    elif (platform.system() == LNX):
-        JLIBNAME = \
-            FILEPATH / "_lib" / "libjigsaw.so"
+JLIB = jlib_t()
 
-    elif (platform.system() == MAC):
-        JLIBNAME = \
-            FILEPATH / "_lib" / "libjigsaw.dylib"
 
-    if (not JLIBNAME.is_file()):
-        JLIBNAME = Path()
+def __getattr__(name):
+#---------------------------- lib. path for older callers.
+    if (name == "JLIBNAME"): return resolve.findlib()
 
-if (JLIBNAME == Path()):
-#---------------------------- search machine path for binary
-    if   (platform.system() == WIN):
-        JLIBNAME = Path(
-            ctypes.util.find_library("jigsaw.dll"))
-
-    elif (platform.system() == LNX):
-        JLIBNAME = Path("libjigsaw.so")
-
-    elif (platform.system() == MAC):
-        JLIBNAME = Path("libjigsaw.dylib")
-
-if (JLIBNAME != Path()):
-#---------------------------- load jigsaw library via ctypes
-    JLIB = ct.cdll.LoadLibrary(str(JLIBNAME))
-
-else:
-    raise ValueError("JIGSAW lib. not found")
+    raise AttributeError(
+        "module " + __name__ + " has no attribute " + name)
 
 
 def is_type_t(data, kind):
@@ -520,26 +484,69 @@ def put_msh_t(msht, mshl):
     return
 
 
-def get_ptr_t(ptrl, kind):
+class owns_t(object):
+#---------------------------- lib.-owned MSH_t, freed on GC
+    def __init__(self, mshl):
+        self.mshl = type(mshl).from_buffer_copy(mshl)
 
-    #--------------------------------- helper to copy buffer
-    data = np.empty(ptrl.size, dtype=kind)
+        weakref.finalize(
+            self, JLIB.jigsaw_free_msh_t,
+            ct.pointer(self.mshl))
+
+
+class buff_t(object):
+#---------------------------- lib.-owned buffer, as ndarray
+    def __init__(self, ptrl, byte, owns):
+        self.owns = owns                # keeps MSH_t alive
+        self.__array_interface__ = {
+            "shape": (ptrl.size * byte,),
+            "typestr": "|u1",
+            "data": (ct.cast(
+                ptrl.data, ct.c_void_p).value, False),
+            "version": +3
+        }
+
+
+def get_ptr_t(ptrl, kind, free, owns=None):
+    """
+    GET-PTR_t: Copy buffer PTRL to a new array, then FREE it.
+
+    If OWNS is given, return an array view onto PTRL instead,
+    keeping the OWNS_t object alive, see GET_MSH_T.
+
+    """
 
     byte = np.dtype(kind).itemsize
 
+    if (owns is not None):
+    #--------------------------------- view buffer, zero-copy
+        return np.asarray(
+            buff_t(ptrl, byte, owns)).view(kind)
+
+    #--------------------------------- helper to copy buffer
+    data = np.empty(ptrl.size, dtype=kind)
+
     ct.memmove(data.ctypes.data,
                ptrl.data,
                ptrl.size * byte)
 
+    free(ct.byref(ptrl))
+
     return data
 
 
-def get_msh_t(msht, mshl):
+def get_msh_t(msht, mshl, copy=True):
     """
     GET-MSH_t: Copy buffer from ctypes-to-python objects.
 
+    If not COPY, arrays in MSHT are views onto the buffers
+    of MSHL, which is freed via JIGSAW_FREE_MSH_T once the
+    last such view is deleted.
+
     """
 
+    owns = None if copy else owns_t(mshl)
+
     #--------------------------------- assign mshID variable
     if (mshl.flags ==
             defs.JIGSAW_EUCLIDEAN_MESH):
@@ -564,129 +571,91 @@ def get_msh_t(msht, mshl):
     if (mshl.radii.size >= +1):
     #--------------------------------- copy buffer for RADII
         msht.radii = get_ptr_t(
-            mshl.radii, jigsaw_msh_t.REALS_t)
-
-        ptrl = ct.byref(mshl.radii)
-
-        JLIB.jigsaw_free_reals(ptrl)
+            mshl.radii, jigsaw_msh_t.REALS_t,
+            JLIB.jigsaw_free_reals, owns)
 
     if (mshl.vert2.size >= +1):
     #--------------------------------- copy buffer for VERT2
         msht.vert2 = get_ptr_t(
-            mshl.vert2, jigsaw_msh_t.VERT2_t)
-
-        ptrl = ct.byref(mshl.vert2)
-
-        JLIB.jigsaw_free_vert2(ptrl)
+            mshl.vert2, jigsaw_msh_t.VERT2_t,
+            JLIB.jigsaw_free_vert2, owns)
 
     if (mshl.vert3.size >= +1):
     #--------------------------------- copy buffer for VERT3
         msht.vert3 = get_ptr_t(
-            mshl.vert3, jigsaw_msh_t.VERT3_t)
-
-        ptrl = ct.byref(mshl.vert3)
-
-        JLIB.jigsaw_free_vert3(ptrl)
+            mshl.vert3, jigsaw_msh_t.VERT3_t,
+            JLIB.jigsaw_free_vert3, owns)
 
     if (mshl.seed2.size >= +1):
     #--------------------------------- copy buffer for SEED2
         msht.seed2 = get_ptr_t(
-            mshl.seed2, jigsaw_msh_t.VERT2_t)
-
-        ptrl = ct.byref(mshl.seed2)
-
-        JLIB.jigsaw_free_vert2(ptrl)
+            mshl.seed2, jigsaw_msh_t.VERT2_t,
+            JLIB.jigsaw_free_vert2, owns)
 
     if (mshl.seed3.size >= +1):
     #--------------------------------- copy buffer for SEED3
         msht.seed3 = get_ptr_t(
-            mshl.seed3, jigsaw_msh_t.VERT3_t)
-
-        ptrl = ct.byref(mshl.seed3)
-
-        JLIB.jigsaw_free_vert3(ptrl)
+            mshl.seed3, jigsaw_msh_t.VERT3_t,
+            JLIB.jigsaw_free_vert3, owns)
 
     if (mshl.power.size >= +1):
     #--------------------------------- copy buffer for POWER
         msht.power = get_ptr_t(
-            mshl.power, jigsaw_msh_t.REALS_t)
-
-        ptrl = ct.byref(mshl.power)
-
-        JLIB.jigsaw_free_reals(ptrl)
+            mshl.power, jigsaw_msh_t.REALS_t,
+            JLIB.jigsaw_free_reals, owns)
 
     if (mshl.edge2.size >= +1):
     #--------------------------------- copy buffer for EDGE2
         msht.edge2 = get_ptr_t(
-            mshl.edge2, jigsaw_msh_t.EDGE2_t)
-
-        ptrl = ct.byref(mshl.edge2)
-
-        JLIB.jigsaw_free_edge2(ptrl)
+            mshl.edge2, jigsaw_msh_t.EDGE2_t,
+            JLIB.jigsaw_free_edge2, owns)
 
     if (mshl.tria3.size >= +1):
     #--------------------------------- copy buffer for TRIA3
         msht.tria3 = get_ptr_t(
-            mshl.tria3, jigsaw_msh_t.TRIA3_t)
-
-        ptrl = ct.byref(mshl.tria3)
-
-        JLIB.jigsaw_free_tria3(ptrl)
+            mshl.tria3, jigsaw_msh_t.TRIA3_t,
+            JLIB.jigsaw_free_tria3, owns)
 
     if (mshl.quad4.size >= +1):
     #--------------------------------- copy buffer for QUAD4
         msht.quad4 = get_ptr_t(
-            mshl.quad4, jigsaw_msh_t.QUAD4_t)
-
-        ptrl = ct.byref(mshl.quad4)
-
-        JLIB.jigsaw_free_quad4(ptrl)
+            mshl.quad4, jigsaw_msh_t.QUAD4_t,
+            JLIB.jigsaw_free_quad4, owns)
 
     if (mshl.tria4.size >= +1):
     #--------------------------------- copy buffer for TRIA4
         msht.tria4 = get_ptr_t(
-            mshl.tria4, jigsaw_msh_t.TRIA4_t)
-
-        ptrl = ct.byref(mshl.tria4)
-
-        JLIB.jigsaw_free_tria4(ptrl)
+            mshl.tria4, jigsaw_msh_t.TRIA4_t,
+            JLIB.jigsaw_free_tria4, owns)
 
     if (mshl.hexa8.size >= +1):
     #--------------------------------- copy buffer for HEXA8
         msht.hexa8 = get_ptr_t(
-            mshl.hexa8, jigsaw_msh_t.HEXA8_t)
-
-        ptrl = ct.byref(mshl.hexa8)
-
-        JLIB.jigsaw_free_hexa8(ptrl)
+            mshl.hexa8, jigsaw_msh_t.HEXA8_t,
+            JLIB.jigsaw_free_hexa8, owns)
 
     if (mshl.wedg6.size >= +1):
     #--------------------------------- copy buffer for WEDG6
         msht.wedg6 = get_ptr_t(
-            mshl.wedg6, jigsaw_msh_t.WEDG6_t)
-
-        ptrl = ct.byref(mshl.wedg6)
-
-        JLIB.jigsaw_free_wedg6(ptrl)
+            mshl.wedg6, jigsaw_msh_t.WEDG6_t,
+            JLIB.jigsaw_free_wedg6, owns)
 
     if (mshl.pyra5.size >= +1):
     #--------------------------------- copy buffer for PYRA5
         msht.pyra5 = get_ptr_t(
-            mshl.pyra5, jigsaw_msh_t.PYRA5_t)
-
-        ptrl = ct.byref(mshl.pyra5)
-
-        JLIB.jigsaw_free_pyra5(ptrl)
+            mshl.pyra5, jigsaw_msh_t.PYRA5_t,
+            JLIB.jigsaw_free_pyra5, owns)
 
     return
 
 
-def jigsaw(opts, geom, mesh, init=None, hfun=None):
+def jigsaw(opts, geom, mesh, init=None, hfun=None,
+           copy=True):
     """
     JIGSAW API-lib. interface to JIGSAW.
 
     JIGSAW(OPTS,GEOM,MESH,INIT=None,
-                          HFUN=None)
+                          HFUN=None,COPY=True)
 
     Call the JIGSAW mesh generator using the config. options
     specified in the OPTS structure.
@@ -694,8 +663,21 @@ def jigsaw(opts, geom, mesh, init=None, hfun=None):
     OPTS is a user-defined set of meshing options. See JIG_t
     for details.
 
+    If enabled, outputs are re-used from the result cache,
+    see CACHE.ENABLE.
+
+    If not COPY, arrays in MESH are zero-copy views onto the
+    lib.'s output buffers, which are freed once the last view
+    is deleted, rather than being copied out and freed.
+
     """
 
+    #--------------------------------- re-use output, if any
+
+    ckey = cache.libkey(opts, geom, init, hfun)
+
+    if (cache.fetchmsh(ckey, mesh)): return
+
     #--------------------------------- set-up ctypes objects
 
     ojig = libsaw_jig_t()
@@ -737,16 +719,81 @@ def jigsaw(opts, geom, mesh, init=None, hfun=None):
 
     #--------------------------------- copy buffers to MSH_t
 
-    get_msh_t(mesh, mmsh)
+    get_msh_t(mesh, mmsh, copy)
+
+    cache.storemsh(ckey, mesh)
 
     return
 
 
-def tripod(opts, init, tria, geom=None):
+def quad4ok():
+    """
+    QUAD4OK: return True if JIGSAW's API-lib. returns QUAD4
+    cells intact.
+
+    OKAY = QUAD4OK()
+
+    Builds of the lib. without the SAVE_QUAD4 fix write node
+    2 of each QUAD4 cell twice, and node 3 never, such that
+    the last index of each cell is 0. The lib. is probed
+    once, passing two QUAD4 cells through JIGSAW unchanged,
+    and the result cached, see RESOLVE.RESET.
+
+    """
+    ckey = ("quad4", str(resolve.findlib()))
+    if (ckey in resolve.CACHE):
+        return resolve.CACHE[ckey]
+
+    opts = jigsaw_jig_t()
+    geom = jigsaw_msh_t()
+    init = jigsaw_msh_t()
+    mesh = jigsaw_msh_t()
+
+    geom.mshID = "ellipsoid-mesh"
+    geom.radii = np.full(3, 1., dtype=geom.REALS_t)
+
+#---------------------------- 2 cells, distinct last nodes
+    init.mshID = "euclidean-mesh"
+    init.vert3 = np.zeros(+6, dtype=init.VERT3_t)
+    init.vert3["coord"] = S2toR3(geom.radii, np.array([
+        (+0.0, -0.3), (+0.5, -0.3), (+1.0, -0.3),
+        (+0.0, +0.3), (+0.5, +0.3), (+1.0, +0.3)]))
+
+    init.vert3["IDtag"] = -1
+
+    init.quad4 = np.array([
+        ((0, 1, 4, 3), 0),
+        ((1, 2, 5, 4), 1)], dtype=init.QUAD4_t)
+
+    opts.mesh_dims = +2
+    opts.mesh_iter = +0
+    opts.optm_iter = +0
+    opts.hfun_hmax = 1.E+01
+    opts.verbosity = +0
+
+    jigsaw(opts, geom, mesh, init)
+
+    okay = mesh.quad4 is not None and \
+        mesh.quad4.size == init.quad4.size
+
+    if (okay):
+    #------------------------ same cells, by coord's per tag
+        cell = mesh.quad4[np.argsort(mesh.quad4["IDtag"])]
+
+        okay = np.allclose(
+            mesh.point["coord"][cell["index"]],
+            init.point["coord"][init.quad4["index"]])
+
+    resolve.CACHE[ckey] = bool(okay)
+
+    return resolve.CACHE[ckey]
+
+
+def tripod(opts, init, tria, geom=None, copy=True):
     """
     TRIPOD API-lib. interface to TRIPOD.
 
-    TRIPOD(OPTS,INIT,TRIA,GEOM=None)
+    TRIPOD(OPTS,INIT,TRIA,GEOM=None,COPY=True)
 
     Call the TRIPOD tessellation util. using the config. opt
     specified in the OPTS structure.
@@ -754,6 +801,8 @@ def tripod(opts, init, tria, geom=None):
     OPTS is a user-defined set of meshing options. See JIG_t
     for details.
 
+    See JIGSAW for the COPY option.
+
     """
 
     #--------------------------------- set-up ctypes objects
@@ -791,7 +840,7 @@ def tripod(opts, init, tria, geom=None):
 
     #--------------------------------- copy buffers to MSH_t
 
-    get_msh_t(tria, tmsh)
+    get_msh_t(tria, tmsh, copy)
 
     return
 
@@ -1,7 +1,16 @@
 
-from pathlib import Path
 from jigsawpy.jig_t import jigsaw_jig_t
 
+from jigsawpy import zipio
+
+
+def loadbool(stag):
+    """
+    LOADBOOL: parse a "TRUE" / "FALSE" value from file.
+
+    """
+    return stag.strip().upper() in ["TRUE", "1"]
+
 
 def loadjig(name, opts):
     """
@@ -15,6 +24,9 @@ def loadjig(name, opts):
     Data in OPTS is loaded on-demand -- any objects included
     in the file will be read.
 
+    Compressed *.jig.gz, *.jig.xz and *.jig.bz2 files are
+    decompressed on the fly. See ZIPIO for details.
+
     """
 
     if (not isinstance(name, str)):
@@ -23,7 +35,7 @@ def loadjig(name, opts):
     if (not isinstance(opts, jigsaw_jig_t)):
         raise TypeError("Incorrect type: OPTS.")
 
-    with Path(name).open("r") as fptr:
+    with zipio.zipopen(name, "r") as fptr:
         while (True):
 
         #----------------------- get the next line from file
@@ -67,7 +79,7 @@ def loadjig(name, opts):
                     opts.geom_seed = int(ltag[1])
 
                 if (item == "GEOM_FEAT"):
-                    opts.geom_feat = bool(ltag[1])
+                    opts.geom_feat = loadbool(ltag[1])
 
                 if (item == "GEOM_PHI1"):
                     opts.geom_phi1 = float(ltag[1])
@@ -107,9 +119,9 @@ def loadjig(name, opts):
                     opts.mesh_dims = int(ltag[1])
 
                 if (item == "MESH_TOP1"):
-                    opts.mesh_top1 = bool(ltag[1])
+                    opts.mesh_top1 = loadbool(ltag[1])
                 if (item == "MESH_TOP2"):
-                    opts.mesh_top2 = bool(ltag[1])
+                    opts.mesh_top2 = loadbool(ltag[1])
 
                 if (item == "MESH_SIZ1"):
                     opts.mesh_siz1 = float(ltag[1])
@@ -161,13 +173,13 @@ def loadjig(name, opts):
                     opts.optm_qlim = float(ltag[1])
 
                 if (item == "OPTM_ZIP_"):
-                    opts.optm_zip_ = bool(ltag[1])
+                    opts.optm_zip_ = loadbool(ltag[1])
                 if (item == "OPTM_DIV_"):
-                    opts.optm_div_ = bool(ltag[1])
+                    opts.optm_div_ = loadbool(ltag[1])
                 if (item == "OPTM_TRIA"):
-                    opts.optm_tria = bool(ltag[1])
+                    opts.optm_tria = loadbool(ltag[1])
                 if (item == "OPTM_DUAL"):
-                    opts.optm_dual = bool(ltag[1])
+                    opts.optm_dual = loadbool(ltag[1])
 
             else:
         #----------------------- reached end-of-file: done!!
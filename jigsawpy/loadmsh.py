@@ -1,10 +1,241 @@
-
-from pathlib import Path
+import os
 import numpy as np
 from numpy.lib import recfunctions as rfn
 
+from concurrent.futures import ProcessPoolExecutor
+
 from jigsawpy.msh_t import jigsaw_msh_t
 
+from jigsawpy import msh_b, zipio
+
+#------------------------ map line-breaks to item separators
+TRANS = bytes.maketrans(b"\n", b";")
+
+#------------------------ data segments that can be selected
+SECTS = [
+    "POINT", "SEEDS", "POWER", "VALUE", "SLOPE",
+    "EDGE2", "TRIA3", "QUAD4", "TRIA4", "HEXA8",
+    "PYRA5", "WEDG6", "BOUND", "COORD"
+]
+
+
+class scanner(object):
+#------------------------------ buffered line-block scanner
+    def __init__(self, fptr, size=2 ** 20, root=""):
+        self.fptr = fptr
+        self.size = size
+        self.root = root                # dir. for sidecars
+
+        self.data = b""                 # current byte block
+        self.head = +0                  # pos. within block
+        self.base = +0                  # file pos. of block
+
+    def tell(self):
+        """
+        TELL: return the file offset of the next unread byte.
+
+        """
+        return self.base + self.head
+
+    def fill(self):
+        """
+        FILL: replace the current byte block with the next.
+
+        """
+        self.base = self.base + len(self.data)
+        self.data = self.fptr.read(self.size)
+        self.head = +0
+
+        return len(self.data) != +0
+
+    def peek(self, nbyte):
+        """
+        PEEK: return the next NBYTE bytes, without advancing
+        the file position.
+
+        """
+        if (len(self.data) - self.head < nbyte):
+            self.base = self.base + self.head
+            self.data = self.data[self.head:] + \
+                self.fptr.read(self.size)
+            self.head = +0
+
+        return self.data[self.head:self.head + nbyte]
+
+    def read(self, nbyte):
+        """
+        READ: return the next NBYTE bytes from file.
+
+        Any bytes beyond the current block are read from FPTR
+        directly, so that large reads are not re-buffered.
+
+        """
+        part = [self.data[self.head:self.head + nbyte]]
+
+        self.head = self.head + len(part[0])
+        nbyte = nbyte - len(part[0])
+
+        if (nbyte > +0):
+            self.base = self.base + len(self.data)
+            self.data = b""
+            self.head = +0
+
+        while (nbyte > +0):
+            data = self.fptr.read(nbyte)
+
+            if (len(data) == +0): break
+
+            part.append(data)
+
+            self.base = self.base + len(data)
+            nbyte = nbyte - len(data)
+
+        return b"".join(part)
+
+    def seek(self, fpos):
+        """
+        SEEK: advance to the file offset FPOS. Seeks are fwd.
+        only, so that non-seekable streams can be scanned.
+
+        """
+        skip = fpos - self.tell()
+
+        if (skip < +0):
+            raise ValueError("Invalid seek: " + str(fpos))
+
+        while (skip > +0):
+            size = len(self.read(min(skip, self.size)))
+
+            if (size == +0): break
+
+            skip = skip - size
+
+        return
+
+    def readline(self):
+        """
+        READLINE: return the next line (as bytes) from file.
+
+        """
+        part = []
+        while (True):
+            npos = self.data.find(b"\n", self.head)
+
+            if (npos >= +0):
+                part.append(self.data[self.head:npos + 1])
+                self.head = npos + 1
+                break
+
+            part.append(self.data[self.head:])
+            self.head = len(self.data)
+
+            if (not self.fill()): break
+
+        return b"".join(part)
+
+    def readrows(self, nrow):
+        """
+        READROWS: return the next NROW lines as a bytes obj.
+
+        """
+        part = []
+
+        self.scanrows(nrow, part)
+
+        return b"".join(part)
+
+    def skiprows(self, nrow):
+        """
+        SKIPROWS: advance past the next NROW lines in file.
+
+        """
+        self.scanrows(nrow, None)
+
+        return
+
+    def scanrows(self, nrow, part):
+        """
+        SCANROWS: scan the next NROW lines, appending blocks
+        to PART, unless PART=None.
+
+        Lines are located by counting line-breaks across the
+        raw byte blocks, with no per-line python overhead.
+
+        """
+        have = +0
+        while (nrow > have):
+            nnew = self.data.count(b"\n", self.head)
+
+            if (nnew >= nrow - have):
+    #--------------------------- locate the last line-break
+                byte = np.frombuffer(
+                    self.data, dtype=np.uint8)
+
+                npos = self.head + np.flatnonzero(
+                    byte[self.head:] == ord("\n")
+                )[nrow - have - 1]
+
+                if (part is not None):
+                    part.append(
+                        self.data[self.head:npos + 1])
+
+                self.head = npos + 1
+                break
+
+            if (part is not None):
+                part.append(self.data[self.head:])
+
+            self.head = len(self.data)
+
+            have = have + nnew
+
+            if (not self.fill()): break
+
+        return
+
+
+def loadrows(fptr, data, vnum, kind):
+    """
+    LOADROWS: load the next rows of DATA from file in bulk.
+
+    Each row contains VNUM items of type KIND. Rows are read
+    as blocks of bytes and parsed directly into DATA, such
+    that memory use is bounded by the size of the output.
+
+    """
+    lnum = data.shape[0]
+
+    rmax = 2 ** 16; next = 0
+
+    while (next < lnum):
+
+        nrow = min(rmax, lnum - next)
+        nend = next + nrow
+
+        text = fptr.readrows(nrow).translate(TRANS)
+
+        vals = np.fromstring(text, dtype=kind, sep=";")
+
+        if (vals.size != nrow * vnum):
+            raise ValueError(
+                "Invalid data: expected " +
+                str(nrow * vnum) + " items, found " +
+                str(vals.size))
+
+        vals = np.reshape(vals, (nrow, vnum), order="C")
+
+        if (data.dtype.names is not None):
+            data[next:nend] = \
+                rfn.unstructured_to_structured(
+                    vals, dtype=data.dtype, align=True)
+        else:
+            data[next:nend] = np.reshape(
+                vals, data[next:nend].shape)
+
+        next = nend
+
+    return data
+
 
 def loadmshid(mesh, fptr, ltag):
     """
@@ -52,22 +283,9 @@ def loadvert2(fptr, ltag):
     """
     lnum = int(ltag[1]); vnum = 3
 
-    data = []
-    for line in range(lnum):
-        data.append(fptr.readline())
-
-    data = " ".join(data).replace("\n", ";")
-
-    vert = np.fromstring(
-        data, dtype=np.float64, sep=";")
+    vert = np.empty(lnum, dtype=jigsaw_msh_t.VERT2_t)
 
-    vert = np.reshape(
-        vert, (lnum, vnum, ), order="C")
-
-    vert = rfn.unstructured_to_structured(
-        vert, dtype=jigsaw_msh_t.VERT2_t, align=True)
-
-    return vert
+    return loadrows(fptr, vert, vnum, np.float64)
 
 
 def loadvert3(fptr, ltag):
@@ -77,22 +295,9 @@ def loadvert3(fptr, ltag):
     """
     lnum = int(ltag[1]); vnum = 4
 
-    data = []
-    for line in range(lnum):
-        data.append(fptr.readline())
-
-    data = " ".join(data).replace("\n", ";")
+    vert = np.empty(lnum, dtype=jigsaw_msh_t.VERT3_t)
 
-    vert = np.fromstring(
-        data, dtype=np.float64, sep=";")
-
-    vert = np.reshape(
-        vert, (lnum, vnum, ), order="C")
-
-    vert = rfn.unstructured_to_structured(
-        vert, dtype=jigsaw_msh_t.VERT3_t, align=True)
-
-    return vert
+    return loadrows(fptr, vert, vnum, np.float64)
 
 
 def loadpoint(mesh, fptr, ltag):
@@ -139,19 +344,72 @@ def loadarray(fptr, ltag, kind):
     lnum = int(vtag[0])
     vnum = int(vtag[1])
 
-    data = []
-    for line in range(lnum):
-        data.append(fptr.readline())
+    if (sidecar(ltag) is not None):
+    #-- raw data in a sidecar file: map, not parse
+        return loadside(fptr, ltag, kind)
+
+    vals = np.empty((lnum, vnum), dtype=kind)
+
+    return loadrows(fptr, vals, vnum, kind)
+
+
+def sidecar(ltag):
+    """
+    SIDECAR: return the raw data file named by the section
+    header LTAG, or None if the data is inline.
+
+    Sidecars are plain file names, found alongside the *.msh
+    file. Names with any dir. part, i.e. absolute paths or
+    "..", are rejected, so that a file can't map data from
+    elsewhere on disk.
+
+    """
+    vtag = ltag[1].split(";")
+
+    if (len(vtag) < 3): return None
+
+    name = vtag[2].strip()
 
-    data = " ".join(data).replace("\n", ";")
+    if (name in ["", ".", ".."] or os.path.isabs(name) or
+            "/" in name or "\\" in name or
+            os.path.basename(name) != name):
+        raise ValueError("Invalid sidecar: " + name)
+
+    return name
+
+
+def loadside(fptr, ltag, kind):
+    """
+    LOADSIDE: load a data segment written to a raw sidecar
+    file, via SAVEMSH(..., SIDECAR=True), as a copy-on-write
+    NP.MEMMAP. Sidecars are found relative to FPTR.ROOT.
+
+    """
+    vtag = ltag[1].split(";")
+
+    dims = (int(vtag[0]), int(vtag[1]))
+    kind = np.dtype(kind).newbyteorder("<")
+
+    if (int(np.prod(dims)) == +0):
+        return np.empty(dims, dtype=kind)
+
+    return np.memmap(
+        os.path.join(fptr.root, sidecar(ltag)),
+        dtype=kind, mode="c", shape=dims)
+
+
+def rootdir(name):
+    """
+    ROOTDIR: return the directory of NAME, against which any
+    sidecar files are found, or "" for unnamed streams.
 
-    vals = np.fromstring(
-        data, dtype=kind, sep=";")
+    """
+    if (zipio.isstream(name)):
+        name = getattr(name, "name", "")
 
-    vals = np.reshape(
-        vals, (lnum, vnum, ), order="F")
+        if (not isinstance(name, str)): return ""
 
-    return vals
+    return os.path.dirname(name)
 
 
 def loadpower(mesh, fptr, ltag):
@@ -184,29 +442,25 @@ def loadslope(mesh, fptr, ltag):
     return
 
 
-def loadedge2(mesh, fptr, ltag):
+def loadcells(fptr, ltag, vnum, kind):
     """
-    LOADEDGE2: load the EDGE2 data segment from file.
+    LOADCELLS: load the CELLS data segment from file.
 
     """
-    lnum = int(ltag[1]); vnum = 3
+    lnum = int(ltag[1])
 
-    data = []
-    for line in range(lnum):
-        data.append(fptr.readline())
+    cell = np.empty(lnum, dtype=kind)
 
-    data = " ".join(data).replace("\n", ";")
+    return loadrows(fptr, cell, vnum, np.int32)
 
-    cell = np.fromstring(
-        data, dtype=np.int32, sep=";")
 
-    cell = np.reshape(
-        cell, (lnum, vnum), order="C")
-
-    cell = rfn.unstructured_to_structured(
-        cell, dtype=jigsaw_msh_t.EDGE2_t, align=True)
+def loadedge2(mesh, fptr, ltag):
+    """
+    LOADEDGE2: load the EDGE2 data segment from file.
 
-    mesh.edge2 = cell
+    """
+    mesh.edge2 = loadcells(
+        fptr, ltag, 3, jigsaw_msh_t.EDGE2_t)
 
     return
 
@@ -216,24 +470,8 @@ def loadtria3(mesh, fptr, ltag):
     LOADTRIA3: load the TRIA3 data segment from file.
 
     """
-    lnum = int(ltag[1]); vnum = 4
-
-    data = []
-    for line in range(lnum):
-        data.append(fptr.readline())
-
-    data = " ".join(data).replace("\n", ";")
-
-    cell = np.fromstring(
-        data, dtype=np.int32, sep=";")
-
-    cell = np.reshape(
-        cell, (lnum, vnum), order="C")
-
-    cell = rfn.unstructured_to_structured(
-        cell, dtype=jigsaw_msh_t.TRIA3_t, align=True)
-
-    mesh.tria3 = cell
+    mesh.tria3 = loadcells(
+        fptr, ltag, 4, jigsaw_msh_t.TRIA3_t)
 
     return
 
@@ -243,24 +481,8 @@ def loadquad4(mesh, fptr, ltag):
     LOADUAD4: load the QUAD4 data segment from file.
 
     """
-    lnum = int(ltag[1]); vnum = 5
-
-    data = []
-    for line in range(lnum):
-        data.append(fptr.readline())
-
-    data = " ".join(data).replace("\n", ";")
-
-    cell = np.fromstring(
-        data, dtype=np.int32, sep=";")
-
-    cell = np.reshape(
-        cell, (lnum, vnum), order="C")
-
-    cell = rfn.unstructured_to_structured(
-        cell, dtype=jigsaw_msh_t.QUAD4_t, align=True)
-
-    mesh.quad4 = cell
+    mesh.quad4 = loadcells(
+        fptr, ltag, 5, jigsaw_msh_t.QUAD4_t)
 
     return
 
@@ -270,24 +492,8 @@ def loadtria4(mesh, fptr, ltag):
     LOADTRIA4: load the TRIA4 data segment from file.
 
     """
-    lnum = int(ltag[1]); vnum = 5
-
-    data = []
-    for line in range(lnum):
-        data.append(fptr.readline())
-
-    data = " ".join(data).replace("\n", ";")
-
-    cell = np.fromstring(
-        data, dtype=np.int32, sep=";")
-
-    cell = np.reshape(
-        cell, (lnum, vnum), order="C")
-
-    cell = rfn.unstructured_to_structured(
-        cell, dtype=jigsaw_msh_t.TRIA4_t, align=True)
-
-    mesh.tria4 = cell
+    mesh.tria4 = loadcells(
+        fptr, ltag, 5, jigsaw_msh_t.TRIA4_t)
 
     return
 
@@ -297,24 +503,8 @@ def loadhexa8(mesh, fptr, ltag):
     LOADHEXA8: load the HEXA8 data segment from file.
 
     """
-    lnum = int(ltag[1]); vnum = 9
-
-    data = []
-    for line in range(lnum):
-        data.append(fptr.readline())
-
-    data = " ".join(data).replace("\n", ";")
-
-    cell = np.fromstring(
-        data, dtype=np.int32, sep=";")
-
-    cell = np.reshape(
-        cell, (lnum, vnum), order="C")
-
-    cell = rfn.unstructured_to_structured(
-        cell, dtype=jigsaw_msh_t.HEXA8_t, align=True)
-
-    mesh.hexa8 = cell
+    mesh.hexa8 = loadcells(
+        fptr, ltag, 9, jigsaw_msh_t.HEXA8_t)
 
     return
 
@@ -324,24 +514,8 @@ def loadpyra5(mesh, fptr, ltag):
     LOADPYRA5: load the PYRA5 data segment from file.
 
     """
-    lnum = int(ltag[1]); vnum = 6
-
-    data = []
-    for line in range(lnum):
-        data.append(fptr.readline())
-
-    data = " ".join(data).replace("\n", ";")
-
-    cell = np.fromstring(
-        data, dtype=np.int32, sep=";")
-
-    cell = np.reshape(
-        cell, (lnum, vnum), order="C")
-
-    cell = rfn.unstructured_to_structured(
-        cell, dtype=jigsaw_msh_t.PYRA5_t, align=True)
-
-    mesh.pyra5 = cell
+    mesh.pyra5 = loadcells(
+        fptr, ltag, 6, jigsaw_msh_t.PYRA5_t)
 
     return
 
@@ -351,24 +525,8 @@ def loadwedg6(mesh, fptr, ltag):
     LOADWEDG6: load the WEDG6 data segment from file.
 
     """
-    lnum = int(ltag[1]); vnum = 7
-
-    data = []
-    for line in range(lnum):
-        data.append(fptr.readline())
-
-    data = " ".join(data).replace("\n", ";")
-
-    cell = np.fromstring(
-        data, dtype=np.int32, sep=";")
-
-    cell = np.reshape(
-        cell, (lnum, vnum), order="C")
-
-    cell = rfn.unstructured_to_structured(
-        cell, dtype=jigsaw_msh_t.WEDG6_t, align=True)
-
-    mesh.wedg6 = cell
+    mesh.wedg6 = loadcells(
+        fptr, ltag, 7, jigsaw_msh_t.WEDG6_t)
 
     return
 
@@ -378,24 +536,8 @@ def loadbound(mesh, fptr, ltag):
     LOADBOUND: load the BOUND data segment from file.
 
     """
-    lnum = int(ltag[1]); vnum = 3
-
-    data = []
-    for line in range(lnum):
-        data.append(fptr.readline())
-
-    data = " ".join(data).replace("\n", ";")
-
-    bnds = np.fromstring(
-        data, dtype=np.int32, sep=";")
-
-    bnds = np.reshape(
-        bnds, (lnum, vnum), order="C")
-
-    bnds = rfn.unstructured_to_structured(
-        bnds, dtype=jigsaw_msh_t.BOUND_t, align=True)
-
-    mesh.bound = bnds
+    mesh.bound = loadcells(
+        fptr, ltag, 3, jigsaw_msh_t.BOUND_t)
 
     return
 
@@ -412,46 +554,94 @@ def loadcoord(mesh, fptr, ltag):
 
     mesh.ndims = max(mesh.ndims, idim)
 
-    data = []
-    for line in range(lnum):
-        data.append(fptr.readline())
-
-    data = " ".join(data).replace("\n", ";")
+    vals = np.empty(lnum, dtype=np.float64)
 
-    vals = np.fromstring(
-        data, dtype=np.float64, sep=";")
+    vals = loadrows(fptr, vals, 1, np.float64)
 
     if   (idim == +1):
-        mesh.xgrid = np.reshape(
-            vals, (lnum, ), order="C")
+        mesh.xgrid = vals
 
     elif (idim == +2):
-        mesh.ygrid = np.reshape(
-            vals, (lnum, ), order="C")
+        mesh.ygrid = vals
 
     elif (idim == +3):
-        mesh.zgrid = np.reshape(
-            vals, (lnum, ), order="C")
+        mesh.zgrid = vals
 
     return
 
 
-def loadlines(mesh, fptr, line):
+def loadsize(mesh, kind, ltag):
+    """
+    LOADSIZE: return the MSH_t field, shape and dtype of the
+    data segment described by the header LTAG.
+
+    """
+    vtag = ltag[1].split(";")
+
+    if (kind in ["POINT", "SEEDS"]):
+        if   (mesh.ndims == +2):
+            dtyp = jigsaw_msh_t.VERT2_t
+        elif (mesh.ndims == +3):
+            dtyp = jigsaw_msh_t.VERT3_t
+        else:
+            raise ValueError("Invalid NDIMS: " + str(ltag))
+
+        name = {"POINT": "vert", "SEEDS": "seed"}[kind]
+
+        return (name + str(mesh.ndims),
+                (int(vtag[0]), ), np.dtype(dtyp))
+
+    if (kind in ["POWER", "VALUE", "SLOPE"]):
+        if (kind == "POWER"):
+            dtyp = jigsaw_msh_t.REALS_t
+        else:
+            dtyp = jigsaw_msh_t.FLT32_t
+
+        return (kind.lower(),
+                (int(vtag[0]), int(vtag[1])), np.dtype(dtyp))
+
+    if (kind == "COORD"):
+        name = ["xgrid", "ygrid", "zgrid"][int(vtag[0]) - 1]
+
+        return (name,
+                (int(vtag[1]), ), np.dtype(jigsaw_msh_t.REALS_t))
+
+    if (kind in SECTS):
+        dtyp = getattr(jigsaw_msh_t, kind + "_t")
+
+        return (kind.lower(),
+                (int(vtag[0]), ), np.dtype(dtyp))
+
+    raise ValueError("Invalid section: " + str(ltag))
+
+
+def loadlines(mesh, fptr, line, keep=None):
     """
     LOADLINES: load the next non-null line from file.
 
+    Data segments not in KEEP are skipped, if KEEP is given.
+
     """
 
     #------------------------------ skip any 'comment' lines
 
     line = line.strip()
-    if (line[0] != "#"):
+    if (len(line) != +0 and line[0] != "#"):
 
     #------------------------------ split about '=' charact.
         ltag = line.split("=")
         kind = ltag[0].upper().strip()
 
-        if   (kind == "MSHID"):
+        if (keep is not None and
+                kind in SECTS and kind not in keep):
+
+    #----------------------------------- skip unwanted data.
+            _, dims, _ = loadsize(mesh, kind, ltag)
+
+            if (sidecar(ltag) is None):
+                fptr.skiprows(dims[0])
+
+        elif (kind == "MSHID"):
 
     #----------------------------------- parse MSHID struct.
             loadmshid(mesh, fptr, ltag)
@@ -566,7 +756,7 @@ def sanitise_grid(mesh, data):
 
             nprd = (num1 * num2)
 
-            nval = mesh.value.size // nprd
+            nval = data.size // nprd
 
             size = (num1, num2, nval)
 
@@ -593,7 +783,7 @@ def sanitise_grid(mesh, data):
 
             nprd = (num1 * num2 * num3)
 
-            nval = mesh.value.size // nprd
+            nval = data.size // nprd
 
             size = (num1, num2, num3, nval)
 
@@ -603,11 +793,447 @@ def sanitise_grid(mesh, data):
     return data
 
 
-def loadmsh(name, mesh):
+def loadhead(fptr):
+    """
+    LOADHEAD: load the header and section table of a binary
+    MSH obj. from file.
+
+    """
+    head = np.frombuffer(fptr.read(
+        msh_b.HEAD_t.itemsize), dtype=msh_b.HEAD_t)
+
+    if (head.size != +1 or
+            head["magic"][0] != msh_b.MAGIC):
+        raise ValueError("Invalid MSH_B header.")
+
+    if (head["nvers"][0] > msh_b.NVERS):
+        raise ValueError("Unsupported MSH_B version.")
+
+    nsec = int(head["nsect"][0])
+
+    slot = np.frombuffer(fptr.read(
+        msh_b.SLOT_t.itemsize * nsec), dtype=msh_b.SLOT_t)
+
+    if (slot.size != nsec):
+        raise ValueError("Invalid MSH_B sections.")
+
+    return head[0], slot
+
+
+def loadslot(item):
+    """
+    LOADSLOT: return the field, tag, shape, dtype and order
+    for a binary section table entry.
+
+    """
+    field = item["field"].decode("ascii")
+    order = item["order"].decode("ascii")
+
+    if (field not in msh_b.FIELD):
+        raise ValueError("Invalid MSH_B field: " + field)
+
+    if   (field in ["vert2", "vert3"]):
+        stag = "POINT"
+    elif (field in ["seed2", "seed3"]):
+        stag = "SEEDS"
+    elif (field in ["xgrid", "ygrid", "zgrid"]):
+        stag = "COORD"
+    else:
+        stag = field.upper()
+
+    kind = msh_b.typeof(item["kinds"].decode("ascii"))
+
+    dims = tuple(
+        int(size) for size in
+        item["shape"][:int(item["ndims"])])
+
+    return field, stag, dims, kind, order
+
+
+def loadpart(fptr, name, item, mmap):
+    """
+    LOADPART: load a binary section from file, via mmap if
+    MMAP=True, or otherwise read from the SCANNER FPTR.
+
+    """
+    field, stag, dims, kind, order = loadslot(item)
+
+    if (int(np.prod(dims)) == +0):
+        return np.empty(dims, dtype=kind, order=order)
+
+    if (mmap):
+        return np.memmap(
+            name, dtype=kind, mode="c",
+            offset=int(item["start"]),
+            shape=dims, order=order)
+
+#-- compressed files/streams can't be mapped: read a copy
+    fptr.seek(int(item["start"]))
+
+    data = np.frombuffer(bytearray(
+        fptr.read(int(item["bytes"]))), dtype=kind)
+
+    if (data.size != int(np.prod(dims))):
+        raise ValueError("Invalid MSH_B section: " + field)
+
+    return data.reshape(dims, order=order)
+
+
+def mappable(name):
+    """
+    MAPPABLE: return TRUE if NAME is an uncompressed file on
+    disk, that can be accessed via NP.MEMMAP.
+
+    """
+    if (zipio.isstream(name)): return False
+
+    return zipio.zipped(name) == ""
+
+
+def loadbins(mesh, fptr, name, keep=None):
+    """
+    LOADBINS: load a binary MSH obj. from file via mmap.
+
+    Each section is returned as a copy-on-write NP.MEMMAP
+    onto the file, so that no data is read until accessed.
+    Sections not in KEEP are skipped, if KEEP is given.
+    Compressed files and streams are read into memory
+    instead. See MSH_B for a description of the file layout.
+
+    """
+    mmap = mappable(name)
+
+    head, slot = loadhead(fptr)
+
+    mesh.mshID = head["mshID"].decode("ascii").lower()
+    mesh.ndims = int(head["ndims"])
+
+    for item in slot:
+    #--------------------------- map each section into MESH
+        field, stag, dims, kind, order = loadslot(item)
+
+        if (keep is not None and
+                stag in SECTS and stag not in keep):
+            continue
+
+        setattr(mesh, field,
+                loadpart(fptr, name, item, mmap))
+
+    return
+
+
+def headers(fstr, mesh):
+    """
+    HEADERS: iterate over the data segments of an ASCII MSH
+    file, skipping the data itself.
+
+    for KIND, LTAG, HEAD, START, STOP in HEADERS(FSTR, MESH)
+
+    Yields the tag and split header line of each segment,
+    and the offsets of its header, its data, and the end of
+    its data. MSHID, NDIMS, RADII, etc lines are loaded into
+    MESH as they are found.
+
+    """
+    while (True):
+
+    #--------------------------- get the next line from file
+        head = fstr.tell()
+        line = fstr.readline()
+
+        if (len(line) == +0): break
+
+        line = line.decode("utf-8").strip()
+
+        if (len(line) == +0 or line[0] == "#"):
+            continue
+
+        ltag = line.split("=")
+        kind = ltag[0].upper().strip()
+
+        if (kind not in SECTS):
+    #--------------------------- MSHID, NDIMS, RADII, etc.
+            loadlines(mesh, fstr, line)
+
+            continue
+
+        _, dims, _ = loadsize(mesh, kind, ltag)
+
+        if (kind == "COORD"):
+            mesh.ndims = max(
+                mesh.ndims, int(ltag[1].split(";")[0]))
+
+        start = fstr.tell()
+
+        if (sidecar(ltag) is None):
+            fstr.skiprows(dims[0])
+
+        yield kind, ltag, head, start, fstr.tell()
+
+    return
+
+
+def msh_info(name):
+    """
+    MSH_INFO: scan the section headers of a JIGSAW MSH file.
+
+    INFO = MSH_INFO(NAME)
+
+    Returns a dict. of the MSHID, NDIMS and file KIND, plus
+    a list of the data segments found in the file, where:
+
+    SECT["TAG"] is the section tag, "POINT", "TRIA3", etc,
+    SECT["FIELD"] is the MSH_t attribute it is loaded into,
+    SECT["SHAPE"] is the shape of the data as stored,
+    SECT["DTYPE"] is the dtype of the data,
+    SECT["NBYTES"] is the in-memory size of the data, and
+    SECT["START"] is the byte offset of the data in NAME,
+        (in the decompressed stream, for *.gz files, etc).
+
+    Data written to sidecar files, see SAVEMSH, also has
+    SECT["SIDECAR"], the path of the raw file, with START
+    the offset within it.
+
+    No data is parsed -- ASCII segments are skipped over by
+    counting line-breaks, and only the section table of a
+    binary file is read.
+
+    """
+
+    if (not isinstance(name, str) and
+            not zipio.isstream(name)):
+        raise TypeError("Incorrect type: NAME.")
+
+    mesh = jigsaw_msh_t()
+    info = {"mshID": None, "ndims": +0,
+            "kind": "ascii", "sections": []}
+
+    with zipio.zipopen(name, "rb") as fptr:
+        fstr = scanner(fptr, root=rootdir(name))
+
+        if (fstr.peek(len(msh_b.MAGIC)) == msh_b.MAGIC):
+    #--------------------------- binary container: table!
+            head, slot = loadhead(fstr)
+
+            info["mshID"] = \
+                head["mshID"].decode("ascii").lower()
+            info["ndims"] = int(head["ndims"])
+            info["kind"] = "binary"
+
+            for item in slot:
+                field, stag, dims, kind, _ = loadslot(item)
+
+                info["sections"].append({
+                    "tag": stag, "field": field,
+                    "shape": dims, "dtype": kind,
+                    "nbytes": int(item["bytes"]),
+                    "start": int(item["start"])})
+
+            return info
+
+        for kind, ltag, _, start, _ in headers(fstr, mesh):
+    #--------------------------- record, the data skipped
+            field, dims, dtyp = loadsize(mesh, kind, ltag)
+
+            info["sections"].append({
+                "tag": kind, "field": field,
+                "shape": dims, "dtype": dtyp,
+                "nbytes": int(np.prod(dims)) * dtyp.itemsize,
+                "start": start})
+
+            if (sidecar(ltag) is not None):
+                info["sections"][-1]["start"] = +0
+                info["sections"][-1]["sidecar"] = \
+                    os.path.join(fstr.root, sidecar(ltag))
+
+    info["mshID"] = mesh.mshID.lower()
+    info["ndims"] = mesh.ndims
+
+    return info
+
+
+def rowsize(dtyp, dims):
+    """
+    ROWSIZE: return the no. and type of items in each row of
+    a data segment.
+
+    """
+    if (dtyp.names is None):
+        if (len(dims) > +1): return dims[1], dtyp
+
+        return +1, dtyp
+
+    vnum = sum(
+        int(np.prod(dtyp.fields[item][0].shape))
+        for item in dtyp.names)
+
+    if ("coord" in dtyp.names):
+        return vnum, np.dtype(np.float64)
+
+    return vnum, np.dtype(np.int32)
+
+
+def iter_unroll(data, chunk):
+    """
+    ITER_UNROLL: iterate over the C-ordered grid array DATA
+    in its "unrolled" F order, as N-by-1 blocks of at most
+    CHUNK rows, without copying DATA in full.
+
+    """
+    size = data.size
+
+    for next in range(0, size, chunk):
+        ipos = np.unravel_index(np.arange(
+            next, min(size, next + chunk)),
+            data.shape, order="F")
+
+        yield data[ipos].reshape((-1, 1))
+
+    return
+
+
+def iter_section(name, sect, chunk=2 ** 20):
+    """
+    ITER_SECTION: iterate over a data segment in chunks.
+
+    for DATA in ITER_SECTION(NAME, SECT, CHUNK=2**20): ...
+
+    Yields the rows of the first segment in NAME matching
+    SECT in blocks of at most CHUNK rows. SECT is a section
+    tag, "POINT", "TRIA3", etc, or an MSH_t field, "vert3",
+    "xgrid", etc.
+
+    Each block is an array of the section dtype, VERT3_t,
+    TRIA3_t, etc, or an N-by-M array for POWER, VALUE and
+    SLOPE data. Grid VALUE and SLOPE data is returned in its
+    "unrolled" F order form, as N-by-1 blocks, for text and
+    binary files alike. Memory use is bounded
+    by CHUNK, regardless of the size of the file.
+
+    See MSH_WRITER for the matching chunked writer.
+
+    """
+
+    if (not isinstance(name, str) and
+            not zipio.isstream(name)):
+        raise TypeError("Incorrect type: NAME.")
+
+    if (not isinstance(sect, str)):
+        raise TypeError("Incorrect type: SECT.")
+
+    if (int(chunk) < +1):
+        raise ValueError("Invalid CHUNK: " + str(chunk))
+
+    stag = sect.upper(); ftag = sect.lower()
+
+    with zipio.zipopen(name, "rb") as fptr:
+        fstr = scanner(fptr, root=rootdir(name))
+
+        if (fstr.peek(len(msh_b.MAGIC)) == msh_b.MAGIC):
+    #--------------------------- binary container: slicing!
+            head, slot = loadhead(fstr)
+
+            grid = head["mshID"].decode(
+                "ascii").lower().endswith("-grid")
+
+            for item in slot:
+                field, kind, dims, dtyp, order = \
+                    loadslot(item)
+
+                if (kind != stag and field != ftag):
+                    continue
+
+                if (int(np.prod(dims)) == +0): return
+
+                data = loadpart(
+                    fstr, name, item, mappable(name))
+
+                if (field in ["power", "value", "slope"] and
+                        data.ndim == +1):
+    #--------------------------- N-by-1, as per text files
+                    data = data.reshape((-1, 1))
+
+                elif (field in ["value", "slope"] and grid):
+    #--------------------------- grids: "unrolled" F order
+                    if (order == "F"):
+                        data = data.reshape(
+                            (-1, 1), order="F")
+
+                    else:
+                        yield from iter_unroll(
+                            data, chunk)
+
+                        return
+
+                for next in range(0, data.shape[0], chunk):
+                    yield data[next:next + chunk]
+
+                return
+
+            return
+
+        mesh = jigsaw_msh_t()
+
+        while (True):
+
+    #--------------------------- get the next line from file
+            line = fstr.readline()
+
+            if (len(line) == +0): break
+
+            line = line.decode("utf-8").strip()
+
+            if (len(line) == +0 or line[0] == "#"):
+                continue
+
+            ltag = line.split("=")
+            kind = ltag[0].upper().strip()
+
+            if (kind not in SECTS):
+    #--------------------------- MSHID, NDIMS, RADII, etc.
+                loadlines(mesh, fstr, line)
+
+                continue
+
+            field, dims, dtyp = loadsize(mesh, kind, ltag)
+
+            if (kind != stag and field != ftag):
+                if (sidecar(ltag) is None):
+                    fstr.skiprows(dims[0])
+
+                continue
+
+            if (sidecar(ltag) is not None):
+    #--------------------------- slice the mapped sidecar
+                data = loadside(fstr, ltag, dtyp)
+
+                for next in range(0, dims[0], chunk):
+                    yield data[next:next + chunk]
+
+                return
+
+    #--------------------------- stream the data in CHUNK's
+            vnum, vtyp = rowsize(dtyp, dims)
+
+            for next in range(0, dims[0], chunk):
+
+                nrow = min(chunk, dims[0] - next)
+
+                data = np.empty(
+                    (nrow, ) + dims[1:], dtype=dtyp)
+
+                yield loadrows(fstr, data, vnum, vtyp)
+
+            return
+
+    return
+
+
+def loadmsh(name, mesh, sections=None):
     """
     LOADMSH: load a JIGSAW MSH obj. from file.
 
-    LOADMSH(NAME, MESH)
+    LOADMSH(NAME, MESH, SECTIONS=None)
 
     MESH is JIGSAW's primary mesh/grid/geom class. See MSH_t
     for details.
@@ -615,24 +1241,73 @@ def loadmsh(name, mesh):
     Data in MESH is loaded on-demand -- any objects included
     in the file will be read.
 
+    SECTIONS is an optional list of data segments to load,
+    i.e. SECTIONS=["POINT", "TRIA3"]. Any other segments are
+    skipped without being parsed. The MSHID, NDIMS and RADII
+    headers are always loaded, as are the COORD segments of
+    grids, if VALUE or SLOPE data is selected. See MSH_INFO
+    to inspect the contents of a file.
+
+    Binary files written via SAVEMSH(..., KIND="binary") are
+    detected automatically, and are memory-mapped, rather
+    than parsed. See MSH_B for details.
+
+    Compressed *.msh.gz, *.msh.xz and *.msh.bz2 files are
+    decompressed on the fly. See ZIPIO for details.
+
+    VALUE and SLOPE data written to raw sidecar files, via
+    SAVEMSH(..., SIDECAR=True), is memory-mapped, such that
+    large HFUN grids load in O(1) time.
+
+    NAME may also be a file-like object, open in binary or
+    text mode -- an open file, pipe, IO.BYTESIO, etc. This
+    is read forward-only from its current position, and is
+    left open on return.
+
     """
 
-    if (not isinstance(name, str)):
+    if (not isinstance(name, str) and
+            not zipio.isstream(name)):
         raise TypeError("Incorrect type: NAME.")
 
     if (not isinstance(mesh, jigsaw_msh_t)):
         raise TypeError("Incorrect type: MESH.")
 
-    with Path(name).open("r") as fptr:
+    keep = None
+    if (sections is not None):
+    #--------------------------- check the selected segments
+        if (isinstance(sections, str)):
+            sections = [sections]
+
+        keep = set(sect.upper() for sect in sections)
+
+        for sect in keep:
+            if (sect not in SECTS):
+                raise ValueError(
+                    "Invalid SECTIONS: " + sect)
+
+        if ("VALUE" in keep or "SLOPE" in keep):
+            keep.add("COORD")
+
+    with zipio.zipopen(name, "rb") as fptr:
+        fstr = scanner(fptr, root=rootdir(name))
+
+        if (fstr.peek(len(msh_b.MAGIC)) == msh_b.MAGIC):
+    #--------------------------- binary container: mmap it!
+            loadbins(mesh, fstr, name, keep)
+
+            return
+
         while (True):
 
     #--------------------------- get the next line from file
-            line = fptr.readline()
+            line = fstr.readline()
 
             if (len(line) != +0):
 
     #--------------------------- parse next non-null section
-                loadlines(mesh, fptr, line)
+                loadlines(
+                    mesh, fstr, line.decode("utf-8"), keep)
 
             else:
     #--------------------------- reached end-of-file: done!!
@@ -648,3 +1323,205 @@ def loadmsh(name, mesh):
             sanitise_grid(mesh, mesh.slope)
 
     return
+
+
+def untrack(shmem):
+    """
+    UNTRACK: stop the resource tracker unlinking the shared
+    memory block SHMEM at exit, on POSIX, where it is
+    registered under its NAME with a leading "/".
+
+    """
+    from multiprocessing import resource_tracker
+
+    if (os.name == "posix"):
+        resource_tracker.unregister(
+            "/" + shmem.name, "shared_memory")
+
+    return
+
+
+def sharemsh(mesh):
+    """
+    SHAREMSH: move the arrays in MESH to shared memory.
+
+    MESH, PART = SHAREMSH(MESH)
+
+    Each non-empty array in MESH is copied to a new block of
+    shared memory, and replaced with None. PART is a list of
+    (FIELD, NAME, SHAPE, DTYPE, ORDER) for each block. Blocks
+    are untracked here, being unlinked by the caller, via
+    UNSHAREMSH. If any block fails, all are unlinked, and
+    MESH is left unchanged.
+
+    """
+    from multiprocessing import shared_memory   # python 3.8
+
+    made = []; part = []
+    try:
+        for field in msh_b.FIELD:
+            data = getattr(mesh, field, None)
+
+            if (data is None or data.nbytes == +0): continue
+
+            order = "F" if (data.flags.f_contiguous and
+                            not data.flags.c_contiguous) \
+                else "C"
+
+            made.append(shared_memory.SharedMemory(
+                create=True, size=data.nbytes))
+
+            np.ndarray(
+                data.shape, dtype=data.dtype,
+                buffer=made[-1].buf, order=order)[...] = data
+
+            part.append((field, made[-1].name,
+                         data.shape, data.dtype, order))
+
+    except BaseException:
+    #----------------------------------- unlink all, if any
+        for shmem in made:
+            shmem.close(); shmem.unlink()
+
+        raise
+
+    for shmem in made:
+    #----------------------------------- caller unlinks now
+        untrack(shmem); shmem.close()
+
+    for field, _, _, _, _ in part:
+        setattr(mesh, field, None)
+
+    return mesh, part
+
+
+def unsharemsh(mesh, part):
+    """
+    UNSHAREMSH: restore the arrays in MESH from the blocks
+    of shared memory in PART, see SHAREMSH.
+
+    Each block is copied out of shared memory, then closed
+    and unlinked, such that no blocks outlive the call.
+
+    """
+    from multiprocessing import shared_memory
+
+    for field, name, dims, kind, order in part:
+        shmem = shared_memory.SharedMemory(name=name)
+
+        try:
+            setattr(mesh, field, np.array(np.ndarray(
+                dims, dtype=kind,
+                buffer=shmem.buf, order=order), order="K"))
+
+        finally:
+            shmem.close(); shmem.unlink()
+
+    return mesh
+
+
+def loadshare(name, sections=None):
+    """
+    LOADSHARE: load NAME in a worker process, returning its
+    arrays via shared memory, see SHAREMSH.
+
+    """
+    mesh = jigsaw_msh_t()
+    loadmsh(name, mesh, sections)
+
+    return sharemsh(mesh)
+
+
+def isbinary(name):
+    """
+    ISBINARY: return TRUE if NAME is an uncompressed binary
+    MSH_B file, which is memory-mapped by LOADMSH.
+
+    """
+    if (not mappable(name)): return False
+
+    with open(name, "rb") as fptr:
+        return fptr.read(len(msh_b.MAGIC)) == msh_b.MAGIC
+
+
+def loadmsh_many(names, workers=None, sections=None):
+    """
+    LOADMSH_MANY: load a list of JIGSAW MSH objs. from file.
+
+    MESH = LOADMSH_MANY(NAMES, WORKERS=None, SECTIONS=None)
+
+    MESH is a list of JIGSAW's MSH_t objects, one for each
+    file in NAMES, as per LOADMSH(NAME, MESH, SECTIONS). See
+    MSH_t for details.
+
+    Files are parsed concurrently, via a pool of WORKERS
+    processes (default: OS.CPU_COUNT()), with arrays passed
+    back via shared memory rather than being pickled. Text
+    parsing holds the GIL, so threads are of no benefit.
+
+    Uncompressed binary files are memory-mapped in-process,
+    as this is O(1) already. WORKERS=1 loads all files in-
+    process, one-by-one, as do python < 3.8, lacking shared
+    memory.
+
+    If any file fails to load, all remaining files are still
+    collected, and the first error is raised.
+
+    """
+
+    if (not isinstance(names, (list, tuple))):
+        raise TypeError("Incorrect type: NAMES.")
+
+    for name in names:
+        if (not isinstance(name, str)):
+            raise TypeError("Incorrect type: NAMES.")
+
+    if (workers is None):
+        workers = os.cpu_count() or +1
+
+    if (not isinstance(workers, int)):
+        raise TypeError("Incorrect type: WORKERS.")
+
+    if (workers < +1):
+        raise ValueError(
+            "Invalid WORKERS: " + str(workers))
+
+    try:
+        from multiprocessing import shared_memory  # noqa
+
+    except ImportError:
+        workers = +1                    # python < 3.8
+
+    mesh = [None] * len(names)
+
+    work = []
+    for inum, name in enumerate(names):
+        if (workers == +1 or isbinary(name)):
+    #--------------------------- load in-process: mmap, etc.
+            mesh[inum] = jigsaw_msh_t()
+            loadmsh(name, mesh[inum], sections)
+
+        else:
+            work.append(inum)
+
+    if (len(work) == +0): return mesh
+
+    fail = None
+    with ProcessPoolExecutor(
+            min(workers, len(work))) as pool:
+
+        jobs = [pool.submit(
+            loadshare, names[inum], sections)
+            for inum in work]
+
+    #--------------------------- collect all, to free shmem.
+        for inum, item in zip(work, jobs):
+            try:
+                mesh[inum] = unsharemsh(*item.result())
+
+            except Exception as err:
+                if (fail is None): fail = err
+
+    if (fail is not None): raise fail
+
+    return mesh
@@ -0,0 +1,110 @@
+""" MSH_B: Binary container layout for JIGSAW's mesh data.
+
+    A binary *.msh file is a fixed-size HEADER, followed by
+    a table of NSECT section SLOTS, followed by the raw data
+    payloads for each section:
+
+    HEADER - magic tag, version, section count and the MSH_t
+        mshID/ndims values.
+
+    SLOTS. - one entry per non-empty MSH_t array, where:
+        SLOT["FIELD"] is the name of the MSH_t attribute,
+        SLOT["KINDS"] is the dtype tag for the payload,
+        SLOT["ORDER"] is the memory ordering, "C" or "F",
+        SLOT["SHAPE"] is the array shape (NDIMS <= 4),
+        SLOT["START"] is the byte offset of the payload,
+        SLOT["BYTES"] is the byte length of the payload.
+
+    Payloads are little-endian copies of the MSH_t arrays,
+    with layouts matching the structured VERT2_t, TRIA3_t,
+    etc dtypes exactly, such that each section can be read
+    via NP.MEMMAP with no parsing. Payloads are aligned to
+    ALIGN bytes.
+
+    Binary files are read/written by LOADMSH/SAVEMSH only,
+    and are not readable by JIGSAW's c++ backend.
+
+    See also MSH_t
+
+
+    --------------------------------------------------------
+    """
+
+import numpy as np
+
+from jigsawpy.msh_t import jigsaw_msh_t
+
+# CAREFUL -- ANY CHANGE TO LAYOUTS MUST INCREMENT NVERS
+
+MAGIC = b"JIGSAWPY"
+NVERS = +1
+ALIGN = +64
+
+HEAD_t = np.dtype([("magic", "S8"),
+                   ("nvers", "<i4"),
+                   ("nsect", "<i4"),
+                   ("ndims", "<i4"),
+                   ("flags", "<i4"),
+                   ("mshID", "S32")])
+
+SLOT_t = np.dtype([("field", "S8"),
+                   ("kinds", "S8"),
+                   ("order", "S8"),
+                   ("ndims", "<i4"),
+                   ("flags", "<i4"),
+                   ("shape", "<i8", 4),
+                   ("start", "<i8"),
+                   ("bytes", "<i8")])
+
+KINDS = {
+    "REALS_t": jigsaw_msh_t.REALS_t,
+    "FLT32_t": jigsaw_msh_t.FLT32_t,
+    "VERT2_t": jigsaw_msh_t.VERT2_t,
+    "VERT3_t": jigsaw_msh_t.VERT3_t,
+    "EDGE2_t": jigsaw_msh_t.EDGE2_t,
+    "TRIA3_t": jigsaw_msh_t.TRIA3_t,
+    "QUAD4_t": jigsaw_msh_t.QUAD4_t,
+    "TRIA4_t": jigsaw_msh_t.TRIA4_t,
+    "HEXA8_t": jigsaw_msh_t.HEXA8_t,
+    "WEDG6_t": jigsaw_msh_t.WEDG6_t,
+    "PYRA5_t": jigsaw_msh_t.PYRA5_t,
+    "BOUND_t": jigsaw_msh_t.BOUND_t
+}
+
+FIELD = [
+    "radii", "vert2", "vert3", "seed2", "seed3",
+    "power", "value", "slope", "edge2", "tria3",
+    "quad4", "tria4", "hexa8", "wedg6", "pyra5",
+    "bound", "xgrid", "ygrid", "zgrid"
+]
+
+
+def kindof(data):
+    """
+    KINDOF: return the MSH_B dtype tag for the array DATA.
+
+    """
+    for ktag, kind in KINDS.items():
+        if (data.dtype == np.dtype(kind)):
+            return ktag
+
+    raise TypeError("Invalid MSH_B type.")
+
+
+def typeof(ktag):
+    """
+    TYPEOF: return the little-endian dtype for a MSH_B tag.
+
+    """
+    if (ktag not in KINDS):
+        raise ValueError("Invalid MSH_B type: " + ktag)
+
+    return np.dtype(KINDS[ktag]).newbyteorder("<")
+
+
+def padding(nbyte):
+    """
+    PADDING: return the byte count needed to align NBYTE.
+
+    """
+    return (ALIGN - nbyte % ALIGN) % ALIGN
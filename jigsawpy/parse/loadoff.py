@@ -0,0 +1,108 @@
+
+import numpy as np
+
+from jigsawpy.msh_t import jigsaw_msh_t
+from jigsawpy import zipio
+from jigsawpy.parse.textio import lineblocks, parserows, \
+    cellrows, polygons, setmesh
+
+
+def loadhead(fptr):
+    """
+    LOADHEAD: read the *.off header, returning the no. of
+    vertices and faces in file.
+
+    """
+    head = []
+    while (len(head) < 4):
+        line = fptr.readline()
+
+        if (len(line) == +0):
+            raise ValueError("Invalid OFF header.")
+
+        head.extend(line.split(b"#")[0].split())
+
+    if (not head[0].endswith(b"OFF")):
+        raise ValueError("Invalid OFF header.")
+
+    if (b"BINARY" in head):
+        raise ValueError("Unsupported OFF format: BINARY")
+
+    return int(head[1]), int(head[2])
+
+
+def loadoff(name, mesh):
+    """
+    LOADOFF: load a JIGSAW MSH object from *.off file.
+
+    LOADOFF(NAME, MESH)
+
+    MESH is JIGSAW's primary mesh/grid/geom class. See MSH_t
+    for details.
+
+    Vertices and faces in the (ASCII) OFF file are loaded as
+    the VERT3, TRIA3 and QUAD4 arrays of MESH, with N-gons
+    fan-triangulated into TRIA3's. Any per-vertex or face
+    colours are ignored.
+
+    Files are parsed in blocks of lines via NUMPY, see also
+    PARSEROWS. Compressed *.off.gz files, etc, are read as
+    per ZIPIO.
+
+    """
+
+    if (not isinstance(name, str) and
+            not zipio.isstream(name)):
+        raise TypeError("Incorrect type: NAME.")
+
+    if (not isinstance(mesh, jigsaw_msh_t)):
+        raise TypeError("Incorrect type: MESH.")
+
+    vert = []; tria = []; quad = []
+
+    with zipio.zipopen(name, "rb") as fptr:
+
+        nvrt, nfac = loadhead(fptr)
+
+        vnow = +0; fnow = +0
+
+        for text in lineblocks(fptr):
+
+            vals, lnum, _ = parserows(text)
+
+            offs = np.cumsum(lnum) - lnum
+
+    #--------------------------- vertex rows, then face rows
+            rows = np.flatnonzero(lnum > 0)
+
+            vrow = rows[:nvrt - vnow]
+            frow = rows[vrow.size:][:nfac - fnow]
+
+            if (np.any(lnum[vrow] < 3)):
+                raise ValueError("Invalid OFF vertex.")
+
+            vert.append(cellrows(vals, offs[vrow], 3))
+
+            knum = vals[offs[frow]].astype(np.int64)
+
+            if (np.any(lnum[frow] < knum + 1)):
+                raise ValueError("Invalid OFF face.")
+
+            cell = polygons(vals, offs[frow] + 1, knum)
+
+            tria.append(cell[0])
+            quad.append(cell[1])
+
+            vnow = vnow + vrow.size
+            fnow = fnow + frow.size
+
+    if (vnow != nvrt or fnow != nfac):
+        raise ValueError("Invalid OFF data: file truncated.")
+
+    setmesh(mesh,
+            np.concatenate(vert) if vert else np.empty((0, 3)),
+            None,
+            np.concatenate(tria) if tria else None,
+            np.concatenate(quad) if quad else None)
+
+    return
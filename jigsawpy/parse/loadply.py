@@ -0,0 +1,365 @@
+
+import numpy as np
+
+from jigsawpy.msh_t import jigsaw_msh_t
+from jigsawpy import zipio
+from jigsawpy.parse.textio import lineblocks, parserows, \
+    polygons, setmesh
+
+PLY_t = {
+    "char": "i1", "int8": "i1",
+    "uchar": "u1", "uint8": "u1",
+    "short": "i2", "int16": "i2",
+    "ushort": "u2", "uint16": "u2",
+    "int": "i4", "int32": "i4",
+    "uint": "u4", "uint32": "u4",
+    "float": "f4", "float32": "f4",
+    "double": "f8", "float64": "f8"
+}
+
+
+def plytype(ttag):
+    """
+    PLYTYPE: map a PLY property type onto NUMPY's dtype.
+
+    """
+    if (ttag not in PLY_t):
+        raise ValueError("Invalid PLY type: " + ttag)
+
+    return PLY_t[ttag]
+
+
+def loadhead(fptr):
+    """
+    LOADHEAD: read the *.ply header.
+
+    FORM, ELEM = LOADHEAD(FPTR)
+
+    FORM is the file format, "ascii", "binary_little_endian"
+    or "binary_big_endian". ELEM is a list of (NAME, COUNT,
+    PROP) elements, with PROP a list of (NAME, TYPE, LTYPE)
+    properties -- LTYPE is the type of the item count for
+    list properties, and None otherwise.
+
+    """
+    if (fptr.readline().strip() != b"ply"):
+        raise ValueError("Invalid PLY header.")
+
+    form = None; elem = []
+    while (True):
+        line = fptr.readline()
+
+        if (len(line) == +0):
+            raise ValueError("Invalid PLY header.")
+
+        data = line.decode("ascii", "replace").split()
+
+        if (len(data) == +0): continue
+
+        if (data[0] == "format"):
+            form = data[1]
+
+        elif (data[0] == "element"):
+            elem.append((data[1], int(data[2]), []))
+
+        elif (data[0] == "property" and data[1] == "list"):
+            elem[-1][2].append((
+                data[4], plytype(data[3]), plytype(data[2])))
+
+        elif (data[0] == "property"):
+            elem[-1][2].append((
+                data[2], plytype(data[1]), None))
+
+        elif (data[0] == "end_header"):
+            break
+
+    if (form not in [
+            "ascii", "binary_little_endian",
+            "binary_big_endian"]):
+        raise ValueError("Invalid PLY format: " + str(form))
+
+    return form, elem
+
+
+def itemnext(prop, pnum, vals, offs, lnum):
+    """
+    ITEMNEXT: the offset and length of property PNUM within
+    each element, given each element's items in VALS, from
+    OFFS, with LNUM items.
+
+    """
+    offs = offs.copy()
+    for pkey in prop[:pnum]:
+        if (pkey[2] is None):
+            offs += 1
+        else:
+            offs += vals[offs].astype(np.int64) + 1
+
+    if (prop[pnum][2] is None):
+        return offs, np.ones(offs.size, dtype=np.int64)
+
+    return offs + 1, vals[offs].astype(np.int64)
+
+
+def propnum(prop, pkey):
+    """
+    PROPNUM: return the index of the 1st property in PKEY,
+    or -1 if none found.
+
+    """
+    name = [pval[0] for pval in prop]
+    for ptag in pkey:
+        if (ptag in name): return name.index(ptag)
+
+    return -1
+
+
+def textelem(fptr, elem, vert, edge, tria, quad):
+    """
+    TEXTELEM: read the elements from an ASCII *.ply file.
+
+    """
+    enum = +0; inum = +0
+    for text in lineblocks(fptr):
+
+        vals, lnum, _ = parserows(text)
+
+        offs = np.cumsum(lnum) - lnum
+        rows = np.flatnonzero(lnum > 0)
+
+        while (rows.size > 0 and enum < len(elem)):
+    #----------------------- rows for curr. element in block
+            name, count, prop = elem[enum]
+
+            here = rows[:count - inum]
+            rows = rows[here.size:]
+
+            sortelem(name, prop, vals, offs[here],
+                     lnum[here], vert, edge, tria, quad)
+
+            inum = inum + here.size
+            if (inum == count):
+                enum = enum + 1; inum = +0
+
+    if (enum < len(elem) and elem[enum][1] > inum):
+        raise ValueError("Invalid PLY data: file truncated.")
+
+    return
+
+
+def sortelem(name, prop, vals, offs, lnum,
+             vert, edge, tria, quad):
+    """
+    SORTELEM: push the "vertex", "face" and "edge" elements
+    onto the VERT, EDGE, TRIA and QUAD lists.
+
+    """
+    if (name == "vertex"):
+        xpos = [propnum(prop, [ptag]) for ptag in "xyz"]
+
+        if (min(xpos) < 0):
+            raise ValueError("Invalid PLY vertex.")
+
+        vert.append(vals[np.stack([itemnext(
+            prop, ppos, vals, offs, lnum)[0]
+            for ppos in xpos], axis=1)])
+
+    elif (name == "face"):
+        ppos = propnum(
+            prop, ["vertex_indices", "vertex_index"])
+
+        if (ppos < 0):
+            raise ValueError("Invalid PLY face.")
+
+        cpos, cnum = itemnext(prop, ppos, vals, offs, lnum)
+
+        cell = polygons(vals, cpos, cnum)
+
+        tria.append(cell[0])
+        quad.append(cell[1])
+
+    elif (name == "edge"):
+        xpos = [propnum(prop, [ptag]) for ptag in [
+            "vertex1", "vertex2"]]
+
+        if (min(xpos) < 0):
+            raise ValueError("Invalid PLY edge.")
+
+        edge.append(vals[np.stack([itemnext(
+            prop, ppos, vals, offs, lnum)[0]
+            for ppos in xpos], axis=1)])
+
+    return
+
+
+def listelem(data, fpos, count, prop, bias):
+    """
+    LISTELEM: read a binary element with list properties,
+    returning the end position, and flat (float64) VALS,
+    OFFS and LNUM items.
+
+    Where an element has one list of uniform length (i.e.
+    all triangles) it is viewed as a fixed-size record via
+    NUMPY, else elements are walked one-by-one.
+
+    """
+    kpos = [pkey[2] is not None for pkey in prop]
+
+    if (count > 0 and sum(kpos) == 1):
+    #-- try uniform: list length from the 1st element
+        lpos = kpos.index(True)
+        head = sum(np.dtype(pkey[1]).itemsize
+                   for pkey in prop[:lpos])
+
+        knum = int(np.frombuffer(
+            data, dtype=bias + prop[lpos][2], count=1,
+            offset=fpos + head)[0])
+
+        dtyp = []
+        for pkey in prop:
+            if (pkey[2] is None):
+                dtyp.append(("", bias + pkey[1], (1,)))
+            else:
+                dtyp.append(("", bias + pkey[2], (1,)))
+                dtyp.append(("", bias + pkey[1], (knum,)))
+
+        dtyp = np.dtype([(
+            "f%u" % ipos, ttag[1], ttag[2])
+            for ipos, ttag in enumerate(dtyp)])
+
+        size = count * dtyp.itemsize
+        if (fpos + size <= len(data)):
+            item = np.frombuffer(
+                data, dtype=dtyp, count=count, offset=fpos)
+
+            if (np.all(item["f%u" % lpos] == knum)):
+                vals = np.concatenate([
+                    item[ttag].astype(np.float64)
+                    for ttag in dtyp.names], axis=1)
+
+                lnum = np.full(count, vals.shape[1])
+
+                return (fpos + size, vals.reshape(-1),
+                        np.cumsum(lnum) - lnum, lnum)
+
+    #-- mixed: walk elements one-by-one
+    vals = []; lnum = np.zeros(count, dtype=np.int64)
+    for inum in range(count):
+        for pkey in prop:
+            knum = +1
+            if (pkey[2] is not None):
+                item = np.frombuffer(
+                    data, dtype=bias + pkey[2], count=1,
+                    offset=fpos)
+                fpos = fpos + item.nbytes
+                vals.append(item.astype(np.float64))
+
+                knum = int(item[0])
+
+            item = np.frombuffer(
+                data, dtype=bias + pkey[1], count=knum,
+                offset=fpos)
+            fpos = fpos + item.nbytes
+            vals.append(item.astype(np.float64))
+
+            lnum[inum] += knum + (pkey[2] is not None)
+
+    vals = np.concatenate(vals) if vals else np.empty(0)
+
+    return fpos, vals, np.cumsum(lnum) - lnum, lnum
+
+
+def binaelem(fptr, form, elem, vert, edge, tria, quad):
+    """
+    BINAELEM: read the elements from a binary *.ply file.
+
+    """
+    bias = "<" if form == "binary_little_endian" else ">"
+
+    data = fptr.read()
+    fpos = +0
+    for name, count, prop in elem:
+        if (all(pkey[2] is None for pkey in prop)):
+    #----------------------------------- scalar-only records
+            dtyp = np.dtype([
+                (pkey[0], bias + pkey[1]) for pkey in prop])
+
+            if (fpos + count * dtyp.itemsize > len(data)):
+                raise ValueError(
+                    "Invalid PLY data: file truncated.")
+
+            item = np.frombuffer(
+                data, dtype=dtyp, count=count, offset=fpos)
+
+            fpos = fpos + count * dtyp.itemsize
+
+            vals = np.stack([
+                item[pkey[0]].astype(np.float64)
+                for pkey in prop], axis=1).reshape(-1)
+
+            lnum = np.full(count, len(prop))
+            offs = np.arange(count) * len(prop)
+
+        else:
+    #----------------------------------- list-based records
+            try:
+                fpos, vals, offs, lnum = listelem(
+                    data, fpos, count, prop, bias)
+
+            except ValueError:
+                raise ValueError(
+                    "Invalid PLY data: file truncated.")
+
+        sortelem(name, prop, vals, offs, lnum,
+                 vert, edge, tria, quad)
+
+    return
+
+
+def loadply(name, mesh):
+    """
+    LOADPLY: load a JIGSAW MSH object from *.ply file.
+
+    LOADPLY(NAME, MESH)
+
+    MESH is JIGSAW's primary mesh/grid/geom class. See MSH_t
+    for details.
+
+    The "vertex", "face" and "edge" elements in the Stanford
+    PLY file are loaded as the VERT3, TRIA3, QUAD4 and EDGE2
+    arrays of MESH, with N-gons fan-triangulated into TRIA3.
+    Any other elements/properties are ignored.
+
+    Both ASCII and binary (little- or big-endian) files are
+    supported. Binary records are viewed in-place via NUMPY,
+    and ASCII files parsed in blocks, see PARSEROWS.
+    Compressed *.ply.gz files, etc, are read as per ZIPIO.
+
+    """
+
+    if (not isinstance(name, str) and
+            not zipio.isstream(name)):
+        raise TypeError("Incorrect type: NAME.")
+
+    if (not isinstance(mesh, jigsaw_msh_t)):
+        raise TypeError("Incorrect type: MESH.")
+
+    vert = []; edge = []; tria = []; quad = []
+
+    with zipio.zipopen(name, "rb") as fptr:
+
+        form, elem = loadhead(fptr)
+
+        if (form == "ascii"):
+            textelem(fptr, elem, vert, edge, tria, quad)
+        else:
+            binaelem(fptr, form, elem,
+                     vert, edge, tria, quad)
+
+    setmesh(mesh,
+            np.concatenate(vert) if vert else np.empty((0, 3)),
+            np.concatenate(edge) if edge else None,
+            np.concatenate(tria) if tria else None,
+            np.concatenate(quad) if quad else None)
+
+    return
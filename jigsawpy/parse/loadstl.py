@@ -0,0 +1,144 @@
+
+import numpy as np
+
+from jigsawpy.msh_t import jigsaw_msh_t
+from jigsawpy import zipio
+from jigsawpy.parse.textio import lineblocks, parserows, \
+    cellrows, setmesh
+
+STL_t = np.dtype([
+    ("normal", "<f4", (3,)),
+    ("coord", "<f4", (3, 3)),
+    ("attrib", "<u2")
+])
+
+
+def isbinary(head):
+    """
+    ISBINARY: return TRUE if the leading bytes HEAD are from
+    a binary *.stl file.
+
+    Binary files may still begin with "solid", so ASCII is
+    taken to be a "solid" header followed by "facet" text.
+
+    """
+    if (not head.lstrip().startswith(b"solid")): return True
+
+    if (b"facet" not in head and
+            b"endsolid" not in head):
+        return True
+
+    return any(byte > 127 or byte == +0 for byte in head)
+
+
+def mergepts(xyz):
+    """
+    MERGEPTS: merge any duplicate points in XYZ.
+
+    PNTS, INDX = MERGEPTS(XYZ)
+
+    PNTS are the unique points, with PNTS[INDX] == XYZ.
+
+    Points are sorted on the bit patterns of their coord.'s,
+    with float32 x, y bits packed into a single key.
+
+    """
+    xyz = np.ascontiguousarray(xyz) + 0.    # -0. to +0.
+
+    bits = xyz.view("u" + str(xyz.dtype.itemsize))
+
+    if (xyz.dtype.itemsize == 4):
+        keys = bits[:, 0].astype(np.uint64) << 32 | \
+            bits[:, 1].astype(np.uint64)
+        keys = (bits[:, 2], keys)
+    else:
+        keys = (bits[:, 2], bits[:, 1], bits[:, 0])
+
+    isrt = np.lexsort(keys)
+    bits = bits[isrt]
+
+    uniq = np.empty(bits.shape[0], dtype=bool)
+    uniq[:1] = True
+    uniq[1:] = np.any(bits[1:] != bits[:-1], axis=1)
+
+    indx = np.empty(bits.shape[0], dtype=np.int64)
+    indx[isrt] = np.cumsum(uniq) - 1
+
+    return xyz[isrt[uniq]], indx
+
+
+def loadstl(name, mesh):
+    """
+    LOADSTL: load a JIGSAW MSH object from *.stl file.
+
+    LOADSTL(NAME, MESH)
+
+    MESH is JIGSAW's primary mesh/grid/geom class. See MSH_t
+    for details.
+
+    Facets in the STL file are loaded as the TRIA3 array of
+    MESH, with coincident vertices merged into VERT3. Facet
+    normals and attributes are ignored.
+
+    Both ASCII and binary files are supported, with binary
+    facets viewed in-place via NUMPY, and ASCII files parsed
+    in blocks, see PARSEROWS. Compressed *.stl.gz files,
+    etc, are read as per ZIPIO.
+
+    """
+
+    if (not isinstance(name, str) and
+            not zipio.isstream(name)):
+        raise TypeError("Incorrect type: NAME.")
+
+    if (not isinstance(mesh, jigsaw_msh_t)):
+        raise TypeError("Incorrect type: MESH.")
+
+    with zipio.zipopen(name, "rb") as fptr:
+
+        head = fptr.read(1024)
+
+        if (len(head) >= 84 and isbinary(head)):
+    #----------------------------------- binary: 50-byte rows
+            ntri = int(np.frombuffer(
+                head, dtype="<u4", count=1, offset=80)[0])
+
+            size = ntri * STL_t.itemsize
+
+            data = head[84:size + 84]
+            data = data + fptr.read(size - len(data))
+
+            if (len(data) < size):
+                raise ValueError(
+                    "Invalid STL data: file truncated.")
+
+            xyz = np.frombuffer(data, dtype=STL_t)["coord"]
+
+        else:
+    #----------------------------------- ASCII: vertex x y z
+            xyz = []
+            for text in lineblocks(zipio.fileview(
+                    fptr, "rb", head)):
+
+                vals, lnum, kind = parserows(
+                    text, [b"vertex"])
+
+                offs = np.cumsum(lnum) - lnum
+
+                if (np.any(lnum[kind == 1] != 3)):
+                    raise ValueError("Invalid STL vertex.")
+
+                xyz.append(cellrows(vals, offs[kind == 1], 3))
+
+            xyz = np.concatenate(xyz) if xyz else \
+                np.empty((0, 3))
+
+            if (xyz.shape[0] % 3 != 0):
+                raise ValueError("Invalid STL facet.")
+
+    vert, tria = mergepts(xyz.reshape(-1, 3))
+
+    setmesh(mesh, vert.astype(np.float64), None,
+            tria.reshape(-1, 3))
+
+    return
@@ -0,0 +1,91 @@
+
+import numpy as np
+
+from jigsawpy.msh_t import jigsaw_msh_t
+from jigsawpy import zipio
+from jigsawpy.parse.textio import lineblocks, parserows, \
+    cellrows, polygons, polylines, setmesh
+
+
+def loadwav(name, mesh):
+    """
+    LOADWAV: load a JIGSAW MSH object from *.obj file.
+
+    LOADWAV(NAME, MESH)
+
+    MESH is JIGSAW's primary mesh/grid/geom class. See MSH_t
+    for details.
+
+    Vertices ("v"), faces ("f") and polylines ("l") in the
+    Wavefront file are loaded as the VERT3, TRIA3, QUAD4 and
+    EDGE2 arrays of MESH, with N-gons fan-triangulated into
+    TRIA3's. Negative (relative) indices are supported, and
+    texture coord., normals, groups, materials, etc are all
+    ignored.
+
+    Files are parsed in blocks of lines via NUMPY, see also
+    PARSEROWS. Compressed *.obj.gz files, etc, are read as
+    per ZIPIO.
+
+    """
+
+    if (not isinstance(name, str) and
+            not zipio.isstream(name)):
+        raise TypeError("Incorrect type: NAME.")
+
+    if (not isinstance(mesh, jigsaw_msh_t)):
+        raise TypeError("Incorrect type: MESH.")
+
+    vert = []; edge = []; tria = []; quad = []
+
+    nvrt = +0
+
+    with zipio.zipopen(name, "rb") as fptr:
+        for text in lineblocks(fptr):
+
+            vals, lnum, kind = parserows(
+                text, [b"v", b"f", b"l"])
+
+            offs = np.cumsum(lnum) - lnum
+
+    #--------------------------- VERT3 from v x y z [w] rows
+            mask = kind == 1
+
+            if (np.any(lnum[mask] < 3)):
+                raise ValueError("Invalid OBJ vertex.")
+
+            vert.append(cellrows(vals, offs[mask], 3))
+
+    #--------------------------- make indices 0-based, where
+    #                            -N is the Nth vertex so far
+            vnum = nvrt + np.cumsum(mask)
+
+            ipos = np.repeat(kind >= 2, lnum)
+            iend = np.repeat(vnum, lnum)[ipos]
+
+            indx = vals[ipos]
+            vals[ipos] = np.where(
+                indx < 0, indx + iend, indx - 1)
+
+            nvrt = int(vnum[-1]) if vnum.size else nvrt
+
+    #--------------------------- TRIA3/QUAD4 from f, EDGE2 l
+            mask = kind == 2
+
+            cell = polygons(vals, offs[mask], lnum[mask])
+
+            tria.append(cell[0])
+            quad.append(cell[1])
+
+            mask = kind == 3
+
+            edge.append(
+                polylines(vals, offs[mask], lnum[mask]))
+
+    setmesh(mesh,
+            np.concatenate(vert) if vert else np.empty((0, 3)),
+            np.concatenate(edge) if edge else None,
+            np.concatenate(tria) if tria else None,
+            np.concatenate(quad) if quad else None)
+
+    return
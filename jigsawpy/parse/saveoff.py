@@ -4,6 +4,7 @@ from pathlib import Path
 
 from jigsawpy.msh_t import jigsaw_msh_t
 from jigsawpy.certify import certify
+from jigsawpy.savemsh import saverows
 
 
 def savepoint(data, fptr, ndim):
@@ -11,25 +12,9 @@ def savepoint(data, fptr, ndim):
     SAVEPOINT: save the POINT data structure to *.off file.
 
     """
-    rmax = 2 ** 19; next = 0
+    tail = " 0" if ndim < 3 else ""
 
-    while (next < data.shape[0]):
-
-        nrow = min(rmax, data.shape[0] - next)
-        nend = next + nrow
-
-        sfmt = " ".join(["%.17g"] * ndim)
-
-        if (ndim < 3): sfmt = sfmt + " 0"
-
-        sfmt = sfmt + "\n"
-        sfmt = sfmt * nrow
-
-        fdat = sfmt % tuple(data[next:nend, :].ravel())
-
-        fptr.write(fdat)
-
-        next = next + nrow
+    saverows(data, fptr, 17, " ", "", tail)
 
     return
 
@@ -39,22 +24,7 @@ def savecells(data, fptr, nnod):
     SAVECELLS: save the CELLS data structure to *.off file.
 
     """
-    rmax = 2 ** 19; next = 0
-
-    while (next < data.shape[0]):
-
-        nrow = min(rmax, data.shape[0] - next)
-        nend = next + nrow
-
-        sfmt = " ".join(["%d"] * nnod) + "\n"
-        sfmt = str(nnod) + " " + sfmt
-        sfmt = sfmt * nrow
-
-        fdat = sfmt % tuple(data[next:nend, :].ravel())
-
-        fptr.write(fdat)
-
-        next = next + nrow
+    saverows(data, fptr, None, " ", str(nnod) + " ")
 
     return
 
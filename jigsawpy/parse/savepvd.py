@@ -0,0 +1,168 @@
+
+import os
+import hashlib
+from pathlib import Path
+import numpy as np
+
+from jigsawpy.msh_t import jigsaw_msh_t
+from jigsawpy.certify import certify
+from jigsawpy.parse.savevtk import savevtk, save_xml_mesh
+
+
+def geomkey(mesh):
+    """
+    GEOMKEY: return a digest of the POINT and cell arrays in
+    MESH, used to detect steps with unchanged geometry.
+
+    """
+    hash = hashlib.blake2b(digest_size=16)
+
+    for field in [
+            "vert2", "vert3", "edge2", "tria3", "quad4",
+            "tria4", "hexa8", "wedg6", "pyra5"]:
+        data = getattr(mesh, field)
+
+        if (data is None or data.size == +0): continue
+
+        data = np.ascontiguousarray(data)
+
+        hash.update(field.encode("ascii"))
+        hash.update(str(data.shape).encode("ascii"))
+        hash.update(data.view(np.uint8))
+
+    return hash.digest()
+
+
+class pvd_writer(object):
+    """
+    PVD_WRITER: write a time-series of JIGSAW MSH objects as
+    a ParaView *.pvd collection.
+
+    with PVD_WRITER(NAME, LEVEL=None,
+                    QUALITY=False) as PVD:
+        PVD.write(MESH, TIME)
+        ...
+
+    Each call to WRITE saves MESH to a new xml file, NAME-
+    0000.vtu, NAME-0001.vtu, etc (or *.vtr for grids), and
+    re-writes the *.pvd index, such that the series can be
+    loaded at any step. LEVEL and QUALITY are as per
+    SAVEVTK(..., KIND="xml"). TIME=None takes the step no.
+
+    Where the POINT and cell arrays of a mesh are unchanged
+    from the previous step (e.g. only VALUE is updated), the
+    encoded geometry is copied from the previous file rather
+    than being re-formatted and re-compressed.
+
+    Writers can be passed to TETRIS, REFINE, JITTER, etc via
+    SERIES=PVD, to save each level/iteration as it is done.
+
+    """
+
+    def __init__(self, name, level=None, quality=False):
+
+        if (not isinstance(name, str)):
+            raise TypeError("Incorrect type: NAME.")
+
+        if (level is not None and not isinstance(level, int)):
+            raise TypeError("Incorrect type: LEVEL.")
+
+        if (level is not None and (level < 1 or level > 9)):
+            raise ValueError("Invalid LEVEL: " + str(level))
+
+        if (Path(name).suffix.strip() != ".pvd"):
+            name += ".pvd"
+
+        self.name = name
+        self.level = level
+        self.quality = quality
+        self.item = []                  # (time, file) pairs
+        self.hash = None                # geometry of prev.
+        self.span = None
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
+
+        return False
+
+    def write(self, mesh, time=None):
+        """
+        WRITE: save MESH as the next step in the series.
+
+        """
+        if (not isinstance(mesh, jigsaw_msh_t)):
+            raise TypeError("Incorrect type: MESH.")
+
+        certify(mesh)
+
+        if (time is None): time = len(self.item)
+
+        path = Path(self.name).parent
+        base = Path(self.name).stem + "-%04u" % len(self.item)
+
+        if (mesh.mshID.lower().endswith("-grid")):
+    #----------------------------------- grids: just re-save
+            fout = str(path / (base + ".vtr"))
+
+            savevtk(fout, mesh, "xml", self.level)
+
+            self.hash = None; self.span = None
+
+        else:
+    #----------------------------------- share prev. geometry
+            fout = str(path / (base + ".vtu"))
+
+            hash = geomkey(mesh)
+
+            reuse = self.span if hash == self.hash else None
+
+            with Path(fout).open("wb") as fptr:
+                self.span = save_xml_mesh(
+                    mesh, fptr, self.level,
+                    self.quality, reuse)
+
+            self.hash = hash
+
+        self.item.append((float(time), Path(fout).name))
+
+        self.flush()
+
+        return fout
+
+    def flush(self):
+        """
+        FLUSH: re-write the *.pvd index for all steps so far.
+
+        """
+        part = self.name + ".part"
+
+        with Path(part).open("w") as fptr:
+            fptr.write(
+                '<?xml version="1.0"?>\n'
+                '<VTKFile type="Collection" version="0.1" '
+                'byte_order="LittleEndian">\n'
+                "<Collection>\n")
+
+            for time, fout in self.item:
+                fptr.write(
+                    '<DataSet timestep="' + repr(time) +
+                    '" group="" part="0" file="' + fout +
+                    '"/>\n')
+
+            fptr.write("</Collection>\n</VTKFile>\n")
+
+        os.replace(part, self.name)
+
+        return
+
+    def close(self):
+        """
+        CLOSE: finalise the *.pvd index.
+
+        """
+        self.flush()
+
+        return
@@ -1,9 +1,33 @@
 
+import zlib
+import tempfile
 from pathlib import Path
 import numpy as np
 
 from jigsawpy.msh_t import jigsaw_msh_t
 from jigsawpy.certify import certify
+from jigsawpy.savemsh import saverows
+from jigsawpy.tools.scorecard import triscr2, triscr3
+
+CELLS_t = [                             # field, nnod, type
+    ("edge2", +2, +3),
+    ("tria3", +3, +5),
+    ("quad4", +4, +9),
+    ("tria4", +4, 10),
+    ("hexa8", +8, 12),
+    ("wedg6", +6, 13),
+    ("pyra5", +5, 14)
+]
+
+VTK_t = {                               # xml, legacy names
+    "Float64": ("<f8", "double"),
+    "Float32": ("<f4", "float"),
+    "Int64": ("<i8", "vtkIdType"),
+    "Int32": ("<i4", "int"),
+    "UInt8": ("u1", "unsigned_char")
+}
+
+BLOCK = 2 ** 20                         # zlib block size
 
 
 def savepoint(data, fptr, ndim):
@@ -11,25 +35,9 @@ def savepoint(data, fptr, ndim):
     SAVEPOINT: save the POINT data structure to *.vtk file.
 
     """
-    rmax = 2 ** 19; next = 0
+    tail = " 0" if ndim < 3 else ""
 
-    while (next < data.shape[0]):
-
-        nrow = min(rmax, data.shape[0] - next)
-        nend = next + nrow
-
-        sfmt = " ".join(["%.17g"] * ndim)
-
-        if (ndim < 3): sfmt = sfmt + " 0"
-
-        sfmt = sfmt + "\n"
-        sfmt = sfmt * nrow
-
-        fdat = sfmt % tuple(data[next:nend, :].ravel())
-
-        fptr.write(fdat)
-
-        next = next + nrow
+    saverows(data, fptr, 17, " ", "", tail)
 
     return
 
@@ -39,22 +47,7 @@ def savecells(data, fptr, nnod):
     SAVECELLS: save the CELLS data structure to *.vtk file.
 
     """
-    rmax = 2 ** 19; next = 0
-
-    while (next < data.shape[0]):
-
-        nrow = min(rmax, data.shape[0] - next)
-        nend = next + nrow
-
-        sfmt = " ".join(["%d"] * nnod) + "\n"
-        sfmt = str(nnod) + " " + sfmt
-        sfmt = sfmt * nrow
-
-        fdat = sfmt % tuple(data[next:nend, :].ravel())
-
-        fptr.write(fdat)
-
-        next = next + nrow
+    saverows(data, fptr, None, " ", str(nnod) + " ")
 
     return
 
@@ -66,21 +59,7 @@ def savearray(data, fptr):
     """
     dptr = data.reshape(-1, order="F")
 
-    rmax = 2 ** 19; next = 0
-
-    while (next < dptr.shape[0]):
-
-        nrow = min(rmax, dptr.shape[0] - next)
-        nend = next + nrow
-
-        sfmt = "%.9g\n"
-        sfmt = sfmt * nrow
-
-        fdat = sfmt % tuple(dptr[next:nend].ravel())
-
-        fptr.write(fdat)
-
-        next = next + nrow
+    saverows(dptr, fptr, 9)
 
     return
 
@@ -341,11 +320,595 @@ def save_grid_file(mesh, fptr):
     return
 
 
-def savevtk(name, mesh):
+def blocks(data, rmax=2 ** 16):
+    """
+    BLOCKS: iterate over views of DATA in blocks of RMAX rows.
+
+    """
+    for next in range(0, data.shape[0], rmax):
+        yield data[next:next + rmax]
+
+
+def vtkkind(dtyp):
+    """
+    VTKKIND: return the VTK type name for the dtype DTYP.
+
+    """
+    for kind, (ntag, _) in VTK_t.items():
+        if (np.dtype(ntag) == dtyp): return kind
+
+    raise TypeError("Invalid VTK type.")
+
+
+def meshpoint(mesh):
+    """
+    MESHPOINT: return the non-empty POINT arrays in MESH.
+
+    """
+    return [data for data in (mesh.vert2, mesh.vert3)
+            if data is not None and data.size != +0]
+
+
+def meshcells(mesh):
+    """
+    MESHCELLS: return the (FIELD, DATA, NNOD, TYPE) for each
+    non-empty cell array in MESH.
+
+    """
+    cells = []
+    for field, nnod, kind in CELLS_t:
+        data = getattr(mesh, field)
+
+        if (data is not None and data.size != +0):
+            cells.append((field, data, nnod, kind))
+
+    return cells
+
+
+def pointblk(point):
+    """
+    POINTBLK: yield the XYZ coord. of POINT in blocks, with
+    2-dim. points padded via a scratch buffer.
+
+    """
+    for data in point:
+        ndim = data["coord"].shape[1]
+
+        if (ndim == +3):
+            yield from blocks(data["coord"])
+
+            continue
+
+        temp = np.zeros((min(2 ** 16, data.size), 3))
+
+        for rows in blocks(data["coord"]):
+            temp[:rows.shape[0], :ndim] = rows
+
+            yield temp[:rows.shape[0]]
+
+
+def fieldblk(parts, name):
+    """
+    FIELDBLK: yield the field NAME of each array in PARTS in
+    blocks, as strided views.
+
+    """
+    for data in parts:
+        yield from blocks(data[name])
+
+
+def typesblk(cells):
+    """
+    TYPESBLK: yield the VTK cell-type for CELLS in blocks.
+
+    """
+    for _, data, _, kind in cells:
+        for rows in blocks(data):
+            yield np.full(rows.shape[0], kind, np.uint8)
+
+
+def offsetblk(cells):
+    """
+    OFFSETBLK: yield the end offset of each cell in the xml
+    connectivity list, in blocks.
+
+    """
+    base = +0
+    for _, data, nnod, _ in cells:
+        for rows in blocks(data):
+            next = base + nnod * np.arange(
+                1, rows.shape[0] + 1, dtype=np.int64)
+
+            base = int(next[-1])
+
+            yield next
+
+
+def legacyblk(cells):
+    """
+    LEGACYBLK: yield the legacy CELLS list, as NNOD, INDEX,
+    in blocks via a scratch buffer.
+
+    """
+    for _, data, nnod, _ in cells:
+        temp = np.empty(
+            (min(2 ** 16, data.size), nnod + 1), np.int32)
+        temp[:, 0] = nnod
+
+        for rows in blocks(data["index"]):
+            temp[:rows.shape[0], 1:] = rows
+
+            yield temp[:rows.shape[0]]
+
+
+def scoreblk(point, cells):
+    """
+    SCOREBLK: yield the cell quality metric in blocks, via
+    TRISCR2 for TRIA3, TRISCR3 for TRIA4 cells, else NaN.
+
+    """
+    ppos = None
+    if (len(point) == +1): ppos = point[0]["coord"]
+
+    for field, data, _, _ in cells:
+        for rows in blocks(data["index"]):
+            if (ppos is not None and field == "tria3"):
+                yield triscr2(ppos, rows)
+
+            elif (ppos is not None and field == "tria4" and
+                    ppos.shape[1] == +3):
+                yield triscr3(ppos, rows)
+
+            else:
+                yield np.full(rows.shape[0], np.nan)
+
+
+def pointdata(mesh, point):
+    """
+    POINTDATA: return the (NAME, KIND, NCOMP, SIZE, DATA) of
+    each array written as point data.
+
+    """
+    npts = sum(data.size for data in point)
+
+    attr = [("IDtag", "Int32", +1, npts,
+             fieldblk(point, "IDtag"))]
+
+    for name in ["value", "slope"]:
+        data = getattr(mesh, name)
+
+        if (data is not None and data.size != +0 and
+                data.shape[0] == npts):
+            data = np.reshape(data, (npts, -1))
+
+            attr.append((
+                name, vtkkind(data.dtype),
+                data.shape[1], data.size, blocks(data)))
+
+    return attr
+
+
+def celldata(point, cells, quality):
+    """
+    CELLDATA: return the (NAME, KIND, NCOMP, SIZE, DATA) of
+    each array written as cell data.
+
+    """
+    ncel = sum(data.size for _, data, _, _ in cells)
+
+    attr = [("IDtag", "Int32", +1, ncel, fieldblk(
+        [data for _, data, _, _ in cells], "IDtag"))]
+
+    if (quality):
+        attr.append(("quality", "Float64", +1, ncel,
+                     scoreblk(point, cells)))
+
+    return attr
+
+
+def gridaxes(mesh):
+    """
+    GRIDAXES: return the XYZ coord. vectors of a grid, with
+    any empty axis set to [0].
+
+    """
+    axes = []
+    for data in (mesh.xgrid, mesh.ygrid, mesh.zgrid):
+        if (data is not None and data.size != +0):
+            axes.append(np.ravel(data))
+        else:
+            axes.append(np.zeros(+1))
+
+    return axes
+
+
+def griddata(mesh, dims):
+    """
+    GRIDDATA: return the (NAME, KIND, NCOMP, SIZE, DATA) of
+    each array written as grid point data, x-fastest.
+
+    """
+    attr = []
+    for name in ["value", "slope"]:
+        data = getattr(mesh, name)
+
+        if (data is not None and data.size != +0 and
+                data.size == np.prod(dims)):
+            perm = [1, 0] + list(range(+2, data.ndim))
+
+            data = np.transpose(
+                data, perm).reshape(-1, order="F")
+
+            attr.append((
+                name, vtkkind(data.dtype),
+                +1, data.size, blocks(data)))
+
+    return attr
+
+
+def savebins(data, fptr, kind):
+    """
+    SAVEBINS: save the blocks in DATA to *.vtk file as big-
+    endian binary.
+
+    """
+    dtyp = np.dtype(VTK_t[kind][0]).newbyteorder(">")
+
+    for rows in data:
+        fptr.write(np.ascontiguousarray(
+            rows, dtype=dtyp).tobytes())
+
+    fptr.write(b"\n")
+
+    return
+
+
+def save_bins_attr(attr, fptr):
+    """
+    SAVE-BINS-ATTR: save a list of point/cell data arrays to
+    *.vtk file as a legacy FIELD.
+
+    """
+    fptr.write((
+        "FIELD FieldData " + str(len(attr)) + "\n"
+    ).encode("ascii"))
+
+    for name, kind, ncomp, size, data in attr:
+        fptr.write((
+            name + " " + str(ncomp) + " " +
+            str(size // ncomp) + " " + VTK_t[kind][1] + "\n"
+        ).encode("ascii"))
+
+        savebins(data, fptr, kind)
+
+    return
+
+
+def save_bins_mesh(mesh, fptr, quality):
+    """
+    SAVE-BINS-MESH: save a JIGSAW mesh object to *.VTK file,
+    in legacy binary format.
+
+    """
+    point = meshpoint(mesh)
+    cells = meshcells(mesh)
+
+    npts = sum(data.size for data in point)
+    ncel = sum(data.size for _, data, _, _ in cells)
+    nint = sum(data.size * (nnod + 1)
+               for _, data, nnod, _ in cells)
+
+    fptr.write((
+        "# vtk DataFile Version 3.0\n" +
+        Path(fptr.name).name + "\n" +
+        "BINARY\n" +
+        "DATASET UNSTRUCTURED_GRID\n" +
+        "POINTS " + str(npts) + " double\n"
+    ).encode("ascii"))
+
+    savebins(pointblk(point), fptr, "Float64")
+
+    fptr.write((
+        "CELLS " + str(ncel) + " " + str(nint) + "\n"
+    ).encode("ascii"))
+
+    savebins(legacyblk(cells), fptr, "Int32")
+
+    fptr.write((
+        "CELL_TYPES " + str(ncel) + "\n"
+    ).encode("ascii"))
+
+    savebins(typesblk(cells), fptr, "Int32")
+
+    fptr.write((
+        "POINT_DATA " + str(npts) + "\n"
+    ).encode("ascii"))
+
+    save_bins_attr(pointdata(mesh, point), fptr)
+
+    fptr.write((
+        "CELL_DATA " + str(ncel) + "\n"
+    ).encode("ascii"))
+
+    save_bins_attr(celldata(point, cells, quality), fptr)
+
+    return
+
+
+def save_bins_grid(mesh, fptr):
+    """
+    SAVE-BINS-GRID: save a JIGSAW grid object to *.VTK file,
+    in legacy binary format.
+
+    """
+    axes = gridaxes(mesh)
+    dims = [data.size for data in axes]
+
+    fptr.write((
+        "# vtk DataFile Version 3.0\n" +
+        Path(fptr.name).name + "\n" +
+        "BINARY\n" +
+        "DATASET RECTILINEAR_GRID\n" +
+        "DIMENSIONS " + " ".join(map(str, dims)) + "\n"
+    ).encode("ascii"))
+
+    for atag, data in zip("XYZ", axes):
+        fptr.write((
+            atag + "_COORDINATES " +
+            str(data.size) + " double\n").encode("ascii"))
+
+        savebins([data], fptr, "Float64")
+
+    attr = griddata(mesh, dims)
+
+    if (len(attr) != +0):
+        fptr.write((
+            "POINT_DATA " + str(np.prod(dims)) + "\n"
+        ).encode("ascii"))
+
+        save_bins_attr(attr, fptr)
+
+    return
+
+
+def zipdata(data, kind, spool, level):
+    """
+    ZIPDATA: compress the blocks in DATA to SPOOL via ZLIB,
+    as per VTK's zlib compressor.
+
+    Returns the block header and the no. of bytes spooled.
+
+    """
+    dtyp = np.dtype(VTK_t[kind][0])
+
+    buff = bytearray(); size = []; nall = +0
+
+    def flush(nbyte):
+        comp = zlib.compress(bytes(buff[:nbyte]), level)
+        spool.write(comp)
+        size.append(len(comp))
+        del buff[:nbyte]
+
+    for rows in data:
+        byte = np.ascontiguousarray(rows, dtype=dtyp)
+
+        buff += byte.tobytes(); nall += byte.nbytes
+
+        while (len(buff) >= BLOCK): flush(BLOCK)
+
+    if (len(buff) != +0): flush(len(buff))
+
+    head = np.array(
+        [len(size), BLOCK, nall % BLOCK] + size, "<u8")
+
+    return head.tobytes(), sum(size)
+
+
+def savexml(fptr, kind, gtag, ptag, sect, level):
+    """
+    SAVEXML: save a VTK xml file, with the arrays in SECT
+    written as raw appended data, compressed via ZLIB if
+    LEVEL is given.
+
+    Compressed blocks are spooled to a temp. file, so that
+    their offsets are known before the xml header is done.
+
+    An array's DATA may also be a (PATH, FPOS, NLEN) span of
+    a previous file, in which case its (encoded) blocks are
+    copied over as-is. Returns the span of each array, keyed
+    by (SECT, NAME).
+
+    """
+    spool = None
+    if (level is not None):
+        spool = tempfile.TemporaryFile()
+
+    pack = []; fpos = +0; text = []
+
+    for stag, attr in sect:
+    #----------------------------------- layout of each array
+        if (len(attr) == +0): continue
+
+        text.append("<" + stag + ">\n")
+
+        for name, vtyp, ncomp, size, data in attr:
+
+            if (isinstance(data, tuple)):
+                head, nbyte = b"", data[2]
+            elif (spool is None):
+                nbyte = size * \
+                    np.dtype(VTK_t[vtyp][0]).itemsize
+                head = np.array([nbyte], "<u8").tobytes()
+            else:
+                head, nbyte = zipdata(
+                    data, vtyp, spool, level)
+                data = None
+
+            text.append(
+                '<DataArray type="' + vtyp + '" ' +
+                'Name="' + name + '" ' +
+                'NumberOfComponents="' + str(ncomp) + '" ' +
+                'format="appended" ' +
+                'offset="' + str(fpos) + '"/>\n')
+
+            pack.append((stag, name, head, nbyte, vtyp, data))
+
+            fpos = fpos + len(head) + nbyte
+
+        text.append("</" + stag + ">\n")
+
+    ztag = ""
+    if (spool is not None):
+        ztag = ' compressor="vtkZLibDataCompressor"'
+
+    fptr.write((
+        '<?xml version="1.0"?>\n' +
+        '<VTKFile type="' + kind + '" version="1.0" ' +
+        'byte_order="LittleEndian" ' +
+        'header_type="UInt64"' + ztag + '>\n' +
+        "<" + kind + gtag + ">\n" +
+        "<Piece" + ptag + ">\n" + "".join(text) +
+        "</Piece>\n" + "</" + kind + ">\n" +
+        '<AppendedData encoding="raw">\n_'
+    ).encode("ascii"))
+
+    if (spool is not None): spool.seek(+0)
+
+    span = {}
+    for stag, name, head, nbyte, vtyp, data in pack:
+    #----------------------------------- append array blocks
+        fpos = fptr.tell()
+
+        fptr.write(head)
+
+        if (isinstance(data, tuple)):
+            with Path(data[0]).open("rb") as fsrc:
+                fsrc.seek(data[1])
+                while (nbyte > +0):
+                    byte = fsrc.read(min(nbyte, BLOCK))
+                    fptr.write(byte)
+                    nbyte = nbyte - len(byte)
+
+        elif (data is not None):
+            dtyp = np.dtype(VTK_t[vtyp][0])
+            for rows in data:
+                fptr.write(np.ascontiguousarray(
+                    rows, dtype=dtyp).tobytes())
+        else:
+            while (nbyte > +0):
+                byte = spool.read(min(nbyte, BLOCK))
+                fptr.write(byte)
+                nbyte = nbyte - len(byte)
+
+        span[(stag, name)] = (
+            fptr.name, fpos, fptr.tell() - fpos)
+
+    fptr.write(b"\n</AppendedData>\n</VTKFile>\n")
+
+    if (spool is not None): spool.close()
+
+    return span
+
+
+def save_xml_mesh(mesh, fptr, level, quality, reuse=None):
+    """
+    SAVE-XML-MESH: save a JIGSAW mesh object to *.VTU file.
+
+    REUSE is an optional dict. of spans, as returned by
+    SAVEXML, for the Points and Cells arrays of a previous
+    file with identical geometry. Returns the spans here.
+
+    """
+    point = meshpoint(mesh)
+    cells = meshcells(mesh)
+
+    npts = sum(data.size for data in point)
+    ncel = sum(data.size for _, data, _, _ in cells)
+    nint = sum(data.size * nnod
+               for _, data, nnod, _ in cells)
+
+    itag = "Int32" if nint < 2 ** 31 else "Int64"
+
+    sect = [
+        ("PointData", pointdata(mesh, point)),
+        ("CellData", celldata(point, cells, quality)),
+        ("Points", [
+            ("Points", "Float64", +3, npts * 3,
+             pointblk(point))]),
+        ("Cells", [
+            ("connectivity", "Int32", +1, nint,
+             fieldblk([data for _, data, _, _ in cells],
+                      "index")),
+            ("offsets", itag, +1, ncel, offsetblk(cells)),
+            ("types", "UInt8", +1, ncel, typesblk(cells))])
+    ]
+
+    if (reuse is not None):
+    #----------------------------------- copy prev. geometry
+        for stag, attr in sect[2:]:
+            attr[:] = [
+                item[:4] + (reuse[(stag, item[0])], )
+                for item in attr]
+
+    return savexml(
+        fptr, "UnstructuredGrid", "",
+        ' NumberOfPoints="' + str(npts) + '"' +
+        ' NumberOfCells="' + str(ncel) + '"',
+        sect, level)
+
+
+def save_xml_grid(mesh, fptr, level):
+    """
+    SAVE-XML-GRID: save a JIGSAW grid object to *.VTR file.
+
+    """
+    axes = gridaxes(mesh)
+    dims = [data.size for data in axes]
+
+    span = ' WholeExtent="' + " ".join(
+        "0 " + str(size - 1) for size in dims) + '"'
+
+    sect = [
+        ("PointData", griddata(mesh, dims)),
+        ("Coordinates", [
+            (atag, "Float64", +1, data.size, [data])
+            for atag, data in zip("xyz", axes)])
+    ]
+
+    return savexml(
+        fptr, "RectilinearGrid", span,
+        span.replace("WholeExtent", "Extent"),
+        sect, level)
+
+
+def save_cell_score(mesh, fptr):
+    """
+    SAVE-CELL-SCORE: save the cell quality metric to *.VTK
+    file, as ASCII cell data.
+
+    """
+    point = meshpoint(mesh)
+    cells = meshcells(mesh)
+
+    ncel = sum(data.size for _, data, _, _ in cells)
+
+    fptr.write("CELL_DATA " + str(ncel) + "\n")
+    fptr.write("SCALARS quality double 1\n")
+    fptr.write("LOOKUP_TABLE default \n")
+
+    for rows in scoreblk(point, cells):
+        saverows(rows, fptr, 9)
+
+    return
+
+
+def savevtk(name, mesh, kind="ascii",
+            level=None, quality=False):
     """
     SAVEVTK: save a JIGSAW MSH object to file.
 
-    SAVEVTK(NAME, MESH)
+    SAVEVTK(NAME, MESH, KIND="ascii", LEVEL=None,
+            QUALITY=False)
 
     MESH is JIGSAW's primary mesh/grid/geom class. See MSH_t
     for details.
@@ -353,6 +916,18 @@ def savevtk(name, mesh):
     Data in MESH is written as-needed -- any objects defined
     will be saved to file.
 
+    KIND="ascii" writes a legacy ASCII *.vtk file. KIND =
+    "binary" writes a legacy binary *.vtk file, and KIND =
+    "xml" a *.vtu (mesh) or *.vtr (grid) xml file, with raw
+    appended data, compressed via ZLIB if LEVEL = 1, 2, ...,
+    9 is given. Binary and xml files also carry the IDtag's
+    of points and cells as point/cell data, and are written
+    in blocks, straight from the arrays in MESH.
+
+    QUALITY=True adds the cell quality metric as cell data,
+    via TRISCR2 for TRIA3 and TRISCR3 for TRIA4 cells (NaN
+    for others).
+
     """
 
     if (not isinstance(name, str)):
@@ -361,13 +936,57 @@ def savevtk(name, mesh):
     if (not isinstance(mesh, jigsaw_msh_t)):
         raise TypeError("Incorrect type: MESH.")
 
+    if (not isinstance(kind, str)):
+        raise TypeError("Incorrect type: KIND.")
+
+    if (kind.lower() not in ["ascii", "binary", "xml"]):
+        raise ValueError("Invalid KIND: " + kind)
+
+    if (level is not None and not isinstance(level, int)):
+        raise TypeError("Incorrect type: LEVEL.")
+
+    if (level is not None and (level < 1 or level > 9)):
+        raise ValueError("Invalid LEVEL: " + str(level))
+
     certify(mesh)
 
+    ftyp = kind.lower()
+    kind = mesh.mshID.lower()
+
+    if (kind not in [
+            "euclidean-mesh", "ellipsoid-mesh",
+            "euclidean-grid", "ellipsoid-grid"]):
+        raise ValueError(
+            "MESH.mshID is not supported!!")
+
+    grid = kind.endswith("-grid")
+
     fext = Path(name).suffix
 
-    if (fext.strip() != ".vtk"): name += ".vtk"
+    ftag = ".vtk"
+    if (ftyp == "xml"): ftag = ".vtr" if grid else ".vtu"
 
-    kind = mesh.mshID.lower()
+    if (fext.strip() != ftag): name += ftag
+
+    if (ftyp == "binary"):
+    #----------------------------------- write legacy binary
+        with Path(name).open("wb") as fptr:
+            if (grid):
+                save_bins_grid(mesh, fptr)
+            else:
+                save_bins_mesh(mesh, fptr, quality)
+
+        return
+
+    if (ftyp == "xml"):
+    #----------------------------------- write xml + append
+        with Path(name).open("wb") as fptr:
+            if (grid):
+                save_xml_grid(mesh, fptr, level)
+            else:
+                save_xml_mesh(mesh, fptr, level, quality)
+
+        return
 
     with Path(name).open("w") as fptr:
     #----------------------------------- write JIGSAW object
@@ -387,8 +1006,8 @@ def savevtk(name, mesh):
 
             save_grid_file(mesh, fptr)
 
-        else:
-            raise ValueError(
-                "MESH.mshID is not supported!!")
+        if (quality and not grid):
+
+            save_cell_score(mesh, fptr)
 
     return
@@ -1,10 +1,10 @@
 
 import warnings
 from pathlib import Path
-import numpy as np
 
 from jigsawpy.msh_t import jigsaw_msh_t
 from jigsawpy.certify import certify
+from jigsawpy.savemsh import saverows
 
 
 def savepoint(data, fptr, ndim, ctag):
@@ -12,26 +12,9 @@ def savepoint(data, fptr, ndim, ctag):
     SAVEPOINT: save the POINT data structure to *.obj file.
 
     """
-    rmax = 2 ** 19; next = 0
+    tail = " 0" if ndim < 3 else ""
 
-    while (next < data.shape[0]):
-
-        nrow = min(rmax, data.shape[0] - next)
-        nend = next + nrow
-
-        sfmt = " ".join(["%.17g"] * ndim)
-
-        if (ndim < 3): sfmt = sfmt + " 0"
-
-        sfmt = ctag + sfmt
-        sfmt = sfmt + "\n"
-        sfmt = sfmt * nrow
-
-        fdat = sfmt % tuple(data[next:nend, :].ravel())
-
-        fptr.write(fdat)
-
-        next = next + nrow
+    saverows(data, fptr, 17, " ", ctag, tail)
 
     return
 
@@ -41,24 +24,8 @@ def savecells(data, fptr, nnod, ctag):
     SAVECELLS: save the CELLS data structure to *.obj file.
 
     """
-    rmax = 2 ** 19; next = 0
-
-    indx = np.array(data[:, :]) + 1
-
-    while (next < data.shape[0]):
-
-        nrow = min(rmax, data.shape[0] - next)
-        nend = next + nrow
-
-        sfmt = " ".join(["%d"] * nnod) + "\n"
-        sfmt = ctag + sfmt
-        sfmt = sfmt * nrow
-
-        fdat = sfmt % tuple(indx[next:nend, :].ravel())
-
-        fptr.write(fdat)
-
-        next = next + nrow
+#-- 1-based indexing, via a scratch buffer per block of rows
+    saverows(data, fptr, None, " ", ctag, "", +1)
 
     return
 
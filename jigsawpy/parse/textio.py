@@ -0,0 +1,238 @@
+
+import numpy as np
+
+
+def lineblocks(fptr, size=2 ** 22):
+    """
+    LINEBLOCKS: iterate over blocks of whole lines in FPTR,
+    of roughly SIZE bytes each.
+
+    """
+    tail = b""
+    while (True):
+        data = fptr.read(size)
+
+        if (len(data) == +0): break
+
+        data = tail + data
+        npos = data.rfind(b"\n")
+
+        if (npos < +0):
+            tail = data; continue
+
+        tail = data[npos + 1:]
+
+        yield data[:npos + 1]
+
+    if (len(tail) != +0): yield tail + b"\n"
+
+
+def blankafter(byte, mark, head):
+    """
+    BLANKAFTER: blank the bytes from each MARK to the end of
+    its segment, where HEAD flags the 1st byte of segments.
+
+    """
+    ipos = np.arange(byte.size, dtype=np.int32)
+
+    last = np.maximum.accumulate(
+        np.where(mark, ipos, -1))
+    base = np.maximum.accumulate(
+        np.where(head, ipos, +0))
+
+    byte[last >= base] = ord(" ")
+
+    return
+
+
+def parserows(text, keys=None):
+    """
+    PARSEROWS: parse a block of ASCII lines into numbers.
+
+    VALS, LNUM, KIND = PARSEROWS(TEXT, KEYS=None)
+
+    VALS is a flat array of the (float64) numbers in TEXT,
+    and LNUM the no. of numbers found in each line. Text
+    after a "#" (comments) or a "/" within a token (OBJ's
+    v/vt/vn triplets) is ignored.
+
+    KEYS is an optional list of keywords, i.e. [b"v", b"f"].
+    Lines are then parsed only if their first token is in
+    KEYS, with KIND = 1, 2, ... the matching key for each
+    line, and KIND = 0 for lines skipped.
+
+    Lines are processed as whole blocks of bytes via NUMPY
+    masks, with no per-line python overhead.
+
+    """
+    byte = np.frombuffer(text, dtype=np.uint8).copy()
+
+    eol = byte == ord("\n")
+    epos = np.flatnonzero(eol)
+    nlin = epos.size + int(not eol[-1]) \
+        if byte.size else +0
+
+    if (text.find(b"#") >= +0):
+    #-- strip comments, to end-of-line
+        lhead = np.empty(byte.size, dtype=bool)
+        lhead[0] = True; lhead[1:] = eol[:-1]
+
+        blankafter(byte, byte == ord("#"), lhead)
+
+    wsp = byte <= ord(" ")              # incl. \t, \r, \n
+
+    thead = ~wsp
+    thead[1:] &= wsp[:-1]
+
+    tpos = np.flatnonzero(thead)
+    tlin = np.searchsorted(epos, tpos)  # line of each token
+
+    kind = np.zeros(nlin, dtype=np.int8)
+    if (keys is not None):
+    #-- match the 1st token in each line against KEYS
+        head = np.r_[True, np.diff(tlin) != 0]
+        lpos = tpos[head]
+
+        for knum, ktag in enumerate(keys):
+            okay = np.ones(lpos.size, dtype=bool)
+
+            for inum in range(len(ktag) + 1):
+                near = np.minimum(
+                    lpos + inum, byte.size - 1)
+
+                if (inum < len(ktag)):
+                    okay &= byte[near] == ktag[inum]
+                else:
+                    okay &= wsp[near]
+
+            kind[tlin[head][okay]] = knum + 1
+
+            for inum in range(len(ktag)):
+                byte[lpos[okay] + inum] = ord(" ")
+
+    #-- skip any lines that didn't match
+        if (np.any(kind[tlin[head]] == 0)):
+            lnow = np.cumsum(eol, dtype=np.int32) - eol
+
+            byte[(kind == 0)[lnow] & ~eol] = ord(" ")
+
+        okay = ~head & (kind[tlin] != 0)
+        tpos = tpos[okay]
+        tlin = tlin[okay]
+
+    if (text.find(b"/") >= +0):
+    #-- strip OBJ-style "/vt/vn" suffixes, within each token
+        blankafter(byte, byte == ord("/"), thead)
+
+    lnum = np.bincount(tlin, minlength=nlin).astype(np.int64)
+
+#-- int-only blocks (i.e. faces) parse much faster as ints
+    text = byte.tobytes()
+
+    isint = len(text.translate(
+        None, b"0123456789- \t\r\n")) == +0
+
+    vals = np.fromstring(
+        text, sep=" ",
+        dtype=np.int64 if isint else np.float64)
+
+    vals = vals.astype(np.float64, copy=False)
+
+    if (vals.size != lnum.sum()):
+        raise ValueError(
+            "Invalid data: expected " +
+            str(lnum.sum()) + " items, found " +
+            str(vals.size))
+
+    return vals, lnum, kind
+
+
+def cellrows(vals, offs, nnod):
+    """
+    CELLROWS: gather the NNOD items starting at each offset
+    OFFS into an N-by-NNOD array.
+
+    """
+    return vals[offs[:, np.newaxis] +
+                np.arange(nnod)[np.newaxis, :]]
+
+
+def polygons(vals, offs, lnum):
+    """
+    POLYGONS: split variable-length polygon lists into the
+    TRIA3 and QUAD4 cells, fan-triangulating any N-gons.
+
+    TRIA, QUAD = POLYGONS(VALS, OFFS, LNUM)
+
+    Polygon I has LNUM[I] vertex indices in VALS, beginning
+    at OFFS[I].
+
+    """
+    tria = [cellrows(vals, offs[lnum == 3], 3)]
+    quad = [cellrows(vals, offs[lnum == 4], 4)]
+
+    mask = lnum > +4
+    if (np.any(mask)):
+    #-- fan from the 1st vertex of each N-gon: N - 2 trias
+        ntri = lnum[mask] - 2
+        base = np.repeat(offs[mask], ntri)
+        next = np.arange(ntri.sum()) - \
+            np.repeat(np.cumsum(ntri) - ntri, ntri) + 1
+
+        tria.append(np.stack((
+            vals[base],
+            vals[base + next],
+            vals[base + next + 1]), axis=1))
+
+    return np.concatenate(tria), np.concatenate(quad)
+
+
+def polylines(vals, offs, lnum):
+    """
+    POLYLINES: split variable-length polylines into EDGE2
+    cells, joining consecutive vertices.
+
+    """
+    mask = lnum >= +2
+
+    nedg = lnum[mask] - 1
+    base = np.repeat(offs[mask], nedg)
+    next = np.arange(nedg.sum()) - \
+        np.repeat(np.cumsum(nedg) - nedg, nedg)
+
+    return np.stack((
+        vals[base + next],
+        vals[base + next + 1]), axis=1)
+
+
+def setmesh(mesh, vert, edge=None, tria=None, quad=None):
+    """
+    SETMESH: assign the VERT3, EDGE2, TRIA3 and QUAD4 arrays
+    of a 3-dim. surface MESH.
+
+    """
+    mesh.mshID = "euclidean-mesh"
+    mesh.ndims = +3
+
+    mesh.vert3 = np.zeros(
+        vert.shape[0], dtype=mesh.VERT3_t)
+    mesh.vert3["coord"] = vert
+
+    for field, data in [
+            ("edge2", edge), ("tria3", tria),
+            ("quad4", quad)]:
+
+        if (data is None or data.size == +0): continue
+
+        if (np.any(data < 0) or
+                np.any(data >= vert.shape[0])):
+            raise ValueError(
+                "Invalid " + field.upper() + " indexing.")
+
+        cell = np.zeros(data.shape[0], dtype=getattr(
+            mesh, field.upper() + "_t"))
+        cell["index"] = data
+
+        setattr(mesh, field, cell)
+
+    return
@@ -0,0 +1,319 @@
+
+import os
+import re
+import ctypes as ct
+import ctypes.util
+import platform
+import shutil
+import subprocess
+
+from pathlib import Path
+
+#---------------------------- env. overrides for exe. / lib.
+BINPATH = "JIGSAWPY_BIN"        # dir. with jigsaw, tripod..
+LIBPATH = "JIGSAWPY_LIB"        # path to libjigsaw.so, etc
+
+#---------------------------- artifacts built with jigsawpy
+FILEPATH = Path(__file__).resolve().parent
+
+WIN = "Windows"
+LNX = "Linux"
+MAC = "Darwin"
+
+CACHE = {}
+
+
+def reset():
+    """
+    RESET: clear all cached exe./lib. paths and probes, i.e.
+    after (re)installing JIGSAW while running.
+
+    """
+    CACHE.clear()
+
+    return
+
+
+def exename(name):
+    """
+    EXENAME: return the file name of the executable NAME on
+    this platform.
+
+    """
+    return name + ".exe" if os.name == "nt" else name
+
+
+def libname():
+    """
+    LIBNAME: return the file name of JIGSAW's shared library
+    on this platform.
+
+    """
+    if   (platform.system() == WIN):
+        return "jigsaw.dll"
+
+    elif (platform.system() == MAC):
+        return "libjigsaw.dylib"
+
+    return "libjigsaw.so"
+
+
+def scanexe(name, root):
+    """
+    SCANEXE: search for the executable NAME, in ROOT only if
+    non-empty, else in the "local" _bin, then on the PATH.
+
+    """
+    if (root != ""):
+    #------------------------ env. override: look here only!
+        path = Path(root) / exename(name)
+
+        return path if path.is_file() else Path()
+
+#---------------------------- set-up path for "local" binary
+    path = FILEPATH / "_bin" / exename(name)
+
+    if (path.is_file()): return path
+
+#---------------------------- search machine path for binary
+    scan = shutil.which(name)
+
+    return Path(scan) if scan is not None else Path()
+
+
+def scanlib(root):
+    """
+    SCANLIB: search for JIGSAW's shared library, at ROOT if
+    non-empty (a file, or dir.), else in the "local" _lib,
+    then the machine's loader path.
+
+    """
+    if (root != ""):
+    #------------------------ env. override: look here only!
+        path = Path(root)
+
+        if (path.is_dir()): path = path / libname()
+
+        return path if path.is_file() else Path()
+
+#---------------------------- set-up path for "local" binary
+    path = FILEPATH / "_lib" / libname()
+
+    if (path.is_file()): return path
+
+#---------------------------- search machine path for binary
+    if (platform.system() == WIN):
+        scan = ctypes.util.find_library(libname())
+
+        return Path(scan) if scan is not None else Path()
+
+    return Path(libname())      # via LD_LIBRARY_PATH, etc
+
+
+def findexe(name):
+    """
+    FINDEXE: return the path to JIGSAW's executable NAME.
+
+    PATH = FINDEXE(NAME)
+
+    NAME is one of "jigsaw", "tripod" or "marche". Returns
+    PATH() if no executable is found.
+
+    If the JIGSAWPY_BIN env. variable is set, executables are
+    taken from that dir. only. Otherwise, the "local" build
+    in jigsawpy/_bin is used, then the machine PATH.
+
+    Paths are found once, and cached thereafter, as are any
+    misses -- see RESET to search again.
+
+    """
+    root = os.environ.get(BINPATH, "")
+
+    ckey = ("exe", name, root)
+    if (ckey not in CACHE):
+        CACHE[ckey] = scanexe(name, root)
+
+    return CACHE[ckey]
+
+
+def findlib():
+    """
+    FINDLIB: return the path to JIGSAW's shared library.
+
+    PATH = FINDLIB()
+
+    If the JIGSAWPY_LIB env. variable is set, the library is
+    taken from that file (or dir.) only. Otherwise, the
+    "local" build in jigsawpy/_lib is used, then the machine
+    loader path. Returns PATH() if no library is found.
+
+    Paths are cached as per FINDEXE.
+
+    """
+    root = os.environ.get(LIBPATH, "")
+
+    ckey = ("lib", root)
+    if (ckey not in CACHE):
+        CACHE[ckey] = scanlib(root)
+
+    return CACHE[ckey]
+
+
+def loadlib():
+    """
+    LOADLIB: load JIGSAW's shared library via CTYPES, on the
+    first call only, see FINDLIB.
+
+    JLIB = LOADLIB()
+
+    """
+    path = findlib()
+
+    ckey = ("dll", str(path))
+    if (ckey not in CACHE):
+        if (path == Path()):
+            raise ValueError("JIGSAW lib. not found")
+
+        try:
+            CACHE[ckey] = ct.cdll.LoadLibrary(str(path))
+
+        except OSError:
+            raise ValueError(
+                "JIGSAW lib. not found: " + str(path))
+
+    return CACHE[ckey]
+
+
+class dlinfo_t(ct.Structure):
+#---------------------------- dladdr's Dl_info, via ctypes
+    _fields_ = [
+        ("dli_fname", ct.c_char_p),
+        ("dli_fbase", ct.c_void_p),
+        ("dli_sname", ct.c_char_p),
+        ("dli_saddr", ct.c_void_p)]
+
+
+def libfile(jlib):
+    """
+    LIBFILE: return the path of the file the loaded lib.
+    JLIB was mapped from, or None if it cannot be found.
+
+    """
+    try:
+        if (platform.system() == WIN):
+            buff = ct.create_unicode_buffer(32768)
+
+            size = ct.windll.kernel32.GetModuleFileNameW(
+                ct.c_void_p(jlib._handle), buff, len(buff))
+
+            return buff.value if size > +0 else None
+
+        info = dlinfo_t()
+        if (ct.CDLL(None).dladdr(
+                ct.cast(jlib.jigsaw, ct.c_void_p),
+                ct.byref(info)) == +0):
+            return None
+
+        return os.fsdecode(info.dli_fname)
+
+    except (AttributeError, OSError):
+        return None
+
+
+def libstamp():
+    """
+    LIBSTAMP: return a string identifying the JIGSAW lib.
+    loaded via LOADLIB, i.e. to key cached results on.
+
+    STAMP = LIBSTAMP()
+
+    STAMP is the resolved path of the lib.'s file, with its
+    size and modification time, such that a rebuilt or
+    swapped lib. gives a new STAMP. The file is found via
+    the loader if FINDLIB gives a bare name. The STAMP is
+    cached, as the loaded lib. does not change until exit.
+
+    """
+    jlib = loadlib()
+
+    ckey = ("stamp", str(findlib()))
+    if (ckey not in CACHE):
+        path = libfile(jlib)
+
+        if (path is None): path = str(findlib())
+
+        try:
+            stat = os.stat(path)
+
+            CACHE[ckey] = "%s;%u;%u" % (
+                os.path.realpath(path),
+                stat.st_size, stat.st_mtime_ns)
+
+        except OSError:
+            CACHE[ckey] = path
+
+    return CACHE[ckey]
+
+
+def version(name="jigsaw"):
+    """
+    VERSION: return the version string of the executable
+    NAME, i.e. "1.0.0", or None if not found.
+
+    The executable is run once with "--version", and the
+    result cached.
+
+    """
+    path = findexe(name)
+
+    if (path == Path()): return None
+
+    ckey = ("ver", str(path))
+    if (ckey not in CACHE):
+        try:
+            text = subprocess.run(
+                [str(path), "--version"],
+                stdout=subprocess.PIPE,
+                stderr=subprocess.STDOUT,
+                timeout=30.).stdout
+
+        except (OSError, subprocess.SubprocessError):
+            text = b""
+
+        vstr = re.search(
+            rb"VERSION\s+([0-9][\w.]*)", text)
+
+        CACHE[ckey] = vstr.group(1).decode() \
+            if vstr is not None else None
+
+    return CACHE[ckey]
+
+
+def probe():
+    """
+    PROBE: return the JIGSAW backends available here.
+
+    INFO = PROBE()
+
+    INFO is a dict. with entries "jigsaw", "tripod" and
+    "marche", the path to each executable (or None), and
+    "libsaw", the path to the shared library (or None) if it
+    can be loaded. INFO["version"] is the version of the
+    JIGSAW executable, see VERSION.
+
+    """
+    info = {}
+    for name in ["jigsaw", "tripod", "marche"]:
+        path = findexe(name)
+
+        info[name] = str(path) if path != Path() else None
+
+    try:
+        loadlib(); info["libsaw"] = str(findlib())
+
+    except ValueError:
+        info["libsaw"] = None
+
+    info["version"] = version("jigsaw")
+
+    return info
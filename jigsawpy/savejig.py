@@ -2,6 +2,8 @@
 from pathlib import Path
 from jigsawpy.jig_t import jigsaw_jig_t
 
+from jigsawpy import zipio
+
 
 def savechar(fptr, sval, stag):
 
@@ -52,11 +54,11 @@ def savebool(fptr, bval, stag):
     return
 
 
-def savejig(name, opts):
+def savejig(name, opts, level=None):
     """
     SAVEJIG: save a JIG config. obj. to file.
 
-    SAVEJIG(NAME, OPTS)
+    SAVEJIG(NAME, OPTS, LEVEL=None)
 
     OPTS is a user-defined set of meshing options. See JIG_t
     for details.
@@ -64,6 +66,10 @@ def savejig(name, opts):
     Data in OPTS is written as-needed -- any objects defined
     will be saved to file.
 
+    NAME's ending in *.jig.gz, *.jig.xz or *.jig.bz2 are
+    compressed on the fly, with LEVEL setting the compression
+    effort. See ZIPIO for details.
+
     """
 
     if (not isinstance(name, str)):
@@ -72,11 +78,9 @@ def savejig(name, opts):
     if (not isinstance(opts, jigsaw_jig_t)):
         raise TypeError("Incorrect type: OPTS.")
 
-    fext = Path(name).suffix
-
-    if (fext.strip() != ".jig"): name = name + ".jig"
+    name = zipio.zipname(name, ".jig")
 
-    with Path(name).open("w") as fptr:
+    with zipio.zipopen(name, "w", level) as fptr:
 
         fptr.write(
             "# " + Path(name).name +
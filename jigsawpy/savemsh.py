@@ -1,11 +1,24 @@
 
-from pathlib import Path
+import os
+from concurrent.futures import ThreadPoolExecutor
 import numpy as np
-from numpy.lib import recfunctions as rfn
 
 from jigsawpy.msh_t import jigsaw_msh_t
 from jigsawpy.certify import certify
 
+from jigsawpy import msh_b, zipio
+from jigsawpy.loadmsh import scanner, headers, sidecar, \
+    loadhead, loadslot, msh_info
+
+
+class args_t(object):
+#------------------------------ write params. for SAVEMSH, etc
+    def __init__(self, kind="ascii", prec=None):
+        self.kind = kind.lower()        # "ascii" / "binary"
+        self.prec = prec                # sig. digits, or None
+        self.nver = 3                   # *.msh format version
+        self.side = None                # sidecar file prefix
+
 
 def saveradii(mesh, fptr, args):
     """
@@ -29,323 +42,602 @@ def saveradii(mesh, fptr, args):
     return
 
 
-def savevert2(ftag, data, fptr, args):
+#-- 10^N as an unevaluated sum HI + LO, exact for N <= 44
+PTHI_ = np.array(
+    [float(10 ** npow) for npow in range(45)])
+PTLO_ = np.array(
+    [float(10 ** npow - int(float(10 ** npow)))
+     for npow in range(45)])
+
+#-- 10^N as int64, for N <= 18
+PTINT = np.array(
+    [10 ** npow for npow in range(19)], dtype=np.int64)
+
+
+def fmtdigs(mint, ndig):
     """
-    SAVEVERT2: save the POINT data structure to *.msh file.
+    FMTDIGS: return the NDIG decimal digits of the ints in
+    MINT as an N-by-NDIG array of ASCII codes.
 
     """
-    fptr.write(ftag + "=" + str(data.size) + "\n")
+    char = np.empty(
+        (mint.size, ndig), dtype=np.uint8, order="F")
 
-    rmax = 2 ** 19; next = 0; prec = 17
+#-- split into 9-digit parts, to divide as uint32 values
+    for ipos in range(ndig, +0, -9):
+        if (ipos > +9):
+            part = (mint % PTINT[9]).astype(np.uint32)
+            mint = mint // PTINT[9]
+        else:
+            part = mint.astype(np.uint32)
 
-    while (next < data.size):
+        for inum in range(ipos - 1, max(ipos - 9, 0) - 1, -1):
+            quot = part // 10
+            char[:, inum] = part - quot * 10 + ord("0")
+            part = quot
 
-        nrow = min(rmax, data.size - next)
-        nend = next + nrow
+    return char
 
-        sfmt = "%%.%ug" % prec
 
-        sfmt = ";".join([sfmt] * 2) + ";%d\n"
-        sfmt = sfmt * nrow
+def fmtints(vals):
+    """
+    FMTINTS: format an integer array as a char. matrix.
 
-        fdat = sfmt % tuple(
-            rfn.structured_to_unstructured(
-                data[next:nend], dtype=np.float64).ravel())
+    Returns an N-by-M array of the ASCII codes for the "%d"
+    repr. of each entry in VALS, with any unused chars. set
+    to zero.
 
-        fptr.write(fdat)
+    """
+    vals = np.asarray(vals, dtype=np.int64)
+    aval = np.abs(vals)
 
-        next = next + nrow
+    nlen = +1
+    if (aval.size > +0):
+        nlen = len(str(int(aval.max())))
 
-    return
+    char = np.zeros((vals.size, nlen + 1), dtype=np.uint8)
 
+    char[:, 0] = np.where(vals < 0, ord("-"), 0)
 
-def savevert3(ftag, data, fptr, args):
+    char[:, 1:] = fmtdigs(aval, nlen)
+
+#-- zero any leading digits, keeping the last for "0"
+    char[:, 1:nlen] *= \
+        aval[:, None] >= PTINT[nlen - 1:0:-1][None, :]
+
+    return char
+
+
+def split53(xval):
     """
-    SAVEVERT3: save the POINT data structure to *.msh file.
+    SPLIT53: split reals into 26-bit HI + LO parts (Dekker).
 
     """
-    fptr.write(ftag + "=" + str(data.size) + "\n")
+    cval = xval * 134217729.
+    xbig = cval - (cval - xval)
 
-    rmax = 2 ** 19; next = 0; prec = 17
+    return xbig, xval - xbig
 
-    while (next < data.size):
 
-        nrow = min(rmax, data.size - next)
-        nend = next + nrow
+def times53(aval, bval):
+    """
+    TIMES53: return the product AVAL * BVAL as an unevaluated
+    sum HI + LO, exactly (Dekker).
 
-        sfmt = "%%.%ug" % prec
+    """
+    ahi_, alo_ = split53(aval)
+    bhi_, blo_ = split53(bval)
 
-        sfmt = ";".join([sfmt] * 3) + ";%d\n"
-        sfmt = sfmt * nrow
+    prod = aval * bval
+    perr = (((ahi_ * bhi_ - prod) + ahi_ * blo_) +
+            alo_ * bhi_) + alo_ * blo_
 
-        fdat = sfmt % tuple(
-            rfn.structured_to_unstructured(
-                data[next:nend], dtype=np.float64).ravel())
+    return prod, perr
 
-        fptr.write(fdat)
 
-        next = next + nrow
+def round53(rval, rerr):
+    """
+    ROUND53: return RINT(RVAL + RERR), ties to even, where
+    RERR is a small residual, |RERR| < 1.
 
-    return
+    """
+    flor = np.floor(rval)
+    frac = ((rval - flor) - .5) + rerr
+    fint = np.floor(frac)
 
+    mval = fint + 1. - np.logical_and(
+        frac == fint, np.mod(flor + fint, 2.) == 0.)
 
-def savevalue(ftag, data, fptr, args):
+#-- RVAL is an (even) integer beyond 2^53, RINT the error
+    return np.where(
+        rval >= 2. ** 53,
+        rval.astype(np.int64) + np.rint(rerr).astype(np.int64),
+        flor.astype(np.int64) + mval.astype(np.int64))
+
+
+def subset(mask):
     """
-    SAVEVALUE: save the ARRAY data structure to *.msh file.
+    SUBSET: return an index for the TRUE items in MASK, or
+    None if there are none -- a slice if all are TRUE.
 
     """
-    if (np.ndim(data) == +1):
-        data = np.reshape(data, (data.size, +1))
+    ipos = np.flatnonzero(mask)
 
-    npos = np.size(data, 0)
-    nval = np.size(data, 1)
+    if (ipos.size == +0): return None
 
-    fptr.write(
-        ftag + "=" + str(npos) + ";" + str(nval) + "\n")
+    if (ipos.size == mask.size): return slice(None)
 
-    rmax = 2 ** 19; next = 0; prec = 17
+    return ipos
 
-    if (data.dtype == np.float32):
-        prec = 9
 
-    while (next < data.shape[0]):
+def scale10(aval, scal):
+    """
+    SCALE10: return RINT(AVAL * 10^SCAL), rounding ties to
+    even, as per printf.
 
-        nrow = min(rmax, data.shape[0] - next)
-        nend = next + nrow
+    Computed in float64 arithmetic via exact products and
+    residuals where possible, with any remaining cases (very
+    large or small AVAL) done item-by-item.
+
+    """
+    mval = np.zeros(aval.size, dtype=np.int64)
+    sabs = np.abs(scal)
 
-        sfmt = "%%.%ug" % prec
+    smul = np.logical_and(scal >= 0, sabs < PTHI_.size)
 
-        sfmt = ";".join([sfmt] * nval) + "\n"
-        sfmt = sfmt * nrow
+    sdiv = np.logical_and(scal < 0, aval < 2. ** 53)
 
-        fdat = sfmt % tuple(data[next:nend:, :].ravel())
+    sint = np.logical_and.reduce((
+        scal < 0, aval >= 2. ** 53, aval < 2. ** 63))
 
-        fptr.write(fdat)
+#-- A * 10^S, as the exact HI + LO product
+    ipos = subset(smul)
+    if (ipos is not None):
+        anow = aval[ipos]; snow = sabs[ipos]
 
-        next = next + nrow
+        prod, perr = times53(anow, PTHI_[snow])
+        perr = perr + anow * PTLO_[snow]
 
-    return
+        mval[ipos] = round53(prod, perr)
 
+#-- A / 10^S, with the exact remainder A - Q * 10^S
+    ipos = subset(sdiv)
+    if (ipos is not None):
+        anow = aval[ipos]; pten = PTHI_[sabs[ipos]]
 
-def saveedge2(data, fptr, args):
+        quot = anow / pten
+
+        prod, perr = times53(quot, pten)
+        rerr = ((anow - prod) - perr) / pten
+
+        mval[ipos] = round53(quot, rerr)
+
+#-- A is an int. here, so integer divide by 10^S
+    ipos = subset(sint)
+    if (ipos is not None):
+        anow = aval[ipos].astype(np.int64)
+        pten = PTINT[sabs[ipos]]
+
+        quot, rrem = np.divmod(anow, pten)
+
+        mval[ipos] = quot + np.logical_or(
+            2 * rrem > pten,
+            np.logical_and(2 * rrem == pten, quot % 2 == 1))
+
+#-- anything else item-by-item, with exact int. ratios
+    ipos = np.flatnonzero(~np.logical_or.reduce((
+        smul, sdiv, sint)))
+
+    for inum in ipos.tolist():
+        numr, deno = float(aval[inum]).as_integer_ratio()
+
+        if (scal[inum] >= 0):
+            numr = numr * 10 ** int(+scal[inum])
+        else:
+            deno = deno * 10 ** int(-scal[inum])
+
+        quot, rrem = divmod(numr, deno)
+
+        if (2 * rrem > deno or
+                (2 * rrem == deno and quot % 2 == 1)):
+            quot = quot + 1
+
+        mval[inum] = quot
+
+    return mval
+
+
+def fmtreal(vals, prec):
     """
-    SAVEEDGE2: save the EDGE2 data structure to *.msh file.
+    FMTREAL: format a real array as a char. matrix.
+
+    Returns an N-by-M array of the ASCII codes for the "%.Pg"
+    repr. of each entry in VALS, where P = PREC, with any
+    unused chars. set to zero.
 
     """
-    fptr.write("EDGE2=" + str(data.size) + "\n")
+    xval = np.asarray(vals, dtype=np.float64)
+
+    okay = np.logical_and(np.isfinite(xval), xval != 0.)
+
+    aval = np.where(okay, np.abs(xval), 1.)
+
+#-- decimal exponent + PREC digit mantissa, s.t. 10^(P-1)
+#-- <= MINT < 10^P, with LOG10 fixed-up near powers of 10
+#-- (MINT = 10^(P-1) may be AVAL < 10^E rounded up, so is
+#-- re-done one digit finer too)
+    mmin = 10 ** (prec - 1)
+    mmax = 10 ** (prec - 0)
+
+    iexp = np.floor(np.log10(aval)).astype(np.int64)
 
-    rmax = 2 ** 19; next = 0
+    mint = scale10(aval, prec - 1 - iexp)
 
-    while (next < data.size):
+    redo = np.flatnonzero(
+        np.logical_or(mint > mmax, mint <= mmin))
 
-        nrow = min(rmax, data.size - next)
-        nend = next + nrow
+    if (redo.size > +0):
+        iexp[redo] += \
+            (mint[redo] > mmax).astype(np.int64) - \
+            (mint[redo] <= mmin).astype(np.int64)
 
-        sfmt = ";".join(["%d"] * 2) + ";%d\n"
-        sfmt = sfmt * nrow
+        mint[redo] = scale10(
+            aval[redo], prec - 1 - iexp[redo])
 
-        fdat = sfmt % tuple(
-            rfn.structured_to_unstructured(
-                data[next:nend], dtype=np.int32).ravel())
+    over = mint >= mmax
+    mint[over] = mmin
+    iexp[over] = iexp[over] + 1
 
-        fptr.write(fdat)
+    dval = fmtdigs(mint, prec)
 
-        next = next + nrow
+#-- no. of digits, once any trailing zeros are stripped
+    ndig = np.full(xval.size, prec, dtype=np.int64)
+    tail = np.ones(xval.size, dtype=bool)
+    for ipos in range(prec - 1, +0, -1):
+        tail &= dval[:, ipos] == ord("0")
+        ndig -= tail
 
-    return
+#-- %g: exponent form if E < -4 or E >= P, else as fixed
+    expo = np.logical_or(iexp < -4, iexp >= prec)
+    ineg = np.logical_and(~expo, iexp < +0)
+    ipos = np.logical_and(~expo, iexp >= 0)
 
+    nlen = np.maximum(ndig, np.where(ipos, iexp + 1, 1))
+    dpos = np.where(ipos, iexp, np.where(ineg, -1, 0))
+    dpos = np.where(
+        np.logical_and(dpos >= 0, dpos < ndig - 1),
+        dpos, prec + 1)
 
-def savetria3(data, fptr, args):
+    nlen = nlen.astype(np.int8)
+    dpos = dpos.astype(np.int8)
+
+#-- only allocate the "0.000" and "e+000" parts if needed
+    nneg = +5 if np.any(ineg) else +0
+    nexp = +5 if np.any(expo) else +0
+
+    char = np.zeros((xval.size, max(
+        +4, 1 + nneg + prec + 1 + nexp)), dtype=np.uint8)
+
+    char[:, 0] = np.where(np.signbit(xval), ord("-"), 0)
+
+    if (nneg > +0):
+#-- "0.000" prefix for fixed reals with E < 0
+        cpos = np.arange(+5)
+        char[:, 1:6] = \
+            np.frombuffer(b"0.000", dtype=np.uint8) * \
+            np.logical_and(
+                ineg[:, None], cpos[None, :] < 1 - iexp[:, None])
+
+#-- mantissa digits, with the decimal point after DPOS
+    cpos = np.arange(prec + 1, dtype=np.int8)
+    dval = np.pad(
+        dval * (cpos[None, :-1] < nlen[:, None]), ((0, 0), (1, 1)))
+
+    char[:, 1 + nneg:2 + nneg + prec] = np.where(
+        cpos[None, :] <= dpos[:, None], dval[:, 1:],
+        np.where(
+            cpos[None, :] == dpos[:, None] + 1,
+            ord("."), dval[:, :-1]))
+
+    if (nexp > +0):
+#-- "e+000" suffix for reals in exponent form
+        ipos = 2 + nneg + prec
+        aexp = np.abs(iexp)
+
+        char[:, ipos + 0] = np.where(expo, ord("e"), 0)
+        char[:, ipos + 1] = np.where(
+            expo, np.where(iexp < 0, ord("-"), ord("+")), 0)
+        char[:, ipos + 2] = np.where(
+            np.logical_and(expo, aexp >= 100),
+            aexp // 100 % 10 + ord("0"), 0)
+        char[:, ipos + 3] = np.where(
+            expo, aexp // 10 % 10 + ord("0"), 0)
+        char[:, ipos + 4] = np.where(
+            expo, aexp // 1 % 10 + ord("0"), 0)
+
+#-- zero, inf. and nan. are special-cased, as per printf
+    for name, mask in [
+            (b"0", xval == 0.),
+            (b"inf", np.isinf(xval)),
+            (b"nan", np.isnan(xval))]:
+
+        if (not np.any(mask)): continue
+
+        char[mask, 1:] = 0
+        char[mask, 1:1 + len(name)] = \
+            np.frombuffer(name, dtype=np.uint8)
+
+    char[np.isnan(xval), 0] = 0
+
+    return char
+
+
+def columns(rows):
     """
-    SAVETRIA3: save the TRIA3 data structure to *.msh file.
+    COLUMNS: return the columns of ROWS as a list of 1-dim.
+    strided views onto ROWS, with no data copied.
+
+    ROWS is an array of rows, either structured, or N-by-M.
+    Fields such as VERT2_t["coord"] or TRIA3_t["index"] are
+    split into one view per component.
+
+    """
+    if (rows.ndim == +1 and rows.dtype.names is None):
+        return [rows]
+
+    cols = []
+    if (rows.dtype.names is not None):
+        for name in rows.dtype.names:
+            item = rows[name]
+            if (item.ndim == +1):
+                cols.append(item)
+            else:
+                cols.extend(item.T)
+    else:
+        cols.extend(rows.T)
+
+    return cols
+
 
+def saverows(data, fptr, prec=None,
+             sep=";", lead="", tail="", base=+0):
     """
-    fptr.write("TRIA3=" + str(data.size) + "\n")
+    SAVEROWS: save the rows of DATA in blocks to *.msh file.
 
-    rmax = 2 ** 19; next = 0
+    DATA is an array of rows, either structured, or N-by-M.
+    Integer columns are written as "%d", and real columns as
+    "%.Pg", where P = PREC. PREC=None writes the round-trip
+    repr. of each real, using 17 digits for float64 and 9
+    for float32 data.
 
-    while (next < data.size):
+    Columns are joined by SEP, with each row wrapped in the
+    strings LEAD and TAIL. BASE is added to integer columns
+    (i.e. BASE=1 for 1-based indexing).
 
-        nrow = min(rmax, data.size - next)
+    Rows are formatted as whole blocks via NUMPY arithmetic,
+    see FMTINTS and FMTREAL, rather than item-by-item. Data
+    is read via strided views onto DATA, see COLUMNS, with
+    one scratch buffer re-used across blocks if BASE != 0.
+
+    """
+    cols = columns(data)
+
+    rmax = 2 ** 16; next = 0
+
+    if (base != +0):
+        nint = sum(vals.dtype.kind != "f" for vals in cols)
+
+        temp = np.empty(
+            (nint, min(rmax, data.shape[0])), dtype=np.int64)
+
+    while (next < data.shape[0]):
+
+        nrow = min(rmax, data.shape[0] - next)
         nend = next + nrow
 
-        sfmt = ";".join(["%d"] * 3) + ";%d\n"
-        sfmt = sfmt * nrow
+        part = [vals[next:nend] for vals in cols]
+
+        if (base != +0):
+            inum = +0
+            for ipos, vals in enumerate(part):
+                if (vals.dtype.kind == "f"): continue
+
+                part[ipos] = np.add(
+                    vals, base, out=temp[inum, :nrow])
 
-        fdat = sfmt % tuple(
-            rfn.structured_to_unstructured(
-                data[next:nend], dtype=np.int32).ravel())
+                inum = inum + 1
 
-        fptr.write(fdat)
+        fptr.write(savecols(part, prec, sep, lead, tail))
 
         next = next + nrow
 
     return
 
 
-def savequad4(data, fptr, args):
+def savecols(cols, prec, sep=";", lead="", tail=""):
     """
-    SAVEQUAD4: save the QUAD4 data structure to *.msh file.
+    SAVECOLS: format the list of columns COLS as text rows.
 
     """
-    fptr.write("QUAD4=" + str(data.size) + "\n")
+    last = len(cols) - 1; part = []
 
-    rmax = 2 ** 19; next = 0
+    nrow = cols[0].size
 
-    while (next < data.size):
+    def fixed(text):
+        byte = np.frombuffer(text.encode("ascii"), np.uint8)
 
-        nrow = min(rmax, data.size - next)
-        nend = next + nrow
+        return np.broadcast_to(byte, (nrow, byte.size))
 
-        sfmt = ";".join(["%d"] * 4) + ";%d\n"
-        sfmt = sfmt * nrow
+    if (lead != ""): part.append(fixed(lead))
 
-        fdat = sfmt % tuple(
-            rfn.structured_to_unstructured(
-                data[next:nend], dtype=np.int32).ravel())
+    for ipos, vals in enumerate(cols):
 
-        fptr.write(fdat)
+        if (vals.dtype.kind == "f"):
+            vtag = prec
+            if (vtag is None):
+                vtag = 9 if vals.dtype == np.float32 else 17
 
-        next = next + nrow
+            part.append(fmtreal(vals, vtag))
 
-    return
+        else:
+            part.append(fmtints(vals))
 
+        stop = tail + "\n" if ipos == last else sep
 
-def savetria4(data, fptr, args):
-    """
-    SAVETRIA4: save the TRIA4 data structure to *.msh file.
+        part.append(fixed(stop))
+
+    char = np.concatenate(part, axis=1)
+
+#-- strip the unused chars. in one pass over the buffer
+    return char.tobytes().translate(
+        None, b"\0").decode("ascii")
 
+
+def savevert2(ftag, data, fptr, args):
     """
-    fptr.write("TRIA4=" + str(data.size) + "\n")
+    SAVEVERT2: save the POINT data structure to *.msh file.
 
-    rmax = 2 ** 19; next = 0
+    """
+    fptr.write(ftag + "=" + str(data.size) + "\n")
 
-    while (next < data.size):
+    saverows(data, fptr)
 
-        nrow = min(rmax, data.size - next)
-        nend = next + nrow
+    return
 
-        sfmt = ";".join(["%d"] * 4) + ";%d\n"
-        sfmt = sfmt * nrow
 
-        fdat = sfmt % tuple(
-            rfn.structured_to_unstructured(
-                data[next:nend], dtype=np.int32).ravel())
+def savevert3(ftag, data, fptr, args):
+    """
+    SAVEVERT3: save the POINT data structure to *.msh file.
 
-        fptr.write(fdat)
+    """
+    fptr.write(ftag + "=" + str(data.size) + "\n")
 
-        next = next + nrow
+    saverows(data, fptr)
 
     return
 
 
-def savehexa8(data, fptr, args):
+def savevalue(ftag, data, fptr, args):
     """
-    SAVEHEXA8: save the HEXA8 data structure to *.msh file.
+    SAVEVALUE: save the ARRAY data structure to *.msh file.
 
     """
-    fptr.write("HEXA8=" + str(data.size) + "\n")
+    if (np.ndim(data) == +1):
+        data = np.reshape(data, (data.size, +1))
 
-    rmax = 2 ** 19; next = 0
+    npos = np.size(data, 0)
+    nval = np.size(data, 1)
 
-    while (next < data.size):
+    if (args.side is not None and ftag != "POWER"):
+    #-- data to raw sidecar file, named in the header
+        side = saveside(ftag, data, args)
 
-        nrow = min(rmax, data.size - next)
-        nend = next + nrow
+        fptr.write(
+            ftag + "=" + str(npos) + ";" +
+            str(nval) + ";" + side + "\n")
 
-        sfmt = ";".join(["%d"] * 8) + ";%d\n"
-        sfmt = sfmt * nrow
+        return
 
-        fdat = sfmt % tuple(
-            rfn.structured_to_unstructured(
-                data[next:nend], dtype=np.int32).ravel())
+    fptr.write(
+        ftag + "=" + str(npos) + ";" + str(nval) + "\n")
 
-        fptr.write(fdat)
+    prec = args.prec
 
-        next = next + nrow
+    if (ftag == "POWER"): prec = None
+
+    saverows(data, fptr, prec)
 
     return
 
 
-def savewedg6(data, fptr, args):
+def savecells(ftag, data, fptr, args):
     """
-    SAVEWEDG6: save the WEDG6 data structure to *.msh file.
+    SAVECELLS: save the CELLS data structure to *.msh file.
 
     """
-    fptr.write("WEDG6=" + str(data.size) + "\n")
+    fptr.write(ftag + "=" + str(data.size) + "\n")
 
-    rmax = 2 ** 19; next = 0
+    saverows(data, fptr)
 
-    while (next < data.size):
+    return
 
-        nrow = min(rmax, data.size - next)
-        nend = next + nrow
 
-        sfmt = ";".join(["%d"] * 6) + ";%d\n"
-        sfmt = sfmt * nrow
+def saveedge2(data, fptr, args):
+    """
+    SAVEEDGE2: save the EDGE2 data structure to *.msh file.
 
-        fdat = sfmt % tuple(
-            rfn.structured_to_unstructured(
-                data[next:nend], dtype=np.int32).ravel())
+    """
+    savecells("EDGE2", data, fptr, args)
 
-        fptr.write(fdat)
+    return
 
-        next = next + nrow
+
+def savetria3(data, fptr, args):
+    """
+    SAVETRIA3: save the TRIA3 data structure to *.msh file.
+
+    """
+    savecells("TRIA3", data, fptr, args)
 
     return
 
 
-def savepyra5(data, fptr, args):
+def savequad4(data, fptr, args):
     """
-    SAVEPYRA5: save the PYRA5 data structure to *.msh file.
+    SAVEQUAD4: save the QUAD4 data structure to *.msh file.
 
     """
-    fptr.write("PYRA5=" + str(data.size) + "\n")
+    savecells("QUAD4", data, fptr, args)
 
-    rmax = 2 ** 19; next = 0
+    return
 
-    while (next < data.size):
 
-        nrow = min(rmax, data.size - next)
-        nend = next + nrow
+def savetria4(data, fptr, args):
+    """
+    SAVETRIA4: save the TRIA4 data structure to *.msh file.
 
-        sfmt = ";".join(["%d"] * 5) + ";%d\n"
-        sfmt = sfmt * nrow
+    """
+    savecells("TRIA4", data, fptr, args)
 
-        fdat = sfmt % tuple(
-            rfn.structured_to_unstructured(
-                data[next:nend], dtype=np.int32).ravel())
+    return
 
-        fptr.write(fdat)
 
-        next = next + nrow
+def savehexa8(data, fptr, args):
+    """
+    SAVEHEXA8: save the HEXA8 data structure to *.msh file.
+
+    """
+    savecells("HEXA8", data, fptr, args)
 
     return
 
 
-def savebound(data, fptr, args):
+def savewedg6(data, fptr, args):
     """
-    SAVEBOUND: save the BOUND data structure to *.msh file.
+    SAVEWEDG6: save the WEDG6 data structure to *.msh file.
 
     """
-    fptr.write("BOUND=" + str(data.size) + "\n")
+    savecells("WEDG6", data, fptr, args)
 
-    rmax = 2 ** 19; next = 0
+    return
 
-    while (next < data.size):
 
-        nrow = min(rmax, data.size - next)
-        nend = next + nrow
+def savepyra5(data, fptr, args):
+    """
+    SAVEPYRA5: save the PYRA5 data structure to *.msh file.
+
+    """
+    savecells("PYRA5", data, fptr, args)
 
-        sfmt = "%d;%d;%d\n" * nrow
+    return
 
-        fdat = sfmt % tuple(
-            rfn.structured_to_unstructured(
-                data[next:nend], dtype=np.int32).ravel())
 
-        fptr.write(fdat)
+def savebound(data, fptr, args):
+    """
+    SAVEBOUND: save the BOUND data structure to *.msh file.
 
-        next = next + nrow
+    """
+    savecells("BOUND", data, fptr, args)
 
     return
 
@@ -360,19 +652,7 @@ def savecoord(data, fptr, args, inum):
     fptr.write(
         "COORD=" + str(inum) + ";" + str(nnum) + "\n")
 
-    rmax = 2 ** 19; next = 0; prec = 17
-
-    while (next < data.shape[0]):
-
-        nrow = min(rmax, data.shape[0] - next)
-
-        sfmt = "%%.%ug\n" % prec
-        sfmt = sfmt * nrow
-
-        fdat = sfmt % tuple(data[next:next+nrow].ravel())
-        fptr.write(fdat)
-
-        next = next + nrow
+    saverows(data.ravel(), fptr)
 
     return
 
@@ -384,29 +664,50 @@ def savendmat(ftag, data, fptr, args):
     """
     nnum = np.prod(data.shape)
 
+    if (args.side is not None):
+    #-- data.T in C order == the F order unrolled VALUE
+        side = saveside(ftag, data.T, args)
+
+        fptr.write(
+            ftag + "=" + str(nnum) + "; 1;" + side + "\n")
+
+        return
+
     fptr.write(
         ftag + "=" + str(nnum) + "; 1" + "\n")
 
     dptr = data.reshape(-1, order="F")
 
-    rmax = 2 ** 19; next = 0; prec = 17
+    saverows(dptr, fptr, args.prec)
+
+    return
+
 
-    if (dptr.dtype == np.float32):
-        prec = 9
+def saveside(ftag, data, args):
+    """
+    SAVESIDE: save VALUE/SLOPE data to a raw sidecar file,
+    returning the file name to record in the *.msh header.
 
-    while (next < dptr.shape[0]):
+    DATA is written as little-endian float32's in C order,
+    in chunks, via a temp. file + rename.
 
-        nrow = min(rmax, dptr.shape[0] - next)
+    """
+    name = args.side + "." + ftag.lower() + ".f32"
+    part = name + ".part"
 
-        sfmt = "%%.%ug\n" % prec
-        sfmt = sfmt * nrow
+    if (data.ndim == +0): data = data.reshape(+1)
 
-        fdat = sfmt % tuple(dptr[next:next+nrow].ravel())
-        fptr.write(fdat)
+    rmax = max(+1, 2 ** 24 // max(+1, data[0].size))
 
-        next = next + nrow
+    with open(part, "wb") as fptr:
+        for next in range(0, data.shape[0], rmax):
 
-    return
+            fptr.write(np.ascontiguousarray(
+                data[next:next + rmax], dtype="<f4"))
+
+    os.replace(part, name)
+
+    return os.path.basename(name)
 
 
 def save_mesh_file(mesh, fptr, args, kind):
@@ -595,11 +896,121 @@ def save_grid_file(mesh, fptr, args, kind):
     return
 
 
-def savemsh(name, mesh):
+def save_bins_ndim(mesh):
+
+    if (mesh.vert2 is not None and
+            mesh.vert2.size != +0):
+        return +2
+
+    if (mesh.vert3 is not None and
+            mesh.vert3.size != +0):
+        return +3
+
+    ndim = +0
+    for grid in [mesh.xgrid, mesh.ygrid, mesh.zgrid]:
+        if (grid is not None and grid.size != +0):
+            ndim += +1
+
+    return ndim
+
+
+def save_bins_file(mesh, fptr, args, kind):
+    """
+    SAVE-BINS-FILE: save a JIGSAW MSH obj. to binary file.
+
+    See MSH_B for a description of the file layout.
+
+    """
+    data = []
+    for item in msh_b.FIELD:
+    #----------------------------------- collect non-empty's
+        vals = getattr(mesh, item)
+
+        if (vals is not None and vals.size != +0):
+            data.append((item, vals))
+
+    head = np.zeros(+1, dtype=msh_b.HEAD_t)
+    head["magic"] = msh_b.MAGIC
+    head["nvers"] = msh_b.NVERS
+    head["nsect"] = len(data)
+    head["ndims"] = save_bins_ndim(mesh)
+    head["mshID"] = kind.encode("ascii")
+
+    slot = np.zeros(len(data), dtype=msh_b.SLOT_t)
+
+    next = msh_b.HEAD_t.itemsize + \
+        msh_b.SLOT_t.itemsize * len(data)
+
+    next = next + msh_b.padding(next)
+
+    flat = []
+    for isec, (item, vals) in enumerate(data):
+    #----------------------------------- layout SLOT entries
+        ktag = msh_b.kindof(vals)
+
+        if (vals.ndim > 4):
+            raise ValueError(
+                "Invalid MESH." + item.upper() + " size.")
+
+        if (vals.ndim >= 2 and
+                vals.flags.f_contiguous and
+                not vals.flags.c_contiguous):
+            order = "F"
+        else:
+            order = "C"
+
+        slot["field"][isec] = item.encode("ascii")
+        slot["kinds"][isec] = ktag.encode("ascii")
+        slot["order"][isec] = order.encode("ascii")
+        slot["ndims"][isec] = vals.ndim
+        slot["shape"][isec, :vals.ndim] = vals.shape
+
+    #----------------------------------- LE view, no copy...
+        vals = np.asarray(vals, dtype=msh_b.typeof(ktag))
+        vals = np.ascontiguousarray(
+            vals.reshape(-1, order=order))
+
+        slot["start"][isec] = next
+        slot["bytes"][isec] = vals.nbytes
+
+        next = next + vals.nbytes
+        next = next + msh_b.padding(next)
+
+        flat.append(vals)
+
+    fptr.write(head.tobytes())
+    fptr.write(slot.tobytes())
+
+    fpos = head.nbytes + slot.nbytes
+
+    rmax = 2 ** 26
+    for isec, vals in enumerate(flat):
+    #----------------------------------- write raw payloads
+        fptr.write(b"\0" * (
+            int(slot["start"][isec]) - fpos))
+
+        byte = vals.view(np.uint8); next = 0
+
+        while (next < byte.size):
+
+            nend = min(byte.size, next + rmax)
+
+            fptr.write(byte[next:nend])
+
+            next = nend
+
+        fpos = int(slot["start"][isec]) + byte.size
+
+    return
+
+
+def savemsh(name, mesh, kind="ascii", prec=None, level=None,
+            sidecar=False):
     """
     SAVEMSH: save a JIGSAW MSH object to file.
 
-    SAVEMSH(NAME, MESH)
+    SAVEMSH(NAME, MESH, KIND="ascii", PREC=None, LEVEL=None,
+            SIDECAR=False)
 
     MESH is JIGSAW's primary mesh/grid/geom class. See MSH_t
     for details.
@@ -607,48 +1018,676 @@ def savemsh(name, mesh):
     Data in MESH is written as-needed -- any objects defined
     will be saved to file.
 
+    KIND="binary" writes a raw binary container instead of
+    the usual ASCII format. Binary files can be memory-mapped
+    by LOADMSH, but are not readable by JIGSAW's c++ backend.
+    See MSH_B for details.
+
+    PREC sets the no. of significant digits written for the
+    VALUE and SLOPE data in ASCII files. PREC=None writes a
+    round-trip repr. (17 digits for float64, 9 for float32).
+    Coordinates and POWER data are always written in full.
+
+    NAME's ending in *.msh.gz, *.msh.xz or *.msh.bz2 are
+    compressed on the fly, with LEVEL = 1, 2, ..., 9 setting
+    the compression effort. See ZIPIO for details.
+
+    NAME may also be a file-like object -- an open file,
+    pipe, IO.BYTESIO, etc. ASCII data can be written to text
+    or binary streams, binary data to binary streams only.
+    Streams are written from their current position, and are
+    left open on return.
+
+    SIDECAR=True writes the VALUE and SLOPE data of an ASCII
+    file to raw float32 "sidecar" files, NAME.value.f32 and
+    NAME.slope.f32, alongside NAME, which LOADMSH maps into
+    memory rather than parses. Grid data is stored in the
+    (NY, NX[, NZ]) Fortran ordering of MSH_t, so loads are
+    O(1) and never copied. Sidecar files are not readable by
+    JIGSAW's c++ backend.
+
     """
 
-    if (not isinstance(name, str)):
+    if (not isinstance(name, str) and
+            not zipio.isstream(name)):
         raise TypeError("Incorrect type: NAME.")
 
     if (not isinstance(mesh, jigsaw_msh_t)):
         raise TypeError("Incorrect type: MESH.")
 
+    if (not isinstance(kind, str)):
+        raise TypeError("Incorrect type: KIND.")
+
+    if (not isinstance(sidecar, bool)):
+        raise TypeError("Incorrect type: SIDECAR.")
+
+    if (kind.lower() not in ["ascii", "binary"]):
+        raise ValueError("Invalid KIND: " + kind)
+
+    if (prec is not None and not isinstance(prec, int)):
+        raise TypeError("Incorrect type: PREC.")
+
+    if (prec is not None and (prec < 1 or prec > 17)):
+        raise ValueError("Invalid PREC: " + str(prec))
+
+    if (sidecar and kind.lower() != "ascii"):
+        raise ValueError("Invalid SIDECAR: ASCII files only.")
+
+    if (sidecar and zipio.isstream(name)):
+        raise ValueError("Invalid SIDECAR: NAME is a stream.")
+
     certify(mesh)
 
-    class stub(object): pass
+    args = args_t(kind, prec)
 
-    args = stub()                           ## savmsh params
-    args.kind = "ascii"
-    args.nver = 3
+    mtag = mesh.mshID.lower()
 
-    fext = Path(name).suffix
+    if (zipio.isstream(name)):
+    #----------------------------------- write to the stream
+        savefile(name, mesh, args, mtag, level)
 
-    if (fext.strip() != ".msh"): name += ".msh"
+        return
 
-    kind = mesh.mshID.lower()
+    name = zipio.zipname(name, ".msh")
 
-    with Path(name).open("w") as fptr:
+    if (sidecar):
+    #----------------------------------- NAME.value.f32, etc
+        ztag = zipio.zipext(name)
+        args.side = name[:len(name) - len(ztag) - 4]
+
+    if (args.kind == "binary"):
+    #----------------------------------- write binary object
+
+    #   write via a temp. file + rename, so that any existing
+    #   memory-maps onto NAME keep a valid view of old data.
+        ztag = zipio.zipext(name)
+        part = name[:len(name) - len(ztag)] + ".part" + ztag
+
+        savefile(part, mesh, args, mtag, level)
+
+        os.replace(part, name)
+
+        return
+
+    savefile(name, mesh, args, mtag, level)
+
+    return
+
+
+def savefile(name, mesh, args, mtag, level):
+    """
+    SAVEFILE: write MESH to the file or stream NAME, as per
+    ARGS.KIND.
+
+    """
+    if (args.kind == "binary"):
+    #----------------------------------- write binary object
+        with zipio.zipopen(name, "wb", level) as fptr:
+            save_bins_file(mesh, fptr, args, mtag)
+
+        return
+
+    with zipio.zipopen(name, "w", level) as fptr:
     #----------------------------------- write JIGSAW object
-        fptr.write(
-            "# " + Path(name).name +
-            "; created by JIGSAW's PYTHON interface \n")
+        fptr.write(headline(name))
 
-        if (kind == "euclidean-mesh"):
+        if (mtag == "euclidean-mesh"):
             save_mesh_file(
                 mesh, fptr, args, "euclidean-mesh")
 
-        if (kind == "euclidean-grid"):
+        if (mtag == "euclidean-grid"):
             save_grid_file(
                 mesh, fptr, args, "euclidean-grid")
 
-        if (kind == "ellipsoid-mesh"):
+        if (mtag == "ellipsoid-mesh"):
             save_mesh_file(
                 mesh, fptr, args, "ellipsoid-mesh")
 
-        if (kind == "ellipsoid-grid"):
+        if (mtag == "ellipsoid-grid"):
             save_grid_file(
                 mesh, fptr, args, "ellipsoid-grid")
 
     return
+
+
+def headline(name):
+    """
+    HEADLINE: return the leading comment line for NAME.
+
+    """
+    ftag = zipio.filename(name)
+
+    if (ftag != ""): ftag = ftag + "; "
+
+    return "# " + ftag + \
+        "created by JIGSAW's PYTHON interface \n"
+
+
+def savefield(mesh, fptr, args, stag):
+    """
+    SAVEFIELD: save the POWER, VALUE or SLOPE data segment of
+    MESH to *.msh file, as per SAVE_MESH_FILE, etc.
+
+    """
+    data = getattr(mesh, stag.lower())
+
+    if (data is None or data.size == +0): return
+
+    if (mesh.mshID.lower().endswith("-grid")):
+        if (stag != "POWER"):
+            savendmat(stag, data, fptr, args)
+    else:
+        savevalue(stag, data, fptr, args)
+
+    return
+
+
+def update_bins_file(name, mesh, sect):
+    """
+    UPDATE-BINS-FILE: over-write the SECT payloads of binary
+    file NAME in place. Returns FALSE, with NAME unchanged,
+    if any section differs in shape or type from the file.
+
+    """
+    with open(name, "r+b") as fptr:
+        head, slot = loadhead(scanner(fptr))
+
+        if (head["mshID"].decode("ascii").lower() !=
+                mesh.mshID.lower()):
+            return False
+
+        data = []
+        for stag in sect:
+    #----------------------------------- match SLOT entries
+            vals = getattr(mesh, stag.lower())
+
+            item = [item for item in slot if
+                    loadslot(item)[1] == stag]
+
+            if (vals is None or vals.size == +0):
+                if (len(item) != +0): return False
+
+                continue
+
+            if (len(item) != +1): return False
+
+            _, _, dims, kind, order = loadslot(item[0])
+
+            if (vals.shape != dims or
+                    msh_b.typeof(msh_b.kindof(vals)) != kind):
+                return False
+
+            data.append((
+                int(item[0]["start"]),
+                np.ascontiguousarray(np.asarray(
+                    vals, dtype=kind).reshape(-1, order=order))))
+
+        rmax = 2 ** 26
+        for fpos, vals in data:
+    #----------------------------------- write raw payloads
+            byte = vals.view(np.uint8)
+
+            fptr.seek(fpos)
+
+            for next in range(0, byte.size, rmax):
+                fptr.write(byte[next:next + rmax])
+
+    return True
+
+
+def update_text_file(name, mesh, sect, args):
+    """
+    UPDATE-TEXT-FILE: re-write the SECT segments of ASCII
+    file NAME, by copying all other segments byte-for-byte
+    to a temp. file, appending the new SECT data, and then
+    renaming over NAME.
+
+    """
+    with open(name, "rb") as fptr:
+        fstr = scanner(fptr, root=os.path.dirname(name))
+
+        last = jigsaw_msh_t()
+        cuts = [
+            (head, stop, sidecar(ltag) is not None)
+            for kind, ltag, head, _, stop in
+            headers(fstr, last) if kind in sect]
+
+        fend = fstr.tell()
+
+    if (last.mshID.lower() != mesh.mshID.lower()):
+        return False
+
+    if (any(side for _, _, side in cuts)):
+    #----------------------------------- keep using sidecars
+        args.side = name[:len(name) - 4]
+
+    #----------------------------------- keep all but SECT's
+    keep = []; next = +0
+    for head, stop, _ in cuts:
+        if (head > next): keep.append((next, head))
+
+        next = stop
+
+    if (fend > next): keep.append((next, fend))
+
+    part = name + ".part"
+    try:
+        rmax = 2 ** 24
+        with open(name, "rb") as fsrc, \
+                open(part, "wb") as fdst:
+            for head, stop in keep:
+    #----------------------------------- copy kept segments
+                fsrc.seek(head)
+
+                while (head < stop):
+                    byte = fsrc.read(min(rmax, stop - head))
+
+                    fdst.write(byte)
+
+                    head = head + len(byte)
+
+        with open(part, "a") as fptr:
+            for stag in sect:
+    #----------------------------------- append SECT's data
+                savefield(mesh, fptr, args, stag)
+
+        os.replace(part, name)
+
+    except BaseException:
+        if (os.path.isfile(part)): os.remove(part)
+        raise
+
+    return True
+
+
+def updatemsh(name, mesh, sections="VALUE", prec=None):
+    """
+    UPDATEMSH: update the data segments of an existing *.msh
+    file, without re-writing the full MESH.
+
+    UPDATEMSH(NAME, MESH, SECTIONS="VALUE", PREC=None)
+
+    NAME is a *.msh file previously saved from MESH, where
+    only the SECTIONS data has since changed -- any of the
+    "POWER", "VALUE" or "SLOPE" segments. Just these are
+    re-written, such that scaling or replacing a field is
+    O(field size), rather than a full SAVEMSH.
+
+    ASCII files are re-written via a temp. file + rename,
+    with all other segments copied byte-for-byte and the
+    updated data appended, such that only the SECTIONS are
+    re-formatted, and NAME is never left part-written.
+    Sidecar data is re-written to its sidecar file, see
+    SAVEMSH(..., SIDECAR=True).
+
+    Binary files are updated in place, where the new data
+    matches the existing shape and type. Any memory-maps
+    onto NAME will see the new data.
+
+    Compressed files, files written from a different MSHID,
+    or a NAME that doesn't exist are saved in full via
+    SAVEMSH.
+
+    """
+
+    if (not isinstance(name, str)):
+        raise TypeError("Incorrect type: NAME.")
+
+    if (not isinstance(mesh, jigsaw_msh_t)):
+        raise TypeError("Incorrect type: MESH.")
+
+    if (isinstance(sections, str)): sections = [sections]
+
+    if (not all(isinstance(item, str) for item in sections)):
+        raise TypeError("Incorrect type: SECTIONS.")
+
+    sect = []
+    for stag in ["POWER", "VALUE", "SLOPE"]:
+        if (stag in [item.upper() for item in sections]):
+            sect.append(stag)
+
+    for item in sections:
+        if (item.upper() not in sect):
+            raise ValueError("Invalid SECTIONS: " + item)
+
+    if (prec is not None and not isinstance(prec, int)):
+        raise TypeError("Incorrect type: PREC.")
+
+    if (prec is not None and (prec < 1 or prec > 17)):
+        raise ValueError("Invalid PREC: " + str(prec))
+
+    certify(mesh)
+
+    name = zipio.zipname(name, ".msh")
+
+    if (not os.path.isfile(name)):
+    #----------------------------------- nothing to update!
+        savemsh(name, mesh, "ascii", prec)
+
+        return
+
+    if (zipio.zipped(name) == ""):
+        with open(name, "rb") as fptr:
+            head = fptr.read(len(msh_b.MAGIC))
+
+        if (head == msh_b.MAGIC):
+    #----------------------------------- binary: overwrite
+            if (update_bins_file(name, mesh, sect)):
+                return
+
+        else:
+    #----------------------------------- ASCII: re-append
+            args = args_t("ascii", prec)
+
+            if (update_text_file(name, mesh, sect, args)):
+                return
+
+    info = msh_info(name)
+
+    savemsh(name, mesh, info["kind"], prec,
+            sidecar=any(
+                "sidecar" in item for item in info["sections"]))
+
+    return
+
+
+#-- one worker thread, so that async. writes land in order
+ASYNC = ThreadPoolExecutor(
+    max_workers=1, thread_name_prefix="savemsh")
+
+
+def snapshot(mesh):
+    """
+    SNAPSHOT: return a copy of MESH that shares no data with
+    the original, such that MESH may be safely modified.
+
+    """
+    copy = jigsaw_msh_t()
+    copy.mshID = mesh.mshID
+    copy.ndims = mesh.ndims
+
+    for field in msh_b.FIELD:
+        data = getattr(mesh, field, None)
+
+        if (data is not None):
+            data = np.array(data, copy=True, order="K")
+
+        setattr(copy, field, data)
+
+    return copy
+
+
+def savemsh_async(name, mesh, kind="ascii",
+                  prec=None, level=None, sidecar=False):
+    """
+    SAVEMSH-ASYNC: save a JIGSAW MSH object to file, via a
+    background thread.
+
+    FUTURE = SAVEMSH_ASYNC(NAME, MESH, KIND="ascii",
+                           PREC=None, LEVEL=None,
+                           SIDECAR=False)
+
+    The data in MESH is copied on entry, so that MESH may be
+    modified once SAVEMSH_ASYNC returns, with the file then
+    written by a worker thread, as per SAVEMSH. Text is
+    formatted in NUMPY, such that the write largely overlaps
+    with work in the calling thread.
+
+    FUTURE is a CONCURRENT.FUTURES.FUTURE -- FUTURE.RESULT()
+    blocks until the file is written, re-raising any error.
+    Async. writes complete in the order they are issued.
+
+    """
+
+    if (not isinstance(name, str) and
+            not zipio.isstream(name)):
+        raise TypeError("Incorrect type: NAME.")
+
+    if (not isinstance(mesh, jigsaw_msh_t)):
+        raise TypeError("Incorrect type: MESH.")
+
+    return ASYNC.submit(
+        savemsh, name, snapshot(mesh),
+        kind, prec, level, sidecar)
+
+
+class msh_writer(object):
+    """
+    MSH_WRITER: write a JIGSAW *.msh file in chunks.
+
+    with MSH_WRITER(NAME, MSHID, NDIMS, RADII,
+                    PREC, LEVEL) as FOUT:
+        FOUT.section("POINT", NPOINT)
+        for DATA in ...: FOUT.write(DATA)
+        ...
+
+    Sections are declared via SECTION(STAG, SIZE), with rows
+    then streamed into the file via WRITE in any number of
+    blocks, such that memory use is bounded by the block size
+    and not the size of the mesh. The no. of rows written to
+    each section must match its SIZE.
+
+    STAG is one of "POINT", "SEEDS", "POWER", "VALUE",
+    "SLOPE", "EDGE2", "TRIA3", "QUAD4", "TRIA4", "HEXA8",
+    "WEDG6", "PYRA5", "BOUND" or "COORD". POWER, VALUE and
+    SLOPE sections have NVAL values per row, and COORD takes
+    the axis IDIM = 1, 2, 3. PREC sets the no. of digits for
+    VALUE and SLOPE data, and LEVEL the compression effort
+    for *.msh.gz files, etc, as per SAVEMSH.
+
+    Files are ASCII, and readable by JIGSAW's c++ backend.
+    See ITER_SECTION for the matching chunked reader.
+
+    """
+
+    def __init__(self, name, mshID="euclidean-mesh",
+                 ndims=None, radii=None, prec=None,
+                 level=None):
+
+        if (not isinstance(name, str) and
+                not zipio.isstream(name)):
+            raise TypeError("Incorrect type: NAME.")
+
+        if (not isinstance(mshID, str)):
+            raise TypeError("Incorrect type: MSHID.")
+
+        if (mshID.lower() not in [
+                "euclidean-mesh", "euclidean-grid",
+                "ellipsoid-mesh", "ellipsoid-grid"]):
+            raise ValueError("Invalid MSHID: " + mshID)
+
+        if (ndims is not None and ndims not in [2, 3]):
+            raise ValueError("Invalid NDIMS: " + str(ndims))
+
+        if (prec is not None and not isinstance(prec, int)):
+            raise TypeError("Incorrect type: PREC.")
+
+        if (prec is not None and (prec < 1 or prec > 17)):
+            raise ValueError("Invalid PREC: " + str(prec))
+
+        if (not zipio.isstream(name)):
+            name = zipio.zipname(name, ".msh")
+
+        self.name = name
+        self.ndims = ndims
+        self.prec = prec
+        self.stag = None
+        self.size = +0
+        self.have = +0
+
+        self.fptr = zipio.zipopen(name, "w", level)
+
+        self.fptr.write(headline(name))
+
+        self.fptr.write(
+            "MSHID=3;" + mshID.lower() + "\n")
+
+        if (ndims is not None):
+            self.fptr.write("NDIMS=" + str(ndims) + "\n")
+
+        if (radii is not None):
+            radii = np.asarray(radii, dtype=np.float64)
+
+            if (radii.size == +1):
+                radii = np.full(3, radii.item())
+
+            if (radii.size != +3):
+                raise ValueError("Invalid RADII.")
+
+            self.fptr.write(
+                "RADII="
+                f"{radii[0]:.17g};"
+                f"{radii[1]:.17g};"
+                f"{radii[2]:.17g}\n")
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        if (exc_type is None):
+            self.close()
+        else:
+            self.fptr.close()
+
+        return False
+
+    def flush(self):
+        """
+        FLUSH: check that the current section is complete.
+
+        """
+        if (self.stag is not None and
+                self.have != self.size):
+            raise ValueError(
+                "Incomplete section: " + self.stag +
+                ", expected " + str(self.size) +
+                " rows, found " + str(self.have))
+
+        self.stag = None
+
+        return
+
+    def section(self, stag, size, nval=1, idim=None):
+        """
+        SECTION: begin a new data segment of SIZE rows.
+
+        """
+        if (not isinstance(stag, str)):
+            raise TypeError("Incorrect type: STAG.")
+
+        self.flush()
+
+        stag = stag.upper(); size = int(size)
+
+        if (size < +0):
+            raise ValueError("Invalid SIZE: " + str(size))
+
+        if   (stag in ["POINT", "SEEDS"]):
+            if (self.ndims not in [2, 3]):
+                raise ValueError(
+                    "Invalid NDIMS: " + str(self.ndims))
+
+            kind = getattr(
+                jigsaw_msh_t, "VERT%u_t" % self.ndims)
+
+            self.kind = np.dtype(kind)
+            self.nval = None
+
+            self.fptr.write(
+                stag + "=" + str(size) + "\n")
+
+        elif (stag in ["POWER", "VALUE", "SLOPE"]):
+            self.kind = None
+            self.nval = int(nval)
+
+            self.fptr.write(
+                stag + "=" + str(size) +
+                ";" + str(int(nval)) + "\n")
+
+        elif (stag == "COORD"):
+            if (idim not in [1, 2, 3]):
+                raise ValueError("Invalid IDIM: " + str(idim))
+
+            self.kind = None
+            self.nval = +1
+
+            self.fptr.write(
+                "COORD=" + str(idim) +
+                ";" + str(size) + "\n")
+
+        elif (stag in [
+                "EDGE2", "TRIA3", "QUAD4", "TRIA4",
+                "HEXA8", "WEDG6", "PYRA5", "BOUND"]):
+            kind = getattr(jigsaw_msh_t, stag + "_t")
+
+            self.kind = np.dtype(kind)
+            self.nval = None
+
+            self.fptr.write(
+                stag + "=" + str(size) + "\n")
+
+        else:
+            raise ValueError("Invalid STAG: " + stag)
+
+        self.stag = stag
+        self.size = size
+        self.have = +0
+
+        return
+
+    def write(self, data):
+        """
+        WRITE: append a block of rows to the current section.
+
+        """
+        if (self.stag is None):
+            raise ValueError("No section: call SECTION first.")
+
+        data = np.asarray(data)
+
+        if (self.kind is not None):
+            if (data.dtype != self.kind):
+                raise TypeError("Incorrect type: DATA.")
+
+        else:
+            if (data.dtype.names is not None):
+                raise TypeError("Incorrect type: DATA.")
+
+            if (data.ndim == +1):
+                data = np.reshape(data, (data.size, +1))
+
+            if (data.ndim != +2 or
+                    data.shape[1] != self.nval):
+                raise ValueError("Invalid DATA shape.")
+
+        nrow = data.shape[0]
+
+        if (self.have + nrow > self.size):
+            raise ValueError(
+                "Invalid DATA: section " + self.stag +
+                " overflows SIZE=" + str(self.size))
+
+        prec = None
+
+        if (self.stag in ["VALUE", "SLOPE"]):
+            prec = self.prec
+
+        saverows(data, self.fptr, prec)
+
+        self.have = self.have + nrow
+
+        return
+
+    def close(self):
+        """
+        CLOSE: check the last section and close the file.
+
+        """
+        if (self.fptr.closed): return
+
+        try:
+            self.flush()
+        finally:
+            self.fptr.close()
+
+        return
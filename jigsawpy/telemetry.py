@@ -0,0 +1,259 @@
+
+import os
+import re
+import sys
+import time
+import subprocess
+import numpy as np
+
+from jigsawpy import msh_b
+from jigsawpy.loadmsh import msh_info
+
+#------------------------ "  Forming MESH data..." headings
+HEAD = re.compile(r"^\s+(\w.*?)\.\.\.\s*$")
+
+#------------------------ "  Done. (2.33e-02sec)" timings
+DONE = re.compile(r"^\s+Done\.\s+\(\s*([-+.\deE]+)\s*sec\)")
+
+#------------------------ "#  |ITER.|  |DEL-1|" table heads
+COLS = re.compile(r"\|\s*([^|]+?)\s*\|")
+
+#------------------------ callbacks, passed each RUN_t done
+HOOKS = []
+
+
+class run_t(object):
+#------------------------------ telemetry from an exe. call
+    def __init__(self, name, args):
+        self.name = name                # "jigsaw", etc
+        self.args = args                # cmd.-line args.
+        self.returncode = None
+        self.cached = False             # from result cache?
+
+        self.text = ""                  # captured stdout
+        self.time = 0.                  # wall-clock (secs)
+
+        self.phase = {}                 # {TITLE: secs}
+        self.table = {}                 # {TITLE: (COLS, ROWS)}
+        self.iters = {}                 # {TITLE: no. iter.}
+        self.cells = {}                 # {FIELD: no. cells}
+
+        self.cpu_user = None            # child CPU (secs)
+        self.cpu_sys = None
+        self.max_rss = None             # peak RSS (bytes)
+
+    def __repr__(self):
+        return "run_t(" + ", ".join([
+            "name=" + repr(self.name),
+            "cached=" + repr(self.cached),
+            "time=%.3g" % self.time,
+            "phase=" + repr(self.phase),
+            "iters=" + repr(self.iters),
+            "cells=" + repr(self.cells),
+            "cpu_user=" + repr(self.cpu_user),
+            "max_rss=" + repr(self.max_rss)]) + ")"
+
+
+def subscribe(func):
+    """
+    SUBSCRIBE: register the callback FUNC, called with each
+    RUN_t as JIGSAW, TRIPOD and MARCHE runs complete.
+
+    """
+    if (not callable(func)):
+        raise TypeError("Incorrect type: FUNC.")
+
+    if (func not in HOOKS): HOOKS.append(func)
+
+    return
+
+
+def unsubscribe(func):
+    """
+    UNSUBSCRIBE: remove a callback FUNC, see SUBSCRIBE.
+
+    """
+    if (func in HOOKS): HOOKS.remove(func)
+
+    return
+
+
+def notify(info):
+    """
+    NOTIFY: pass the RUN_t INFO to each callback, see
+    SUBSCRIBE.
+
+    """
+    for func in HOOKS: func(info)
+
+    return
+
+
+def countmsh(info, mesh):
+    """
+    COUNTMSH: set the CELLS of the RUN_t INFO from the MSH_t
+    MESH, i.e. once loaded from the output file.
+
+    """
+    info.cells = {}
+    for field in msh_b.FIELD:
+        data = getattr(mesh, field, None)
+
+        if (data is not None and data.size != +0):
+            info.cells[field] = int(data.shape[0])
+
+    return
+
+
+def parselog(text, info):
+    """
+    PARSELOG: parse the console output TEXT of JIGSAW, etc,
+    into the PHASE, TABLE and ITERS of the RUN_t INFO.
+
+    Each "Title..." heading starts a phase, timed by the
+    next "Done. (Xsec)" line. Tables of iteration counts,
+    i.e. for "Generate rDT MESH" and "MESH optimisation",
+    are kept as (COLS, ROWS) arrays. ITERS is the last ITER.
+    count of a table, if it has one, else its no. of rows.
+
+    """
+    ttag = None; cols = None; rows = []
+
+    for line in text.splitlines():
+
+        head = HEAD.match(line)
+        done = DONE.match(line)
+
+        if (head is not None):
+    #------------------------------ start of next phase
+            ttag = head.group(1); cols = None; rows = []
+
+        elif (done is not None and ttag is not None):
+    #------------------------------ end of current phase
+            info.phase[ttag] = \
+                info.phase.get(ttag, 0.) + float(done.group(1))
+
+            if (cols is not None):
+                info.table[ttag] = (cols, np.array(
+                    rows, dtype=np.int64).reshape(-1, len(cols)))
+
+                info.iters[ttag] = rows[-1][0] if (
+                    rows and cols[0].startswith("ITER")) \
+                    else len(rows)
+
+            ttag = None; cols = None; rows = []
+
+        elif (line.startswith("#") and "|" in line):
+            cols = COLS.findall(line)
+
+        elif (cols is not None):
+            data = line.split()
+
+            if (len(data) == len(cols) and
+                    all(item.isdigit() for item in data)):
+                rows.append([int(item) for item in data])
+
+    return
+
+
+def waitexe(proc):
+    """
+    WAITEXE: wait for the subprocess PROC to exit, returning
+    its resource usage, or None if not available here.
+
+    Uses OS.WAIT4, so that usage is for this child alone.
+
+    """
+    if (not hasattr(os, "wait4")):
+        proc.wait(); return None
+
+    _, stat, used = os.wait4(proc.pid, +0)
+
+    if (os.WIFSIGNALED(stat)):
+        proc.returncode = -os.WTERMSIG(stat)
+    else:
+        proc.returncode = os.WEXITSTATUS(stat)
+
+    return used
+
+
+def runexe(args, name="", mesh_file=None, echo=True,
+           hooks=True):
+    """
+    RUNEXE: run one of JIGSAW's executables, with telemetry.
+
+    INFO = RUNEXE(ARGS, NAME="", MESH_FILE=None, ECHO=True,
+                  HOOKS=True)
+
+    The cmd. ARGS is run as a subprocess, with its stdout and
+    stderr captured (and also written to SYS.STDOUT if ECHO)
+    and parsed, see PARSELOG. INFO is a RUN_t, with:
+
+    INFO.PHASE - dict. of phase timings, i.e. "Forming GEOM
+        data", "Generate rDT MESH", "MESH optimisation".
+    INFO.ITERS - dict. of iteration counts for each phase.
+    INFO.CELLS - dict. of no. of cells, per MSH_t field, in
+        MESH_FILE, if given, see MSH_INFO. This re-scans the
+        file, so callers that load it anyway should use
+        COUNTMSH instead.
+    INFO.CPU_USER, INFO.CPU_SYS, INFO.MAX_RSS - the child's
+        CPU time (secs) and peak RSS (bytes), via GETRUSAGE,
+        where supported.
+    INFO.TIME - the wall-clock time (secs).
+
+    INFO is also passed to any callbacks if HOOKS, else the
+    caller should NOTIFY once INFO is complete. Raises
+    SUBPROCESS.CALLEDPROCESSERROR on a non-zero exit.
+
+    """
+    info = run_t(name, args)
+
+    tbeg = time.perf_counter()
+
+    proc = subprocess.Popen(
+        args, stdout=subprocess.PIPE,
+        stderr=subprocess.STDOUT)
+
+    text = []
+    try:
+        for line in proc.stdout:
+            line = line.decode("utf-8", "replace")
+            text.append(line)
+
+            if (echo):
+                sys.stdout.write(line); sys.stdout.flush()
+
+        proc.stdout.close()
+
+        used = waitexe(proc)
+
+    except BaseException:
+    #------------------------------ i.e. KeyboardInterrupt
+        proc.kill(); proc.wait()
+        raise
+
+    info.time = time.perf_counter() - tbeg
+    info.text = "".join(text)
+    info.returncode = proc.returncode
+
+    if (used is not None):
+        info.cpu_user = used.ru_utime
+        info.cpu_sys = used.ru_stime
+        info.max_rss = used.ru_maxrss * (
+            1 if sys.platform == "darwin" else 1024)
+
+    parselog(info.text, info)
+
+    if (proc.returncode != +0):
+        raise subprocess.CalledProcessError(
+            proc.returncode, args, output=info.text)
+
+    if (mesh_file is not None and
+            os.path.isfile(mesh_file)):
+        for sect in msh_info(mesh_file)["sections"]:
+            info.cells[sect["field"]] = \
+                int(sect["shape"][0])
+
+    if (hooks): notify(info)
+
+    return info
@@ -0,0 +1,277 @@
+""" ZIPIO: Transparent (de)compression for JIGSAW's files.
+
+    Files named *.gz, *.xz or *.bz2 are streamed through the
+    stdlib GZIP, LZMA or BZ2 codecs respectively, such that
+    *.msh.gz, *.jig.xz, etc can be read/written in place of
+    the usual files, with nothing decompressed to disk.
+
+    Compressed files are detected on read by their leading
+    "magic" bytes, and on write by the file extension.
+
+    LEVEL sets the compression effort, from 1 (fast) to 9
+    (small), with LEVEL=None taking the per-codec defaults
+    in LEVEL_t.
+
+    Compressed files are read/written by LOADMSH/SAVEMSH and
+    LOADJIG/SAVEJIG only, and are not readable by JIGSAW's
+    c++ backend.
+
+    File-like objects -- open files, pipes, IO.BYTESIO, etc
+    -- may be passed in place of NAME, in either text or
+    binary mode. These are read/written as a forward-only
+    stream, and are left open on exit. Compressed streams
+    are detected on read, but are not compressed on write.
+
+
+    --------------------------------------------------------
+    """
+
+import io
+import bz2
+import gzip
+import lzma
+from pathlib import Path
+
+ZIPS_t = {
+    ".gz": gzip,
+    ".xz": lzma,
+    ".bz2": bz2
+}
+
+MAGIC = {
+    ".gz": b"\x1f\x8b",
+    ".xz": b"\xfd7zXZ\x00",
+    ".bz2": b"BZh"
+}
+
+LEVEL_t = {
+    ".gz": +6,
+    ".xz": +6,
+    ".bz2": +9
+}
+
+
+def isstream(name):
+    """
+    ISSTREAM: return TRUE if NAME is a file-like object, as
+    opposed to a path.
+
+    """
+    return hasattr(name, "read") or hasattr(name, "write")
+
+
+def filename(name):
+    """
+    FILENAME: return the base file name for NAME, or "" for
+    streams with no name.
+
+    """
+    if (isstream(name)):
+        name = getattr(name, "name", "")
+
+        if (not isinstance(name, str)): return ""
+
+    return Path(name).name
+
+
+class fileview(object):
+#------------------------------ caller's file-like object
+    def __init__(self, fptr, mode, head=b""):
+        self.fptr = fptr
+        self.mode = mode
+        self.head = head                # sniffed lead bytes
+        self.closed = False
+        self.text = isinstance(fptr, io.TextIOBase)
+
+        if ("b" in mode and "w" in mode and self.text):
+            raise TypeError("Incorrect type: NAME.")
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
+
+        return False
+
+    def read(self, size=-1):
+        """
+        READ: return the next SIZE bytes (or chars, for text
+        mode) from the stream.
+
+        """
+        if (size is None): size = -1
+
+        head = self.head
+        if (size >= +0):
+            self.head = head[size:]
+            head = head[:size]
+            size = size - len(head)
+        else:
+            self.head = b""
+
+        if (size == +0): return self.cast(head)
+
+        data = self.fptr.read(size)
+
+        return self.cast(head) + self.cast(data)
+
+    def readline(self):
+        """
+        READLINE: return the next line from the stream.
+
+        """
+        npos = self.head.find(b"\n")
+
+        if (npos >= +0):
+            line = self.head[:npos + 1]
+            self.head = self.head[npos + 1:]
+
+            return self.cast(line)
+
+        line = self.cast(self.head) + \
+            self.cast(self.fptr.readline())
+
+        self.head = b""
+
+        return line
+
+    def cast(self, data):
+        """
+        CAST: convert DATA to bytes or str, as per MODE.
+
+        """
+        if ("b" in self.mode):
+            if (isinstance(data, str)):
+                return data.encode("utf-8")
+        else:
+            if (isinstance(data, bytes)):
+                return data.decode("utf-8")
+
+        return data
+
+    def write(self, data):
+        """
+        WRITE: write bytes or str DATA to the stream.
+
+        """
+        if (isinstance(data, str) and not self.text):
+            data = data.encode("ascii")
+
+        self.fptr.write(data)
+
+        return len(data)
+
+    def close(self):
+        """
+        CLOSE: flush the stream, which is left open.
+
+        """
+        if ("w" in self.mode and
+                hasattr(self.fptr, "flush")):
+            self.fptr.flush()
+
+        self.closed = True
+
+        return
+
+
+def zipext(name):
+    """
+    ZIPEXT: return the compressed file extension of NAME,
+    ".gz", ".xz", ".bz2", or "" if NAME is uncompressed.
+
+    """
+    fext = Path(name).suffix.lower()
+
+    return fext if fext in ZIPS_t else ""
+
+
+def zipname(name, fext):
+    """
+    ZIPNAME: append the file extension FEXT to NAME, ahead of
+    any compressed extension, if not already present.
+
+    """
+    ztag = zipext(name)
+    base = name[:len(name) - len(ztag)]
+
+    if (Path(base).suffix.strip() != fext): base += fext
+
+    return base + ztag
+
+
+def zipped(name):
+    """
+    ZIPPED: return the codec used for an existing file, as
+    per ZIPEXT, by sniffing its leading bytes.
+
+    """
+    with Path(name).open("rb") as fptr:
+        head = fptr.read(+6)
+
+    for ztag, zmag in MAGIC.items():
+        if (head.startswith(zmag)): return ztag
+
+    return ""
+
+
+def zipopen(name, mode="r", level=None):
+    """
+    ZIPOPEN: open NAME as per PATHLIB's OPEN, (de)compressing
+    the stream as needed.
+
+    FPTR = ZIPOPEN(NAME, MODE="r", LEVEL=None)
+
+    MODE is one of "r", "rb", "w" or "wb".
+
+    NAME may also be a file-like object, read/written via a
+    FILEVIEW that is left open on exit.
+
+    """
+    if (level is not None and not isinstance(level, int)):
+        raise TypeError("Incorrect type: LEVEL.")
+
+    if (level is not None and (level < 1 or level > 9)):
+        raise ValueError("Invalid LEVEL: " + str(level))
+
+    if (isstream(name)):
+        return zipview(name, mode)
+
+    if ("r" in mode):
+        ztag = zipped(name)
+    else:
+        ztag = zipext(name)
+
+    if (ztag == ""): return Path(name).open(mode)
+
+    if ("b" not in mode): mode = mode + "t"
+
+    if ("r" in mode):
+        return ZIPS_t[ztag].open(name, mode)
+
+    if (level is None): level = LEVEL_t[ztag]
+
+    if (ztag == ".xz"):
+        return lzma.open(name, mode, preset=level)
+
+    return ZIPS_t[ztag].open(name, mode, compresslevel=level)
+
+
+def zipview(fptr, mode):
+    """
+    ZIPVIEW: wrap the file-like object FPTR as a FILEVIEW,
+    decompressing binary reads if needed.
+
+    """
+    if ("r" not in mode or "b" not in mode):
+        return fileview(fptr, mode)
+
+    head = fileview(fptr, mode).read(+6)
+
+    for ztag, zmag in MAGIC.items():
+        if (head.startswith(zmag)):
+            return ZIPS_t[ztag].open(
+                fileview(fptr, mode, head), mode)
+
+    return fileview(fptr, mode, head)
@@ -0,0 +1,108 @@
+"""
+* DEMO-10 --- return meshes from JIGSAW's api.-lib. without
+*   copying, as views onto the lib.'s own buffers.
+*
+* Checks that lib. buffers are freed exactly once, after the
+* last view is deleted.
+*
+"""
+
+import gc
+import shutil
+import tempfile
+import numpy as np
+import jigsawpy
+
+from jigsawpy import libsaw, cache
+
+
+def case_10_(src_path, dst_path):
+
+    opts = jigsawpy.jigsaw_jig_t()
+    geom = jigsawpy.jigsaw_msh_t()
+
+#------------------------------------ define JIGSAW geometry
+
+    geom.mshID = "euclidean-mesh"
+    geom.ndims = +2
+    geom.vert2 = np.array([
+        ((0, 0), 0), ((9, 0), 0),
+        ((9, 9), 0), ((0, 9), 0)],
+        dtype=geom.VERT2_t)
+
+    geom.edge2 = np.array([
+        ((0, 1), 0), ((1, 2), 0),
+        ((2, 3), 0), ((3, 0), 0)],
+        dtype=geom.EDGE2_t)
+
+    opts.hfun_hmax = 0.25
+    opts.mesh_dims = +2
+    opts.verbosity = +0
+
+#------------------------------------ count lib. MSH_t frees
+
+    free = libsaw.JLIB.jigsaw_free_msh_t
+    done = []
+
+    def count(mshl):
+        done.append(mshl); free(mshl)
+
+    libsaw.JLIB.jigsaw_free_msh_t = count
+
+    path = tempfile.mkdtemp()
+    try:
+        print("Call libJIGSAW: case 10a.")
+
+        base = jigsawpy.jigsaw_msh_t()
+        jigsawpy.lib.jigsaw(opts, geom, base)
+
+        assert len(done) == 0   # copies: freed per-array
+
+        mesh = jigsawpy.jigsaw_msh_t()
+        jigsawpy.lib.jigsaw(opts, geom, mesh, copy=False)
+
+        assert not mesh.tria3.flags.owndata
+
+        assert np.array_equal(mesh.vert2, base.vert2)
+        assert np.array_equal(mesh.tria3, base.tria3)
+
+    #-------------------------------- views, and cache store
+        cache.enable(path)
+        cache.storemsh(cache.libkey(opts, geom), mesh)
+        cache.disable()
+
+        view = mesh.tria3["index"].view(np.int32)[1:].T
+
+        del mesh; gc.collect()
+
+        assert len(done) == 0   # VIEW still alive
+
+        assert np.array_equal(
+            view, base.tria3["index"][1:].T)
+
+        del view; gc.collect()
+
+        assert len(done) == 1   # freed on last view
+
+    #-------------------------------- no arrays: freed at once
+        mesh = jigsawpy.jigsaw_msh_t()
+        jigsawpy.lib.jigsaw(opts, geom, mesh, copy=False)
+
+        for field in jigsawpy.msh_b.FIELD:
+            setattr(mesh, field, None)
+
+        gc.collect()
+
+        assert len(done) == 2
+
+        del mesh; gc.collect()
+
+        assert len(done) == 2   # ...and never twice
+
+    finally:
+        libsaw.JLIB.jigsaw_free_msh_t = free
+
+        cache.disable()
+        shutil.rmtree(path, ignore_errors=True)
+
+    return
@@ -0,0 +1,103 @@
+"""
+* DEMO-11 --- a parameter sweep over HFUN_HMAX, run as a batch
+*   of concurrent JIGSAW jobs.
+*
+* These examples call to JIGSAW via its cmd.-line interface.
+*
+* Checks BATCH.RUN results, errors and scratch clean-up.
+*
+"""
+
+import os
+import copy
+import shutil
+import tempfile
+import numpy as np
+import jigsawpy
+
+from jigsawpy import batch
+
+
+def case_11_(src_path, dst_path):
+
+    opts = jigsawpy.jigsaw_jig_t()
+    geom = jigsawpy.jigsaw_msh_t()
+
+#------------------------------------ define JIGSAW geometry
+
+    geom.mshID = "euclidean-mesh"
+    geom.ndims = +2
+    geom.vert2 = np.array([
+        ((0, 0), 0), ((9, 0), 0),
+        ((9, 9), 0), ((0, 9), 0)],
+        dtype=geom.VERT2_t)
+
+    geom.edge2 = np.array([
+        ((0, 1), 0), ((1, 2), 0),
+        ((2, 3), 0), ((3, 0), 0)],
+        dtype=geom.EDGE2_t)
+
+    opts.geom_file = os.path.join(dst_path, "case_11a.msh")
+
+    jigsawpy.savemsh(opts.geom_file, geom)
+
+    opts.mesh_dims = +2
+    opts.verbosity = +0
+
+#------------------------------------ args. checked on call
+
+    for item, fail in [
+            (dict(jobs=[geom]), TypeError),
+            (dict(jobs=[opts], max_workers=0), ValueError),
+            (dict(jobs=[opts], threads_per_job=0), ValueError)]:
+        try:
+            batch.run(**item)
+
+        except fail:
+            pass
+
+        else:
+            raise AssertionError("BATCH.RUN: no error")
+
+#------------------------------------ sweep HFUN_HMAX, etc.
+
+    jobs = []
+    for hmax in [1.0, 0.5, 0.25]:
+        next = copy.copy(opts)
+        next.hfun_hmax = hmax
+        jobs.append(next)
+
+    next = copy.copy(opts)
+    next.geom_file = opts.geom_file + ".none"
+    jobs.append(next)                   # ...this one fails
+
+    print("Call batch.run: case 11a.")
+
+    root = tempfile.mkdtemp()
+    try:
+        done = {}
+        for job in batch.run(jobs, max_workers=2,
+                             scratch=root):
+            done[job.index] = job
+
+        assert sorted(done) == list(range(len(jobs)))
+
+        assert os.listdir(root) == []   # scratch removed
+
+    finally:
+        shutil.rmtree(root, ignore_errors=True)
+
+    for inum in range(3):
+        assert done[inum].error is None
+        assert done[inum].path is None
+        assert done[inum].info.returncode == +0
+        assert done[inum].mesh.tria3.size > +0
+
+    assert done[0].mesh.vert2.size < \
+        done[1].mesh.vert2.size < \
+        done[2].mesh.vert2.size
+
+    assert done[3].error is not None
+    assert done[3].mesh is None
+
+    return
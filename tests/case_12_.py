@@ -0,0 +1,174 @@
+"""
+* DEMO-12 --- checkpoint multi-level mesh builds, such that
+*   they can be resumed after the last completed level.
+*
+* These examples call to JIGSAW via its cmd.-line and its
+* api.-lib. interfaces.
+*
+* Checks that a build stopped after a level and resumed is
+* identical to one run straight through, and checkpoints are
+* only resumed by the same kind of build.
+*
+"""
+
+import os
+import shutil
+import tempfile
+import numpy as np
+import jigsawpy
+
+from jigsawpy import checkpoint
+
+
+class stop_t(Exception):
+    pass
+
+
+def build(call, stop=None):
+#------------------------------------ TETRIS, w. checkpoints
+    save = checkpoint.save
+    done = []
+
+    def kill(path, name, nlev, ilev, opts, mesh):
+        save(path, name, nlev, ilev, opts, mesh)
+
+        done.append(ilev)
+
+        if (ilev == stop): raise stop_t()
+
+    checkpoint.save = kill
+
+    path = tempfile.mkdtemp()
+    try:
+        mesh = jigsawpy.jigsaw_msh_t()
+        try:
+            call(mesh, path)
+
+        except stop_t:
+    #-------------------------------- killed: resume from dir
+            mesh = jigsawpy.jigsaw_msh_t()
+            done.clear()
+            call(mesh, path)
+
+            assert done == list(range(stop - 1, -1, -1))
+
+        else:
+            assert stop is None
+
+    finally:
+        checkpoint.save = save
+
+        shutil.rmtree(path, ignore_errors=True)
+
+    return mesh
+
+
+def same(mesh, base):
+#------------------------------------ identical mesh output?
+    for field in jigsawpy.msh_b.FIELD:
+        data = getattr(base, field, None)
+        test = getattr(mesh, field, None)
+
+        if (data is None or data.size == +0):
+            assert test is None or test.size == +0
+        else:
+            assert np.array_equal(data, test)
+
+    return
+
+
+def case_12_(src_path, dst_path):
+
+    opts = jigsawpy.jigsaw_jig_t()
+    geom = jigsawpy.jigsaw_msh_t()
+    mesh = jigsawpy.jigsaw_msh_t()
+
+#------------------------------------ define JIGSAW geometry
+
+    geom.mshID = "ellipsoid-mesh"
+    geom.radii = np.full(
+        3, 1.000E+000, dtype=geom.REALS_t)
+
+    opts.hfun_hmax = 0.30
+    opts.mesh_dims = +2
+    opts.verbosity = +0
+
+#------------------------------------ stop after lev., etc.
+
+    tgeo = jigsawpy.jigsaw_msh_t()
+    tgeo.mshID = "euclidean-mesh"
+    tgeo.ndims = +2
+    tgeo.vert2 = np.array([
+        ((0, 0), 0), ((9, 0), 0),
+        ((9, 9), 0), ((0, 9), 0)],
+        dtype=tgeo.VERT2_t)
+
+    tgeo.edge2 = np.array([
+        ((0, 1), 0), ((1, 2), 0),
+        ((2, 3), 0), ((3, 0), 0)],
+        dtype=tgeo.EDGE2_t)
+
+    topt = jigsawpy.jigsaw_jig_t()
+    topt.geom_file = \
+        os.path.join(dst_path, "case_12a.msh")
+
+    topt.jcfg_file = \
+        os.path.join(dst_path, "case_12b.jig")
+
+    topt.mesh_file = \
+        os.path.join(dst_path, "case_12b.msh")
+
+    jigsawpy.savemsh(topt.geom_file, tgeo)
+
+    topt.hfun_hmax = 0.50
+    topt.mesh_dims = +2
+    topt.verbosity = +0
+
+    print("Call JIGSAW: case 12a.")
+
+    def call(mesh, path):
+        jigsawpy.cmd.tetris(
+            topt, 2, mesh, resume=path)
+
+    base = build(call)
+
+    for stop in [2, 1]:
+        same(build(call, stop), base)
+
+    print("Call libJIGSAW: case 12b.")
+
+    def call(mesh, path):
+        jigsawpy.lib.tetris(
+            topt, 2, tgeo, mesh, resume=path)
+
+    base = build(call)
+
+    for stop in [2, 1]:
+        same(build(call, stop), base)
+
+#------------------------------------ resume the wrong build
+
+    print("Call libJIGSAW: case 12c.")
+
+    path = tempfile.mkdtemp()
+    try:
+        jigsawpy.lib.icosahedron(
+            opts, 1, geom, mesh, resume=path)
+
+        assert mesh.tria3.size > +0
+
+        try:
+            jigsawpy.lib.cubedsphere(
+                jigsawpy.jigsaw_jig_t(), 1, geom,
+                jigsawpy.jigsaw_msh_t(), resume=path)
+
+        except ValueError:
+            pass
+
+        else:
+            raise AssertionError("RESUME: no error")
+
+    finally:
+        shutil.rmtree(path, ignore_errors=True)
+
+    return
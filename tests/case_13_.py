@@ -0,0 +1,181 @@
+"""
+* DEMO-13 --- build multi-level meshes of the sphere in-mem.,
+*   passing meshes between levels without files.
+*
+* These examples call to JIGSAW via its cmd.-line and its
+* api.-lib. interfaces.
+*
+* Checks the in-memory ICOSAHEDRON and CUBEDSPHERE builds
+* against the cmd.-line path, incl. the cmd.-line fallback
+* for libs. returning bad QUAD4 cells, and TETRIS with INIT
+* and HFUN passed as MSH_t objects.
+*
+"""
+
+import os
+import numpy as np
+import jigsawpy
+
+from jigsawpy import libsaw
+
+
+def same(mesh, base):
+#------------------------------------ identical mesh output?
+#------------------------------------ (lib. POWER is 1-dim.)
+    for field in jigsawpy.msh_b.FIELD:
+        data = getattr(base, field, None)
+        test = getattr(mesh, field, None)
+
+        if (data is None or data.size == +0):
+            assert test is None or test.size == +0
+        else:
+            assert np.array_equal(
+                np.ravel(data), np.ravel(test))
+
+    return
+
+
+def case_13_(src_path, dst_path):
+
+    geom = jigsawpy.jigsaw_msh_t()
+
+#------------------------------------ define JIGSAW geometry
+
+    geom.mshID = "ellipsoid-mesh"
+    geom.radii = np.full(
+        3, 1.000E+000, dtype=geom.REALS_t)
+
+    def setup():
+        opts = jigsawpy.jigsaw_jig_t()
+        opts.geom_file = \
+            os.path.join(dst_path, "case_13a.msh")
+
+        opts.jcfg_file = \
+            os.path.join(dst_path, "case_13b.jig")
+
+        opts.mesh_file = \
+            os.path.join(dst_path, "case_13b.msh")
+
+        opts.hfun_hmax = 0.10
+        opts.mesh_dims = +2
+        opts.verbosity = +0
+
+        return opts
+
+    jigsawpy.savemsh(setup().geom_file, geom)
+
+    for kind, name in [
+            ("icosahedron", "13a"), ("cubedsphere", "13b")]:
+
+        print("Call libJIGSAW: case " + name + ".")
+
+        base = jigsawpy.jigsaw_msh_t()
+        getattr(jigsawpy.cmd, kind)(setup(), 3, base)
+
+        mesh = jigsawpy.jigsaw_msh_t()
+        getattr(jigsawpy.lib, kind)(
+            setup(), 3, geom, mesh)
+
+        same(mesh, base)
+
+    assert base.quad4.size > +0
+
+#------------------------------------ if lib. QUAD4 is bad?
+
+    print("Call libJIGSAW: case 13c.")
+
+    okay = libsaw.quad4ok
+    try:
+        libsaw.quad4ok = lambda: False
+
+        mesh = jigsawpy.jigsaw_msh_t()
+        jigsawpy.lib.cubedsphere(
+            setup(), 3, geom, mesh)
+
+    finally:
+        libsaw.quad4ok = okay
+
+    same(mesh, base)
+
+#------------------------------------ TETRIS, w. INIT + HFUN
+
+    tgeo = jigsawpy.jigsaw_msh_t()
+    tgeo.mshID = "euclidean-mesh"
+    tgeo.ndims = +2
+    tgeo.vert2 = np.array([
+        ((0, 0), 0), ((9, 0), 0),
+        ((9, 9), 0), ((0, 9), 0)],
+        dtype=tgeo.VERT2_t)
+
+    tgeo.edge2 = np.array([
+        ((0, 1), 0), ((1, 2), 0),
+        ((2, 3), 0), ((3, 0), 0)],
+        dtype=tgeo.EDGE2_t)
+
+    init = jigsawpy.jigsaw_msh_t()
+    init.mshID = "euclidean-mesh"
+    init.ndims = +2
+    init.vert2 = np.array(
+        [((4.5, 4.5), 0)], dtype=init.VERT2_t)
+
+    hfun = jigsawpy.jigsaw_msh_t()
+    hfun.mshID = "euclidean-grid"
+    hfun.ndims = +2
+    hfun.xgrid = np.linspace(0., 9., 10)
+    hfun.ygrid = np.linspace(0., 9., 10)
+
+    xpos, ypos = np.meshgrid(hfun.xgrid, hfun.ygrid)
+
+    hfun.value = np.asarray(
+        0.3 + 0.05 * xpos, dtype=hfun.REALS_t)
+
+    def setup():
+        opts = jigsawpy.jigsaw_jig_t()
+        opts.geom_file = \
+            os.path.join(dst_path, "case_13c.msh")
+
+        opts.jcfg_file = \
+            os.path.join(dst_path, "case_13d.jig")
+
+        opts.mesh_file = \
+            os.path.join(dst_path, "case_13d.msh")
+
+        opts.hfun_hmax = 1.00
+        opts.hfun_scal = "absolute"
+        opts.mesh_dims = +2
+        opts.verbosity = +0
+
+        return opts
+
+    jigsawpy.savemsh(setup().geom_file, tgeo)
+
+    print("Call JIGSAW: case 13d.")
+
+    opts = setup()
+    opts.init_file = \
+        os.path.join(dst_path, "case_13e.msh")
+
+    opts.hfun_file = \
+        os.path.join(dst_path, "case_13f.msh")
+
+    jigsawpy.savemsh(opts.init_file, init)
+    jigsawpy.savemsh(opts.hfun_file, hfun)
+
+    base = jigsawpy.jigsaw_msh_t()
+    jigsawpy.cmd.tetris(opts, 2, base)
+
+    mesh = jigsawpy.jigsaw_msh_t()
+    jigsawpy.jigsaw.tetris(
+        setup(), 2, mesh, init=init, hfun=hfun)
+
+    same(mesh, base)
+
+    print("Call libJIGSAW: case 13e.")
+
+    mesh = jigsawpy.jigsaw_msh_t()
+    jigsawpy.lib.tetris(
+        setup(), 2, tgeo, mesh, init, hfun)
+
+    same(mesh, base)
+
+    return
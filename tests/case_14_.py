@@ -0,0 +1,136 @@
+"""
+* DEMO-14 --- re-use JIGSAW outputs from the result cache,
+*   for repeated calls with the same inputs.
+*
+* These examples call to JIGSAW via its cmd.-line and its
+* api.-lib. interfaces.
+*
+* Checks cache hits, misses on changed GEOM data, and that
+* keys follow the JIGSAW lib. loaded, plus the RUN_t info.
+* returned and passed to callbacks.
+*
+"""
+
+import os
+import shutil
+import tempfile
+import numpy as np
+import jigsawpy
+
+from jigsawpy import cache, resolve, telemetry
+
+
+def case_14_(src_path, dst_path):
+
+    opts = jigsawpy.jigsaw_jig_t()
+    geom = jigsawpy.jigsaw_msh_t()
+    mesh = jigsawpy.jigsaw_msh_t()
+
+#------------------------------------ define JIGSAW geometry
+
+    geom.mshID = "euclidean-mesh"
+    geom.ndims = +2
+    geom.vert2 = np.array([
+        ((0, 0), 0), ((9, 0), 0),
+        ((9, 9), 0), ((0, 9), 0)],
+        dtype=geom.VERT2_t)
+
+    geom.edge2 = np.array([
+        ((0, 1), 0), ((1, 2), 0),
+        ((2, 3), 0), ((3, 0), 0)],
+        dtype=geom.EDGE2_t)
+
+    opts.geom_file = \
+        os.path.join(dst_path, "case_14a.msh")
+
+    opts.jcfg_file = \
+        os.path.join(dst_path, "case_14b.jig")
+
+    opts.mesh_file = \
+        os.path.join(dst_path, "case_14b.msh")
+
+    jigsawpy.savemsh(opts.geom_file, geom)
+
+    opts.hfun_hmax = 0.50
+    opts.mesh_dims = +2
+    opts.verbosity = +0
+
+    done = []
+
+    def scan(name):
+        raise AssertionError("MSH_INFO: file re-scan")
+
+    keep = telemetry.msh_info
+    telemetry.msh_info = scan
+    telemetry.subscribe(done.append)
+
+    path = tempfile.mkdtemp()
+    try:
+        cache.enable(path)
+        cache.clear()                   # zero STATS, etc.
+
+    #-------------------------------- cmd.: miss, then a hit
+        print("Call JIGSAW: case 14a.")
+
+        info = jigsawpy.cmd.jigsaw(opts, mesh)
+
+        assert not info.cached
+
+        assert done == [info]           # w. CELLS from MESH
+        assert info.cells["tria3"] == len(mesh.tria3)
+        assert info.cells["vert2"] == len(mesh.vert2)
+        assert cache.stats()["stores"] == 1
+
+        base = mesh.tria3.copy()
+
+        mesh = jigsawpy.jigsaw_msh_t()
+        info = jigsawpy.cmd.jigsaw(opts, mesh)
+
+        assert info.cached and info.returncode == +0
+        assert info.cells["tria3"] == len(base)
+        assert cache.stats()["hits"] == 1
+
+        assert np.array_equal(mesh.tria3, base)
+
+    #-------------------------------- new GEOM_FILE: a miss
+        geom.vert2["coord"][1:3, 0] = 5.
+        jigsawpy.savemsh(opts.geom_file, geom)
+
+        info = jigsawpy.cmd.jigsaw(opts, mesh)
+
+        assert not info.cached
+        assert cache.stats()["stores"] == 2
+
+        assert mesh.point["coord"][:, 0].max() == 5.
+
+    #-------------------------------- lib.: keys on lib. file
+        print("Call libJIGSAW: case 14b.")
+
+        ckey = cache.libkey(opts, geom)
+
+        jigsawpy.lib.jigsaw(opts, geom, mesh)
+        jigsawpy.lib.jigsaw(opts, geom, mesh)
+
+        assert cache.stats()["hits"] == 2
+
+        skey = ("stamp", str(resolve.findlib()))
+        stamp = resolve.CACHE[skey]
+        try:
+            resolve.CACHE[skey] = stamp + ";new"
+
+            assert cache.libkey(opts, geom) != ckey
+
+        finally:
+            resolve.CACHE[skey] = stamp
+
+        assert cache.libkey(opts, geom) == ckey
+
+    finally:
+        telemetry.msh_info = keep
+        telemetry.unsubscribe(done.append)
+
+        cache.clear()
+        cache.disable()
+        shutil.rmtree(path, ignore_errors=True)
+
+    return
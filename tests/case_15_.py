@@ -0,0 +1,391 @@
+"""
+* DEMO-15 --- save and load meshes and grids via each of the
+*   *.msh file formats.
+*
+* Checks that MSH_t objects round-trip exactly through each
+* format, incl. dtypes and shapes, and that ASCII files are
+* parsed as per a simple row-by-row reader. Also checks the
+* MSH_INFO header scan, LOADMSH(..., SECTIONS=), and the
+* chunked ITER_SECTION reader and MSH_WRITER, and that reals
+* are written exactly as printf's "%.Pg".
+*
+"""
+
+import os
+import numpy as np
+import jigsawpy
+
+from jigsawpy import msh_b
+
+
+def meshes():
+#------------------------------------ a mesh w. every field
+    rand = np.random.default_rng(1)
+
+    mesh = jigsawpy.jigsaw_msh_t()
+    mesh.mshID = "euclidean-mesh"
+    mesh.ndims = +3
+
+    npts = +64
+    mesh.vert3 = np.zeros(npts, dtype=mesh.VERT3_t)
+    mesh.vert3["coord"] = \
+        rand.standard_normal((npts, 3)) * 1.E+3
+    mesh.vert3["IDtag"] = rand.integers(-9, 9, npts)
+
+    mesh.power = rand.random((npts, 1))
+
+    for field, nnod in [
+            ("edge2", 2), ("tria3", 3), ("quad4", 4),
+            ("tria4", 4), ("hexa8", 8), ("wedg6", 6),
+            ("pyra5", 5)]:
+        kind = getattr(mesh, field.upper() + "_t")
+
+        data = np.zeros(+16, dtype=kind)
+        data["index"] = rand.integers(0, npts, (16, nnod))
+        data["IDtag"] = rand.integers(0, 5, 16)
+
+        setattr(mesh, field, data)
+
+    mesh.bound = np.zeros(+4, dtype=mesh.BOUND_t)
+    mesh.bound["index"] = np.arange(4)
+    mesh.bound["cells"] = +5
+
+    mesh.value = np.asarray(
+        rand.random((npts, 2)), dtype=mesh.FLT32_t)
+    mesh.slope = np.asarray(
+        rand.random((npts, 1)), dtype=mesh.FLT32_t)
+
+#------------------------------------ a grid on an ellipsoid
+    grid = jigsawpy.jigsaw_msh_t()
+    grid.mshID = "ellipsoid-grid"
+    grid.ndims = +2
+
+    grid.radii = np.array([1., 2., 3.])
+    grid.xgrid = np.linspace(-3., 3., 7)
+    grid.ygrid = np.linspace(-1., 1., 5)
+
+    grid.value = np.asarray(
+        rand.random((5, 7)), dtype=grid.FLT32_t)
+    grid.slope = np.asarray(
+        rand.random((5, 7)), dtype=grid.FLT32_t)
+
+    return [mesh, grid]
+
+
+def same(mesh, base):
+#------------------------------------ exact, incl. the dtype
+    assert mesh.mshID == base.mshID
+    assert mesh.ndims == base.ndims
+
+    for field in msh_b.FIELD:
+        data = getattr(base, field, None)
+        test = getattr(mesh, field, None)
+
+        if (data is None or data.size == +0):
+            assert test is None or test.size == +0
+            continue
+
+        assert test.shape == data.shape
+        assert test.dtype == data.dtype
+
+        assert np.array_equal(test, data)
+
+    return
+
+
+def textref(name):
+#------------------------------------ ref. parse, row-by-row
+    data = {}; item = None
+    with open(name, "r") as fptr:
+        for line in fptr:
+            line = line.strip()
+
+            if (line == "" or line.startswith("#")):
+                continue
+
+            if ("=" in line):
+                stag, dims = line.split("=")
+                item = data[stag.upper()] = []
+                continue
+
+            item.append([float(vals) for vals in
+                         line.split(";")])
+
+    return data
+
+
+def loaded(name, sections=None):
+#------------------------------------ LOADMSH, as a function
+    mesh = jigsawpy.jigsaw_msh_t()
+    jigsawpy.loadmsh(name, mesh, sections)
+
+    return mesh
+
+
+def case_15_(src_path, dst_path):
+
+#------------------------------------ ASCII + binary formats
+
+    print("Saving case_15a.msh file.")
+
+    name = os.path.join(dst_path, "case_15a.msh")
+
+    for base in meshes():
+        for kind in ["ascii", "binary"]:
+            jigsawpy.savemsh(name, base, kind=kind)
+
+            same(loaded(name), base)
+
+#------------------------------------ binary: memory-mapped
+
+    print("Saving case_15b.msh file.")
+
+    name = os.path.join(dst_path, "case_15b.msh")
+
+    base = meshes()[0]
+    jigsawpy.savemsh(name, base, kind="binary")
+
+    with open(name, "rb") as fptr:
+        assert fptr.read(len(msh_b.MAGIC)) == msh_b.MAGIC
+
+    mesh = loaded(name)
+
+    assert isinstance(mesh.tria3.base, np.memmap) or \
+        isinstance(mesh.tria3, np.memmap)
+
+    next = meshes()[0]
+    next.vert3["coord"] *= 2.
+
+    jigsawpy.savemsh(name, next, kind="binary")
+
+    same(mesh, base)                    # old map still valid
+    same(loaded(name), next)
+
+    next.vert3 = next.vert3[::2]        # non-contig. views
+    next.power = next.power[::2]
+    next.tria3 = next.tria3[::-1]
+    next.value = next.value[:, 1:]
+
+    jigsawpy.savemsh(name, next, kind="binary")
+
+    same(loaded(name), next)
+
+#------------------------------------ ASCII: bulk vs by-row
+
+    print("Saving case_15c.msh file.")
+
+    for item in [
+            "airfoil.msh", "bunny.msh", "lakes.msh",
+            "piece.msh", "wheel.msh"]:
+        path = os.path.join(src_path, item)
+
+        mesh = loaded(path)
+        data = textref(path)
+
+        vert = np.array(data["POINT"])
+
+        assert np.array_equal(mesh.point["coord"], vert[:, :-1])
+        assert np.array_equal(mesh.point["IDtag"], vert[:, -1])
+
+        for stag in ["EDGE2", "TRIA3"]:
+            if (stag not in data): continue
+
+            cell = np.array(data[stag])
+            test = getattr(mesh, stag.lower())
+
+            assert np.array_equal(test["index"], cell[:, :-1])
+            assert np.array_equal(test["IDtag"], cell[:, -1])
+
+    name = os.path.join(dst_path, "case_15c.msh")
+
+    with open(name, "w", newline="") as fptr:
+        fptr.write(
+            "# case_15c.msh; by hand\r\n"
+            "MSHID=2;EUCLIDEAN-MESH\r\n"
+            "NDIMS=2\r\n\r\n"
+            "POINT=3\r\n"
+            "0.5;-1E+2;0\r\n1;2;-1\r\n3;4.25;7\r\n\r\n"
+            "# blank lines + comments between sections\n\n"
+            "VALUE=3;2\n"
+            "1;2\n3;4\n5;6\n"
+            "TRIA3=1\n"
+            "0;1;2;9\n")
+
+    mesh = loaded(name)
+
+    assert np.array_equal(mesh.point["coord"], [
+        [0.5, -1.E+2], [1., 2.], [3., 4.25]])
+    assert np.array_equal(mesh.point["IDtag"], [0, -1, 7])
+
+    assert np.array_equal(mesh.value, [[1, 2], [3, 4], [5, 6]])
+
+    assert np.array_equal(mesh.tria3["index"], [[0, 1, 2]])
+    assert np.array_equal(mesh.tria3["IDtag"], [9])
+
+#------------------------------------ MSH_INFO, + SECTIONS=
+
+    print("Saving case_15d.msh file.")
+
+    name = os.path.join(dst_path, "case_15d.msh")
+
+    for base in meshes():
+        for kind in ["ascii", "binary"]:
+            jigsawpy.savemsh(name, base, kind=kind)
+
+            info = jigsawpy.msh_info(name)
+
+            assert info["kind"] == kind
+            assert info["mshID"] == base.mshID
+            assert info["ndims"] == base.ndims
+
+            grid = base.mshID.endswith("-grid")
+
+            for sect in info["sections"]:
+                data = getattr(base, sect["field"])
+
+                assert sect["dtype"] == data.dtype
+                assert sect["nbytes"] == data.nbytes
+                assert grid or sect["shape"] == data.shape
+
+                if (sect["field"] == "radii"): continue
+
+                mesh = loaded(name, [sect["tag"]])
+
+                for field in msh_b.FIELD:
+                    test = getattr(mesh, field, None)
+
+                    if (field == sect["field"]):
+                        assert np.array_equal(test, data)
+
+                    elif (field == "radii" or grid and
+                            field.endswith("grid")):
+                        assert np.array_equal(
+                            test, getattr(base, field))
+
+                    else:
+                        assert test is None or test.size == 0
+
+            assert sorted(
+                sect["field"] for sect in info["sections"] if
+                sect["field"] != "radii") == sorted(
+                field for field in msh_b.FIELD if
+                field != "radii" and
+                getattr(base, field).size > +0)
+
+    try:
+        loaded(name, ["POINT", "NONE"])
+
+    except ValueError:
+        pass
+
+    else:
+        raise AssertionError("SECTIONS: no error")
+
+#------------------------------------ ITER_SECTION in chunks
+
+    print("Saving case_15e.msh file.")
+
+    name = os.path.join(dst_path, "case_15e.msh")
+
+    for base in meshes():
+        for kind in ["ascii", "binary"]:
+            jigsawpy.savemsh(name, base, kind=kind)
+
+            info = jigsawpy.msh_info(name)
+
+            for sect in info["sections"]:
+                if (sect["field"] == "radii"): continue
+
+                data = getattr(base, sect["field"])
+
+                if (sect["field"] in ["value", "slope"] and
+                        base.mshID.endswith("-grid")):
+                    data = data.reshape((-1, 1), order="F")
+
+                next = list(jigsawpy.iter_section(
+                    name, sect["field"], chunk=5))
+
+                assert all(len(item) <= 5 for item in next)
+
+                test = np.concatenate(next)
+
+                assert test.dtype == data.dtype
+                assert np.array_equal(test, data)
+
+#------------------------------------ MSH_WRITER == SAVEMSH
+
+    print("Saving case_15f.msh file.")
+
+    name = os.path.join(dst_path, "case_15f.msh")
+
+    base = meshes()[0]
+    jigsawpy.savemsh(name, base)
+
+    info = jigsawpy.msh_info(name)
+
+    with open(name, "rb") as fptr:
+        keep = fptr.read()
+
+    with jigsawpy.msh_writer(
+            name, base.mshID, base.ndims) as fout:
+        for sect in info["sections"]:
+            data = getattr(base, sect["field"])
+
+            fout.section(
+                sect["tag"], data.shape[0],
+                nval=data.shape[-1])
+
+            for next in range(0, data.shape[0], 5):
+                fout.write(data[next:next + 5])
+
+    with open(name, "rb") as fptr:
+        assert fptr.read() == keep
+
+#------------------------------------ ASCII: printf's "%.Pg"
+
+    print("Saving case_15g.msh file.")
+
+    name = os.path.join(dst_path, "case_15g.msh")
+
+    rand = np.random.default_rng(3)
+
+    tens = np.array([float("1E%d" % iexp) for iexp in
+                     range(-300, 301, 7)])
+
+    vals = np.concatenate((
+        rand.standard_normal(999) *
+        10. ** rand.integers(-300, 300, 999),
+        tens, np.nextafter(tens, 0.), [
+            0., -0., .5, 2.5, 1. / 3., 9.9999999999999995E-5,
+            5.E-324, 2.2250738585072014E-308,
+            1.7976931348623157E+308]))
+
+    mesh = jigsawpy.jigsaw_msh_t()
+    mesh.mshID = "euclidean-mesh"
+    mesh.ndims = +2
+    mesh.point = np.zeros(vals.size, dtype=mesh.VERT2_t)
+    mesh.point["IDtag"] = rand.integers(
+        -2 ** 31, 2 ** 31 - 1, vals.size)
+
+    for kind, ndig in [("f8", 17), ("f4", +9)]:
+        mesh.value = np.asarray(vals.reshape((-1, 1)))
+        mesh.value[
+            np.abs(vals) > np.finfo(kind).max] = 1.
+
+        mesh.value = mesh.value.astype(kind)
+
+        for prec in [None] + list(range(1, 18)):
+            jigsawpy.savemsh(name, mesh, prec=prec)
+
+            with open(name, "r") as fptr:
+                data = fptr.read().split("VALUE=")[1]
+
+            fmt_ = "%%.%ug" % (prec or ndig)
+
+            assert data.splitlines()[1:] == [
+                fmt_ % item for item in mesh.value[:, 0]]
+
+    assert np.array_equal(
+        loaded(name).point["IDtag"], mesh.point["IDtag"])
+
+    return
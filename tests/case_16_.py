@@ -0,0 +1,327 @@
+"""
+* DEMO-16 --- save and load compressed *.msh and *.jig files,
+*   and *.msh data via file-like streams and sidecar files.
+*
+* Checks that meshes, grids and configs. round-trip exactly
+* through *.gz, *.xz and *.bz2 files, for ASCII and binary
+* *.msh files alike, through file-like streams, and through
+* raw VALUE and SLOPE sidecar files. Also checks UPDATEMSH
+* for each of these.
+*
+"""
+
+import io
+import os
+import sys
+import gzip
+import numpy as np
+import jigsawpy
+
+from jigsawpy import zipio
+
+from tests.case_15_ import meshes, same, loaded
+
+
+def case_16_(src_path, dst_path):
+
+#------------------------------------ *.msh.gz, *.xz, *.bz2
+
+    print("Saving case_16a.msh file.")
+
+    name = os.path.join(dst_path, "case_16a.msh")
+
+    for base in meshes():
+        for kind in ["ascii", "binary"]:
+            for ztag, zmag in zipio.MAGIC.items():
+                jigsawpy.savemsh(name + ztag, base, kind=kind)
+
+                with open(name + ztag, "rb") as fptr:
+                    assert fptr.read(len(zmag)) == zmag
+
+                assert zipio.zipped(name + ztag) == ztag
+
+                same(loaded(name + ztag), base)
+
+#------------------------------------ names, LEVEL, errors
+
+    print("Saving case_16b.msh file.")
+
+    base = meshes()[0]
+
+    name = os.path.join(dst_path, "case_16b.gz")
+
+    jigsawpy.savemsh(name, base, level=+1)
+
+    name = os.path.join(dst_path, "case_16b.msh.gz")
+
+    assert os.path.isfile(name)         # x.gz => x.msh.gz
+
+    size = os.path.getsize(name)
+
+    jigsawpy.savemsh(name, base, level=+9)
+
+    assert os.path.getsize(name) <= size
+
+    same(loaded(name), base)
+
+    for level in [0, 10]:
+        try:
+            jigsawpy.savemsh(name, base, level=level)
+
+        except ValueError:
+            pass
+
+        else:
+            raise AssertionError("LEVEL: no error")
+
+#------------------------------------ *.jig.gz, *.xz, *.bz2
+
+    print("Saving case_16c.jig file.")
+
+    opts = jigsawpy.jigsaw_jig_t()
+    opts.geom_file = "case_16c-geom.msh"
+    opts.mesh_file = "case_16c-mesh.msh"
+    opts.hfun_hmax = 0.0625
+    opts.mesh_dims = +2
+    opts.mesh_kern = "delfront"
+    opts.optm_iter = +32
+    opts.verbosity = +1
+
+    name = os.path.join(dst_path, "case_16c.jig")
+
+    for ztag in zipio.MAGIC:
+        jigsawpy.savejig(name + ztag, opts)
+
+        assert zipio.zipped(name + ztag) == ztag
+
+        test = jigsawpy.jigsaw_jig_t()
+        jigsawpy.loadjig(name + ztag, test)
+
+        for item, data in vars(opts).items():
+            if (isinstance(data, float)):
+                assert np.isclose(getattr(test, item), data)
+            else:
+                assert getattr(test, item) == data
+
+#------------------------------------ streams, text + binary
+
+    print("Saving case_16d.msh stream.")
+
+    for base in meshes():
+        for kind, fptr in [
+                ("ascii", io.StringIO("head")),
+                ("ascii", io.BytesIO(b"head")),
+                ("binary", io.BytesIO(b"head"))]:
+            fptr.seek(+4)               # from current pos.
+            jigsawpy.savemsh(fptr, base, kind=kind)
+
+            fptr.seek(+4)
+            assert jigsawpy.msh_info(fptr)["kind"] == kind
+
+            fptr.seek(+4)
+            same(loaded(fptr), base)
+
+            assert not fptr.closed      # left open on exit
+
+            fptr.seek(+0)
+            assert fptr.read(+4) in ["head", b"head"]
+
+    #-------------------------------- compressed, on read only
+        fptr = io.BytesIO()
+        jigsawpy.savemsh(fptr, base, kind="binary")
+
+        same(loaded(io.BytesIO(
+            gzip.compress(fptr.getvalue()))), base)
+
+    try:
+        jigsawpy.savemsh(io.StringIO(), base, kind="binary")
+
+    except TypeError:
+        pass
+
+    else:
+        raise AssertionError("SAVEMSH: no error")
+
+#------------------------------------ VALUE + SLOPE sidecars
+
+    print("Saving case_16e.msh file.")
+
+    for base in meshes():
+        for ztag in ["", ".gz"]:
+            name = os.path.join(dst_path, "case_16e.msh" + ztag)
+
+            jigsawpy.savemsh(name, base, sidecar=True)
+
+            info = jigsawpy.msh_info(name)
+
+            for sect in info["sections"]:
+                if (sect["field"] not in ["value", "slope"]):
+                    assert "sidecar" not in sect
+                    continue
+
+                assert sect["sidecar"] == os.path.join(
+                    dst_path, "case_16e." + sect["field"] +
+                    ".f32")
+
+                assert os.path.getsize(
+                    sect["sidecar"]) == sect["nbytes"]
+
+            mesh = loaded(name)
+
+            same(mesh, base)
+
+            for data in [mesh.value, mesh.slope]:
+                assert isinstance(data, np.memmap) or \
+                    isinstance(data.base, np.memmap)
+
+            if (base.mshID.endswith("-grid")):
+                assert mesh.value.flags.f_contiguous
+
+    #-------------------------------- sidecars not with these
+    for kind, name in [
+            ("binary", os.path.join(dst_path, "case_16e.msh")),
+            ("ascii", io.StringIO())]:
+        try:
+            jigsawpy.savemsh(name, base, kind, sidecar=True)
+
+        except ValueError:
+            pass
+
+        else:
+            raise AssertionError("SIDECAR: no error")
+
+#------------------------------------ names w. dir. rejected
+
+    name = os.path.join(dst_path, "case_16e.msh")
+
+    jigsawpy.savemsh(name, meshes()[0], sidecar=True)
+
+    with open(name, "r") as fptr:
+        text = fptr.read()
+
+    for side in [
+            "../case_16e.value.f32",
+            os.path.join(dst_path, "case_16e.value.f32"),
+            "..", "sub\\case_16e.value.f32"]:
+        with open(name, "w") as fptr:
+            fptr.write(text.replace(
+                "case_16e.value.f32", side))
+
+        try:
+            loaded(name)
+
+        except ValueError:
+            pass
+
+        else:
+            raise AssertionError("SIDECAR: no error")
+
+#------------------------------------ UPDATEMSH, in each fmt
+
+    print("Saving case_16f.msh file.")
+
+    name = os.path.join(dst_path, "case_16f.msh")
+
+    for base in meshes():
+        for kind, side, ztag in [
+                ("ascii", False, ""), ("ascii", True, ""),
+                ("binary", False, ""), ("ascii", False, ".gz")]:
+            jigsawpy.savemsh(
+                name + ztag, base, kind, sidecar=side)
+
+            keep = loaded(name + ztag)
+
+            mesh = meshes()[base.mshID.endswith("-grid")]
+            mesh.value *= 2.
+            mesh.slope *= 3.
+
+            jigsawpy.updatemsh(name + ztag, mesh, "VALUE")
+
+            test = loaded(name + ztag)
+
+            assert np.array_equal(test.value, mesh.value)
+            assert np.array_equal(
+                test.slope, base.slope if ztag == "" else
+                mesh.slope)             # *.gz: saved in full
+
+            jigsawpy.updatemsh(name + ztag, mesh, ["SLOPE"])
+
+            same(loaded(name + ztag), mesh)
+
+            if (kind == "binary"):
+    #-------------------------------- mapped data sees update
+                assert np.array_equal(keep.value, mesh.value)
+
+            else:
+                same(keep, base)
+
+            info = jigsawpy.msh_info(name + ztag)
+
+            assert info["kind"] == kind
+            assert side == any(
+                "sidecar" in item for item in info["sections"])
+
+    #-------------------------------- binary: strided, shape
+    base = meshes()[0]
+    mesh = meshes()[0]
+    mesh.value = mesh.value[:, :1]
+
+    jigsawpy.savemsh(name, mesh, "binary")
+
+    mesh.value = base.value[:, 1:]      # same shape, strided
+    jigsawpy.updatemsh(name, mesh, "VALUE")
+
+    same(loaded(name), mesh)
+
+    jigsawpy.updatemsh(name, base, "VALUE")
+
+    same(loaded(name), base)
+
+    os.remove(name)                     # no file: saved anew
+
+    jigsawpy.updatemsh(name, mesh, "VALUE")
+
+    same(loaded(name), mesh)
+
+#------------------------------------ failure leaves NAME ok
+
+    save = sys.modules["jigsawpy.savemsh"]
+
+    jigsawpy.savemsh(name, base)
+
+    with open(name, "rb") as fptr:
+        keep = fptr.read()
+
+    def fail(*args):
+        raise OSError(28, "No space left on device")
+
+    field = save.savefield
+    save.savefield = fail
+    try:
+        jigsawpy.updatemsh(name, mesh, "VALUE")
+
+    except OSError:
+        pass
+
+    else:
+        raise AssertionError("UPDATEMSH: no error")
+
+    finally:
+        save.savefield = field
+
+    with open(name, "rb") as fptr:
+        assert fptr.read() == keep
+
+    assert not os.path.exists(name + ".part")
+
+    for sect in [["POINT"], ["VALUE", "NONE"]]:
+        try:
+            jigsawpy.updatemsh(name, mesh, sect)
+
+        except ValueError:
+            pass
+
+        else:
+            raise AssertionError("SECTIONS: no error")
+
+    return
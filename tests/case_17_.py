@@ -0,0 +1,414 @@
+"""
+* DEMO-17 --- export meshes to *.off, *.obj and *.vtk files,
+*   incl. binary *.vtk and xml *.vtu/*.vtr files.
+*
+* Checks exporter output line-by-line against a simple "%g"
+* formatter, and that *.off and *.obj files load back into
+* the same mesh. Binary and xml VTK files are parsed here
+* via NUMPY and ELEMENTTREE, and compared to the mesh, as
+* are the steps of a PVD_WRITER series.
+*
+"""
+
+import os
+import sys
+import zlib
+import warnings
+import numpy as np
+import xml.etree.ElementTree as ET
+import jigsawpy
+
+
+def meshes():
+#------------------------------------ 2- + 3-dim. mixed mesh
+    rand = np.random.default_rng(4)
+
+    next = []
+    for ndim in [2, 3]:
+        mesh = jigsawpy.jigsaw_msh_t()
+        mesh.mshID = "euclidean-mesh"
+        mesh.ndims = ndim
+
+        vert = getattr(mesh, "VERT%u_t" % ndim)
+
+        data = np.zeros(+32, dtype=vert)
+        data["coord"] = \
+            rand.standard_normal((32, ndim)) * 1.E+2
+        data["IDtag"] = rand.integers(0, 9, 32)
+
+        setattr(mesh, "vert%u" % ndim, data)
+
+        for field, nnod in [
+                ("edge2", 2), ("tria3", 3), ("quad4", 4)]:
+            kind = getattr(mesh, field.upper() + "_t")
+
+            data = np.zeros(+8, dtype=kind)
+            data["index"] = rand.integers(0, 32, (8, nnod))
+            data["IDtag"] = rand.integers(0, 5, 8)
+
+            setattr(mesh, field, data)
+
+        mesh.value = np.asarray(
+            rand.random((32, 1)), dtype=mesh.FLT32_t)
+
+        next.append(mesh)
+
+    return next
+
+
+def points(mesh):
+#------------------------------------ coord. as 3-dim. array
+    if (mesh.ndims == +2):
+        return np.column_stack((
+            mesh.vert2["coord"], np.zeros(mesh.vert2.size)))
+
+    return mesh.vert3["coord"]
+
+
+def textoff(name, mesh):
+#------------------------------------ ref. *.off via "%.17g"
+    xyz_ = points(mesh)
+    text = [
+        "OFF ",
+        "# " + os.path.basename(name) +
+        "; created by JIGSAW's Python interface ",
+        "%d %d 0" % (len(xyz_), mesh.tria3.size +
+                     mesh.quad4.size)]
+
+    text += ["%.17g %.17g %.17g" % tuple(row) for row in xyz_]
+
+    for cell in [mesh.tria3, mesh.quad4]:
+        nnod = cell["index"].shape[1]
+        text += [str(nnod) + " " + " ".join(
+            "%d" % indx for indx in row)
+            for row in cell["index"]]
+
+    return text
+
+
+def textobj(name, mesh):
+#------------------------------------ ref. *.obj via "%.17g"
+    text = [
+        "# " + os.path.basename(name) +
+        "; created by JIGSAW's Python interface "]
+
+    text += ["v %.17g %.17g %.17g" % tuple(row)
+             for row in points(mesh)]
+
+    for ctag, cell in [
+            ("l ", mesh.edge2), ("f ", mesh.tria3),
+            ("f ", mesh.quad4)]:
+        text += [ctag + " ".join(
+            "%d" % (indx + 1) for indx in row)
+            for row in cell["index"]]
+
+    return text
+
+
+def textvtk(name, mesh):
+#------------------------------------ ref. *.vtk via "%.17g"
+    xyz_ = points(mesh)
+    cell = [(mesh.edge2, 3), (mesh.tria3, 5), (mesh.quad4, 9)]
+
+    ncel = sum(item.size for item, _ in cell)
+    nidx = sum(item["index"].size + item.size
+               for item, _ in cell)
+
+    text = [
+        "# vtk DataFile Version 3.0",
+        os.path.basename(name), "ASCII",
+        "DATASET UNSTRUCTURED_GRID ",
+        "POINTS %d double " % len(xyz_)]
+
+    text += ["%.17g %.17g %.17g" % tuple(row) for row in xyz_]
+
+    text += ["CELLS %d %d " % (ncel, nidx)]
+
+    for item, _ in cell:
+        nnod = item["index"].shape[1]
+        text += [str(nnod) + " " + " ".join(
+            "%d" % indx for indx in row)
+            for row in item["index"]]
+
+    text += ["CELL_TYPES %d" % ncel]
+
+    for item, kind in cell:
+        text += [str(kind)] * item.size
+
+    text += [
+        "POINT_DATA %d" % len(xyz_),
+        "SCALARS value float 1", "LOOKUP_TABLE default "]
+
+    text += ["%.9g" % vals for vals in mesh.value[:, 0]]
+
+    return text
+
+
+def grid():
+#------------------------------------ a 2-dim. grid w. VALUE
+    rand = np.random.default_rng(5)
+
+    mesh = jigsawpy.jigsaw_msh_t()
+    mesh.mshID = "euclidean-grid"
+    mesh.ndims = +2
+    mesh.xgrid = np.linspace(-3., 3., 7)
+    mesh.ygrid = np.linspace(-1., 1., 5)
+    mesh.value = np.asarray(
+        rand.random((5, 7)), dtype=mesh.FLT32_t)
+
+    return mesh
+
+
+def expected(mesh):
+#------------------------------------ arrays in a VTK object
+    if (mesh.mshID.endswith("-grid")):
+        return {
+            "x": mesh.xgrid, "y": mesh.ygrid, "z": [0.],
+            "value": mesh.value.ravel()}    # x-fastest
+
+    cell = [(mesh.edge2, 3), (mesh.tria3, 5), (mesh.quad4, 9)]
+
+    return {
+        "Points": points(mesh).ravel(),
+        "connectivity": np.concatenate(
+            [item["index"].ravel() for item, _ in cell]),
+        "offsets": np.cumsum(np.concatenate(
+            [np.full(item.size, item["index"].shape[1])
+             for item, _ in cell])),
+        "types": np.concatenate(
+            [np.full(item.size, kind) for item, kind in cell]),
+        "cells": np.concatenate([np.column_stack((
+            np.full(item.size, item["index"].shape[1]),
+            item["index"])).ravel() for item, _ in cell]),
+        "point.IDtag": getattr(
+            mesh, "vert%u" % mesh.ndims)["IDtag"],
+        "cell.IDtag": np.concatenate(
+            [item["IDtag"] for item, _ in cell]),
+        "value": mesh.value.ravel()}
+
+
+def readbin(name):
+#------------------------------------ ref. legacy binary VTK
+    kind = {"double": ">f8", "float": ">f4", "int": ">i4",
+            "vtkIdType": ">i8", "unsigned_char": "u1"}
+
+    data = {}; attr = "point."
+    with open(name, "rb") as fptr:
+        assert fptr.readline() == b"# vtk DataFile Version 3.0\n"
+        assert fptr.readline() == \
+            os.path.basename(name).encode() + b"\n"
+        assert fptr.readline() == b"BINARY\n"
+
+        def vals(stag, size, dtyp):
+            dtyp = np.dtype(kind[dtyp])
+            data[stag] = np.frombuffer(
+                fptr.read(size * dtyp.itemsize), dtyp)
+
+            assert fptr.read(+1) == b"\n"
+
+        while (True):
+            line = fptr.readline().decode("ascii").split()
+
+            if (len(line) == +0): break
+
+            if (line[0] == "POINTS"):
+                vals("Points", 3 * int(line[1]), line[2])
+
+            elif (line[0] == "CELLS"):
+                vals("cells", int(line[2]), "int")
+
+            elif (line[0] == "CELL_TYPES"):
+                vals("types", int(line[1]), "int")
+
+            elif (line[0].endswith("_COORDINATES")):
+                vals(line[0][0].lower(), int(line[1]), line[2])
+
+            elif (line[0] in ["POINT_DATA", "CELL_DATA"]):
+                attr = line[0].split("_")[0].lower() + "."
+
+            elif (line[0] == "FIELD"):
+                for _ in range(int(line[2])):
+                    stag, ncmp, ntup, dtyp = \
+                        fptr.readline().decode("ascii").split()
+
+                    vals(attr + stag if stag == "IDtag" else
+                         stag, int(ncmp) * int(ntup), dtyp)
+
+    return data
+
+
+def readxml(name):
+#------------------------------------ ref. xml VTK + append
+    kind = {"Float64": "<f8", "Float32": "<f4", "Int64": "<i8",
+            "Int32": "<i4", "UInt8": "u1"}
+
+    with open(name, "rb") as fptr:
+        byte = fptr.read()
+
+    mark = b'<AppendedData encoding="raw">\n_'
+    head = byte[:byte.index(mark)]
+    tail = byte[byte.index(mark) + len(mark):]
+
+    root = ET.fromstring(head + b"</VTKFile>")
+
+    assert root.get("header_type") == "UInt64"
+    assert root.get("byte_order") == "LittleEndian"
+
+    data = {}
+    for sect in root.iter():
+        for item in sect.findall("DataArray"):
+            fpos = int(item.get("offset"))
+            dtyp = np.dtype(kind[item.get("type")])
+
+            if (root.get("compressor") is None):
+                nlen = int(np.frombuffer(tail, "<u8", 1, fpos)[0])
+
+                vals = tail[fpos + 8:fpos + 8 + nlen]
+
+            else:
+                nblk = int(np.frombuffer(tail, "<u8", 1, fpos)[0])
+
+                size = np.frombuffer(
+                    tail, "<u8", 3 + nblk, fpos)[3:]
+
+                fpos = fpos + 8 * (3 + nblk); vals = b""
+
+                for nlen in size.tolist():
+                    vals += zlib.decompress(
+                        tail[fpos:fpos + nlen])
+                    fpos = fpos + nlen
+
+            stag = item.get("Name")
+            if (stag == "IDtag"):
+                stag = sect.tag[:-4].lower() + "." + stag
+
+            data[stag] = np.frombuffer(vals, dtyp)
+
+    return data
+
+
+def case_17_(src_path, dst_path):
+
+#------------------------------------ ASCII exporters, exact
+
+    print("Saving case_17a.off/obj/vtk file.")
+
+    for mesh in meshes():
+        for save, text, fext in [
+                (jigsawpy.saveoff, textoff, ".off"),
+                (jigsawpy.savewav, textobj, ".obj"),
+                (jigsawpy.savevtk, textvtk, ".vtk")]:
+            name = os.path.join(dst_path, "case_17a" + fext)
+
+            with warnings.catch_warnings():
+                warnings.simplefilter("ignore")
+                save(name, mesh)
+
+            with open(name, "r") as fptr:
+                assert fptr.read().splitlines() == \
+                    text(name, mesh)
+
+    #-------------------------------- ...and loaded back in
+        for load, fext, cell in [
+                (jigsawpy.loadoff, ".off", ["tria3", "quad4"]),
+                (jigsawpy.loadwav, ".obj", ["edge2", "tria3",
+                                            "quad4"])]:
+            name = os.path.join(dst_path, "case_17a" + fext)
+
+            next = jigsawpy.jigsaw_msh_t()
+            load(name, next)
+
+            assert next.ndims == +3
+            assert np.array_equal(
+                next.vert3["coord"], points(mesh))
+
+            for field in cell:
+                assert np.array_equal(
+                    getattr(next, field)["index"],
+                    getattr(mesh, field)["index"])
+
+#------------------------------------ binary, xml, xml + zip
+
+    print("Saving case_17b.vtk/vtu/vtr file.")
+
+    for mesh in meshes() + [grid()]:
+        data = expected(mesh)
+
+        fext = ".vtr" if mesh.mshID.endswith("-grid") \
+            else ".vtu"
+
+        for kind, level, read, fext in [
+                ("binary", None, readbin, ".vtk"),
+                ("xml", None, readxml, fext),
+                ("xml", +1, readxml, fext)]:
+            name = os.path.join(dst_path, "case_17b" + fext)
+
+            jigsawpy.savevtk(
+                name, mesh, kind=kind, level=level)
+
+            test = read(name)
+
+            for stag, vals in data.items():
+                if (stag not in test):
+                    assert read is readbin and stag in [
+                        "connectivity", "offsets"] or \
+                        read is readxml and stag == "cells"
+                    continue
+
+                assert np.array_equal(test[stag], vals)
+
+#------------------------------------ *.pvd series + re-use
+
+    print("Saving case_17c.pvd file.")
+
+    save = sys.modules["jigsawpy.parse.savevtk"]
+
+    zips = save.zipdata; done = []
+
+    def count(*args):
+        done.append(args[1]); return zips(*args)
+
+    name = os.path.join(dst_path, "case_17c.pvd")
+
+    mesh = meshes()[1]
+    next = meshes()[1]
+    next.value = next.value * 2.        # same geometry
+    last = meshes()[1]
+    last.vert3["coord"] *= 2.           # new geometry
+
+    step = [(mesh, 7), (next, 3), (last, 7), (grid(), 4)]
+
+    save.zipdata = count
+    try:
+        with jigsawpy.pvd_writer(name, level=+1) as fout:
+            for inum, (item, ncall) in enumerate(step):
+                done.clear()
+
+                path = fout.write(item, time=.5 * inum)
+
+                assert len(done) == ncall
+
+                data = expected(item)
+                test = readxml(path)
+
+                for stag, vals in data.items():
+                    if (stag == "cells"): continue
+
+                    assert np.array_equal(test[stag], vals)
+
+    #-------------------------------- index valid at each step
+                root = ET.parse(name).getroot()
+
+                assert [(float(item.get("timestep")),
+                         item.get("file")) for item in
+                        root.iter("DataSet")] == [
+                    (.5 * ipos, "case_17c-%04u.vt%s" % (
+                        ipos, "r" if ipos == 3 else "u"))
+                    for ipos in range(inum + 1)]
+
+    finally:
+        save.zipdata = zips
+
+    assert not os.path.exists(name + ".part")
+
+    return
@@ -0,0 +1,203 @@
+"""
+* DEMO-18 --- load meshes from *.obj, *.off, *.ply and *.stl
+*   files, incl. binary PLY and STL formats.
+*
+* Checks each reader against small hand-written files, with
+* comments, quads, N-gons, and per-vertex/face extras, and
+* that compressed files and streams load alike.
+*
+"""
+
+import io
+import os
+import gzip
+import numpy as np
+import jigsawpy
+
+#------------------------------------ 5 points, 3 (N-)gons..
+COORD = np.array([
+    [0., 0., 0.], [1., 0., 0.], [1., 1., 0.],
+    [0., 1., 0.], [.5, 2., 0.]])
+
+FACES = [[0, 1, 2], [0, 1, 2, 3], [0, 1, 2, 3, 4]]
+
+#------------------------------------ ...N-gons as fan TRIA3
+TRIA3 = [[0, 1, 2], [0, 1, 2], [0, 2, 3], [0, 3, 4]]
+QUAD4 = [[0, 1, 2, 3]]
+
+
+def textobj():
+#------------------------------------ *.obj, w. v/vt/vn, etc
+    return (
+        "# case_18a.obj; by hand\n"
+        "mtllib none.mtl\n"
+        "v 0 0 0\nv 1 0 0\nv 1 1 0\n"
+        "v 0 1 0 1.0\n"                 # w is ignored
+        "v 0.5 2 0\n"
+        "vt 0 0\nvn 0 0 1\n"
+        "g faces\n"
+        "f 1/1/1 2/1/1 3/1/1\n"
+        "f 1//1 2//1 3//1 4//1\n"
+        "f -5 -4 -3 -2 -1\n"            # relative indices
+        "l 1 2 3\n").encode("ascii")
+
+
+def textoff():
+#------------------------------------ *.off, w. face colour
+    return (
+        "OFF\n"
+        "# case_18b.off; by hand\n"
+        "5 3 0\n\n"
+        "0 0 0\n1 0 0\n1 1 0\n"
+        "0 1 0  # trailing comment\n"
+        "0.5 2 0\n"
+        "3 0 1 2\n"
+        "4 0 1 2 3 255 0 0\n"
+        "5 0 1 2 3 4\n").encode("ascii")
+
+
+def dataply(kind, faces):
+#------------------------------------ *.ply, ascii or binary
+    head = (
+        "ply\n"
+        "format " + kind + " 1.0\n"
+        "comment case_18c.ply; by hand\n"
+        "element vertex 5\n"
+        "property float x\nproperty float y\n"
+        "property float z\nproperty uchar red\n"
+        "element face " + str(len(faces)) + "\n"
+        "property list uchar int vertex_indices\n"
+        "element edge 1\n"
+        "property int vertex1\nproperty int vertex2\n"
+        "end_header\n").encode("ascii")
+
+    if (kind == "ascii"):
+        return head + "".join(
+            ["%g %g %g 7\n" % tuple(xyz_) for xyz_ in COORD] +
+            ["%d " % len(face) + " ".join(map(str, face)) +
+             "\n" for face in faces] + ["1 2\n"]).encode("ascii")
+
+    endi = "<" if kind == "binary_little_endian" else ">"
+
+    vert = np.zeros(5, dtype=[
+        ("x", endi + "f4"), ("y", endi + "f4"),
+        ("z", endi + "f4"), ("red", "u1")])
+    vert["x"], vert["y"], vert["z"] = COORD.T
+
+    data = [head, vert.tobytes()]
+
+    for face in faces:
+        data.append(np.uint8(len(face)).tobytes())
+        data.append(np.asarray(face, endi + "i4").tobytes())
+
+    data.append(np.asarray([1, 2], endi + "i4").tobytes())
+
+    return b"".join(data)
+
+
+def datastl(kind, tria):
+#------------------------------------ *.stl, ascii or binary
+    if (kind == "ascii"):
+        return ("solid case_18d\n" + "".join(
+            "facet normal 0 0 1\n outer loop\n" + "".join(
+                "  vertex %g %g %g\n" % tuple(COORD[ipos])
+                for ipos in cell) +
+            " endloop\nendfacet\n" for cell in tria) +
+            "endsolid case_18d\n").encode("ascii")
+
+    data = np.zeros(len(tria), dtype=[
+        ("normal", "<f4", 3), ("coord", "<f4", (3, 3)),
+        ("attr", "<u2")])
+    data["normal"] = [0., 0., 1.]
+    data["coord"] = COORD[np.asarray(tria)]
+
+    return b"case_18d.stl; by hand".ljust(80) + \
+        np.uint32(len(tria)).tobytes() + data.tobytes()
+
+
+def loaded(load, name):
+#------------------------------------ LOAD*, as a function
+    mesh = jigsawpy.jigsaw_msh_t()
+    load(name, mesh)
+
+    return mesh
+
+
+def cells(mesh, field):
+#------------------------------------ cell index, as a list
+    data = getattr(mesh, field)
+
+    if (data is None): return []
+
+    return data["index"].tolist()
+
+
+def case_18_(src_path, dst_path):
+
+#------------------------------------ OBJ, OFF, PLY readers
+
+    print("Loading case_18a/b/c file.")
+
+    files = [
+        (jigsawpy.loadwav, "case_18a.obj", textobj(), True),
+        (jigsawpy.loadoff, "case_18b.off", textoff(), False)]
+
+    for kind in ["ascii", "binary_little_endian",
+                 "binary_big_endian"]:
+        files.append((
+            jigsawpy.loadply, "case_18c.ply",
+            dataply(kind, FACES), True))
+
+    for load, name, data, edge in files:
+        name = os.path.join(dst_path, name)
+
+        for item, byte in [
+                (name, data),
+                (name + ".gz", gzip.compress(data))]:
+            with open(item, "wb") as fptr:
+                fptr.write(byte)
+
+            for mesh in [
+                    loaded(load, item),
+                    loaded(load, io.BytesIO(byte))]:
+                assert mesh.ndims == +3
+                assert np.array_equal(mesh.vert3["coord"], COORD)
+
+                assert cells(mesh, "tria3") == TRIA3
+                assert cells(mesh, "quad4") == QUAD4
+
+                assert cells(mesh, "edge2") == (
+                    [[0, 1], [1, 2]] if load is jigsawpy.loadwav
+                    else [[1, 2]] if edge else [])
+
+#------------------------------------ PLY: uniform face list
+
+    for kind in ["ascii", "binary_little_endian",
+                 "binary_big_endian"]:
+        mesh = loaded(jigsawpy.loadply, io.BytesIO(
+            dataply(kind, [FACES[1]] * 3)))
+
+        assert cells(mesh, "tria3") == []
+        assert cells(mesh, "quad4") == QUAD4 * 3
+
+#------------------------------------ STL: facets -> welded
+
+    print("Loading case_18d file.")
+
+    tria = [[0, 1, 2], [0, 2, 3], [3, 2, 4]]
+
+    name = os.path.join(dst_path, "case_18d.stl")
+
+    for kind in ["ascii", "binary"]:
+        with open(name, "wb") as fptr:
+            fptr.write(datastl(kind, tria))
+
+        mesh = loaded(jigsawpy.loadstl, name)
+
+        assert mesh.vert3.size == +5    # shared verts merged
+
+        assert np.array_equal(
+            mesh.vert3["coord"][mesh.tria3["index"]],
+            COORD[np.asarray(tria)])
+
+    return
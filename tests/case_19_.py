@@ -0,0 +1,80 @@
+"""
+* DEMO-19 --- save meshes via background threads.
+*
+* Checks SAVEMSH_ASYNC against SAVEMSH, that MESH may be
+* modified as soon as the call returns, and that writes
+* complete in order, re-raising any errors.
+*
+"""
+
+import os
+import numpy as np
+import jigsawpy
+
+from tests.case_15_ import meshes, same, loaded
+
+
+def case_19_(src_path, dst_path):
+
+#------------------------------------ SAVEMSH_ASYNC: a copy
+
+    print("Saving case_19a.msh file.")
+
+    name = os.path.join(dst_path, "case_19a.msh")
+    test = os.path.join(dst_path, "case_19b.msh")
+
+    for base in meshes():
+        for kind in ["ascii", "binary"]:
+            jigsawpy.savemsh(name, base, kind=kind)
+
+            mesh = meshes()[base.mshID.endswith("-grid")]
+
+            done = jigsawpy.savemsh_async(test, mesh, kind=kind)
+
+            mesh.value[:] = -1.         # modify it at once..
+            mesh.slope = None
+
+            assert done.result() is None
+
+            same(loaded(test), base)
+
+            if (kind == "ascii"):
+                with open(name, "rb") as fptr:
+                    keep = fptr.read()
+                with open(test, "rb") as fptr:
+                    assert fptr.read() == keep.replace(
+                        b"case_19a.msh", b"case_19b.msh")
+
+#------------------------------------ in order, w. errors..
+
+    base = meshes()[0]
+
+    done = []; last = []
+    for inum in range(8):
+        base.value[:] = inum
+
+        next = jigsawpy.savemsh_async(name, base)
+        next.add_done_callback(
+            lambda _, inum=inum: last.append(inum))
+
+        done.append(next)
+
+    for next in done: next.result()
+
+    assert last == list(range(8))
+
+    assert np.all(loaded(name).value == 7.)
+
+    next = jigsawpy.savemsh_async(
+        os.path.join(dst_path, "none", "case_19c.msh"), base)
+
+    try:
+        next.result()
+
+    except OSError:
+        pass
+
+    else:
+        raise AssertionError("SAVEMSH_ASYNC: no error")
+
+    return
@@ -0,0 +1,115 @@
+"""
+* DEMO-20 --- find JIGSAW's executables and shared library.
+*
+* Checks that paths are searched for once and then cached,
+* misses included, that the JIGSAWPY_BIN and JIGSAWPY_LIB
+* env. variables override the search, and RESET.
+*
+"""
+
+import os
+import shutil
+import tempfile
+from pathlib import Path
+
+from jigsawpy import resolve
+
+
+def case_20_(src_path, dst_path):
+
+    print("Call resolve: case 20a.")
+
+    keep = {name: os.environ.get(name) for name in [
+        resolve.BINPATH, resolve.LIBPATH]}
+
+    which = resolve.shutil.which; done = []
+
+    def count(name, *args, **kwargs):
+        done.append(name); return which(name, *args, **kwargs)
+
+    resolve.shutil.which = count
+
+    path = tempfile.mkdtemp()
+    try:
+        for name in keep: os.environ.pop(name, None)
+
+        resolve.reset()
+
+    #-------------------------------- found once, then cached
+        jexe = resolve.findexe("jigsaw")
+
+        assert jexe.is_file()
+        assert resolve.findexe("jigsaw") is jexe
+
+        assert resolve.findexe("nonesuch") == Path()
+        assert resolve.findexe("nonesuch") == Path()
+
+        assert done.count("nonesuch") == 1  # misses cached
+
+        resolve.reset()
+
+        assert resolve.findexe("nonesuch") == Path()
+
+        assert done.count("nonesuch") == 2  # ...until RESET
+
+    #-------------------------------- JIGSAWPY_BIN: only here
+        os.environ[resolve.BINPATH] = path
+
+        assert resolve.findexe("jigsaw") == Path()
+
+        shutil.copy(str(jexe), path)
+
+        assert resolve.findexe("jigsaw") == Path()  # cached
+
+        resolve.reset()
+
+        assert resolve.findexe("jigsaw") == \
+            Path(path) / jexe.name
+
+        assert resolve.probe()["jigsaw"] == \
+            str(Path(path) / jexe.name)
+
+    #-------------------------------- JIGSAWPY_LIB: file, dir
+        os.environ.pop(resolve.BINPATH)
+
+        jlib = resolve.libfile(resolve.loadlib())
+
+        assert jlib is not None and os.path.isfile(jlib)
+
+        for root in [jlib, os.path.dirname(jlib)]:
+            os.environ[resolve.LIBPATH] = root
+
+            assert resolve.findlib() == Path(jlib)
+
+            assert resolve.libstamp().startswith(
+                os.path.realpath(jlib) + ";")
+
+        os.environ[resolve.LIBPATH] = path
+
+        assert resolve.findlib() == Path()
+
+        try:
+            resolve.loadlib()
+
+        except ValueError:
+            pass
+
+        else:
+            raise AssertionError("LOADLIB: no error")
+
+        assert resolve.probe()["libsaw"] is None
+
+    finally:
+        resolve.shutil.which = which
+
+        for name, data in keep.items():
+            if (data is None):
+                os.environ.pop(name, None)
+            else:
+                os.environ[name] = data
+
+        resolve.reset()
+
+        shutil.rmtree(path, ignore_errors=True)
+
+    return
@@ -0,0 +1,120 @@
+"""
+* DEMO-21 --- run JIGSAW jobs concurrently via ASYNCIO, with
+*   output streamed, timeouts and cancellation.
+*
+* These examples call to JIGSAW via its cmd.-line interface.
+*
+* Checks AIO.JIGSAW against JIGSAW.JIGSAW, and that jobs are
+* killed on timeout or cancellation.
+*
+"""
+
+import os
+import copy
+import asyncio
+import subprocess
+import numpy as np
+import jigsawpy
+
+from jigsawpy import aio
+
+
+def case_21_(src_path, dst_path):
+
+    opts = jigsawpy.jigsaw_jig_t()
+    geom = jigsawpy.jigsaw_msh_t()
+
+#------------------------------------ define JIGSAW geometry
+
+    geom.mshID = "euclidean-mesh"
+    geom.ndims = +2
+    geom.vert2 = np.array([
+        ((0, 0), 0), ((9, 0), 0),
+        ((9, 9), 0), ((0, 9), 0)],
+        dtype=geom.VERT2_t)
+
+    geom.edge2 = np.array([
+        ((0, 1), 0), ((1, 2), 0),
+        ((2, 3), 0), ((3, 0), 0)],
+        dtype=geom.EDGE2_t)
+
+    opts.geom_file = os.path.join(dst_path, "case_21a.msh")
+
+    jigsawpy.savemsh(opts.geom_file, geom)
+
+    opts.mesh_dims = +2
+    opts.verbosity = +0
+
+    jobs = []
+    for inum, hmax in enumerate([1.0, 0.5, 0.25]):
+        next = copy.copy(opts)
+        next.hfun_hmax = hmax
+        next.jcfg_file = os.path.join(
+            dst_path, "case_21b-%u.jig" % inum)
+        next.mesh_file = os.path.join(
+            dst_path, "case_21b-%u.msh" % inum)
+        jobs.append(next)
+
+    loop = asyncio.new_event_loop()
+    try:
+    #-------------------------------- concurrent == one-by-one
+        print("Call JIGSAW (aio): case 21a.")
+
+        mesh = [jigsawpy.jigsaw_msh_t() for _ in jobs]
+        line = [[] for _ in jobs]
+
+        async def many():
+            return await asyncio.gather(*[
+                aio.jigsaw(next, item, output=lines.append)
+                for next, item, lines in zip(jobs, mesh, line)])
+
+        text = loop.run_until_complete(many())
+
+        for inum, next in enumerate(jobs):
+            assert "".join(line[inum]) == text[inum]
+
+            base = jigsawpy.jigsaw_msh_t()
+            jigsawpy.cmd.jigsaw(next, base)
+
+            assert np.array_equal(mesh[inum].vert2, base.vert2)
+            assert np.array_equal(mesh[inum].tria3, base.tria3)
+
+    #-------------------------------- errors, timeout, cancel
+        next = copy.copy(jobs[0])
+        next.geom_file = opts.geom_file + ".none"
+
+        for item, fail in [
+                (aio.jigsaw(next), subprocess.CalledProcessError),
+                (aio.jigsaw(jobs[2], timeout=1.E-6),
+                 subprocess.TimeoutExpired),
+                (aio.jigsaw(geom), TypeError)]:
+            try:
+                loop.run_until_complete(item)
+
+            except fail:
+                pass
+
+            else:
+                raise AssertionError("AIO.JIGSAW: no error")
+
+        async def cancel():
+            task = loop.create_task(aio.jigsaw(jobs[2]))
+
+            await asyncio.sleep(+0)
+            task.cancel()
+
+            await task
+
+        try:
+            loop.run_until_complete(cancel())
+
+        except asyncio.CancelledError:
+            pass
+
+        else:
+            raise AssertionError("AIO.JIGSAW: not cancelled")
+
+    finally:
+        loop.close()
+
+    return
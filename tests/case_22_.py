@@ -0,0 +1,96 @@
+"""
+* DEMO-22 --- improve mesh topology via JITTER, stopping early
+*   once the no. of irregular nodes stops improving.
+*
+* These examples call to JIGSAW via its cmd.-line and its
+* api.-lib. interfaces.
+*
+* Checks the per-iteration STAT returned, and that RTOL and
+* SPAN bound the no. of iterations run.
+*
+"""
+
+import os
+import numpy as np
+import jigsawpy
+
+from jigsawpy.jigsaw import jitter, jitstat
+
+
+def case_22_(src_path, dst_path):
+
+    opts = jigsawpy.jigsaw_jig_t()
+    geom = jigsawpy.jigsaw_msh_t()
+
+#------------------------------------ define JIGSAW geometry
+
+    geom.mshID = "euclidean-mesh"
+    geom.ndims = +2
+    geom.vert2 = np.array([
+        ((0, 0), 0), ((9, 0), 0),
+        ((9, 9), 0), ((0, 9), 0)],
+        dtype=geom.VERT2_t)
+
+    geom.edge2 = np.array([
+        ((0, 1), 0), ((1, 2), 0),
+        ((2, 3), 0), ((3, 0), 0)],
+        dtype=geom.EDGE2_t)
+
+    opts.geom_file = os.path.join(dst_path, "case_22a.msh")
+    opts.jcfg_file = os.path.join(dst_path, "case_22b.jig")
+    opts.mesh_file = os.path.join(dst_path, "case_22b.msh")
+
+    jigsawpy.savemsh(opts.geom_file, geom)
+
+    opts.hfun_hmax = 0.10
+    opts.mesh_dims = +2
+    opts.verbosity = +0
+
+    for kind, args in [
+            ("JIGSAW", {}), ("libJIGSAW", {"geom": geom})]:
+
+        print("Call " + kind + ": case 22a.")
+
+    #-------------------------------- RTOL=None: all IMAX run
+        mesh = jigsawpy.jigsaw_msh_t()
+        stat = jitter(opts, 3, 3, mesh, **args)
+
+        assert len(stat) == +3
+        assert all(list(item) == ["time"] for item in stat)
+
+    #-------------------------------- no gain: SPAN + 1 iter.
+        for span in [1, 2]:
+            mesh = jigsawpy.jigsaw_msh_t()
+            stat = jitter(opts, 8, 3, mesh, rtol=1.E+9,
+                          span=span, **args)
+
+            assert len(stat) == span + 1
+
+            for item in stat:
+                assert item["time"] >= +0.
+                assert item["nbad"] >= +0
+                assert +0. < item["cost"] <= +1.
+
+            nbad, cost = jitstat(mesh)
+
+            assert stat[-1]["nbad"] == nbad
+            assert stat[-1]["cost"] == cost
+
+    #-------------------------------- RTOL=0: <= IMAX iter.
+        mesh = jigsawpy.jigsaw_msh_t()
+        stat = jitter(opts, 6, 3, mesh, rtol=+0., **args)
+
+        assert +1 <= len(stat) <= +6
+
+    for item in [dict(rtol=-.1), dict(span=0)]:
+        try:
+            jitter(opts, 3, 3, rtol=item.get("rtol", .01),
+                   span=item.get("span", 4))
+
+        except ValueError:
+            pass
+
+        else:
+            raise AssertionError("JITTER: no error")
+
+    return
@@ -0,0 +1,118 @@
+"""
+* DEMO-9 --- load an ensemble of meshes concurrently, via a
+*   pool of worker processes and shared memory.
+*
+* Checks LOADMSH_MANY against LOADMSH, for text and binary
+* *.msh files, and that shared memory is never leaked.
+*
+"""
+
+import os
+import numpy as np
+import jigsawpy
+
+from jigsawpy.loadmsh import sharemsh
+
+
+def shmem():
+#------------------------------------ shared memory blocks?
+    if (not os.path.isdir("/dev/shm")): return set()
+
+    return set(os.listdir("/dev/shm"))
+
+
+def case_9_(src_path, dst_path):
+
+    name = [os.path.join(src_path, item) for item in [
+        "airfoil.msh", "lakes.msh", "piece.msh", "wheel.msh"]]
+
+#------------------------------------ add a binary msh. too!
+
+    mesh = jigsawpy.jigsaw_msh_t()
+    jigsawpy.loadmsh(name[0], mesh)
+
+    name.append(os.path.join(dst_path, "case_9a.msh"))
+    jigsawpy.savemsh(name[-1], mesh, kind="binary")
+
+    print("Call loadmsh_many: case 9a.")
+
+    have = shmem()
+
+    many = jigsawpy.loadmsh_many(name, workers=2)
+
+    assert len(many) == len(name)
+
+    assert shmem() == have      # no shared memory leaked
+
+    for item, next in zip(name, many):
+        mesh = jigsawpy.jigsaw_msh_t()
+        jigsawpy.loadmsh(item, mesh)
+
+        assert next.mshID == mesh.mshID
+        assert next.ndims == mesh.ndims
+
+        for field in jigsawpy.msh_b.FIELD:
+            data = getattr(mesh, field, None)
+            test = getattr(next, field, None)
+
+            if (data is None):
+                assert test is None
+            else:
+                assert np.array_equal(data, test)
+
+#------------------------------------ no leaks on ENOSPC..
+
+    try:
+        from multiprocessing import shared_memory
+
+    except ImportError:
+        shared_memory = None            # python < 3.8
+
+    if (shared_memory is not None):
+        make = shared_memory.SharedMemory
+        done = []
+
+        def full(*args, **kwargs):
+            if (len(done) == +1):
+                raise OSError(28, "No space left on device")
+
+            done.append(make(*args, **kwargs))
+
+            return done[-1]
+
+        mesh = jigsawpy.jigsaw_msh_t()
+        jigsawpy.loadmsh(name[0], mesh)
+
+        shared_memory.SharedMemory = full
+        try:
+            sharemsh(mesh)
+
+        except OSError:
+            pass
+
+        else:
+            raise AssertionError("SHAREMSH: no error")
+
+        finally:
+            shared_memory.SharedMemory = make
+
+        assert len(done) == 1
+        assert shmem() == have
+
+        assert mesh.point is not None   # left unchanged
+
+#------------------------------------ errors are re-raised
+
+    try:
+        jigsawpy.loadmsh_many(
+            name[:2] + [name[0] + ".none"], workers=2)
+
+    except OSError:
+        pass
+
+    else:
+        raise AssertionError("LOADMSH_MANY: no error")
+
+    assert shmem() == have
+
+    return